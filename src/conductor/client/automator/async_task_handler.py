@@ -0,0 +1,168 @@
+import asyncio
+import importlib
+import logging
+import signal
+import threading
+from multiprocessing import Process, freeze_support
+from typing import List
+
+from conductor.client.automator.async_task_runner import AsyncTaskRunner, DEFAULT_CONCURRENCY
+from conductor.client.automator.task_handler import _create_annotated_workers, _setup_logging_queue
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.configuration.settings.metrics_settings import MetricsSettings
+from conductor.client.telemetry.metrics_collector import MetricsCollector
+from conductor.client.worker.worker_interface import WorkerInterface
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+# time left to the worker process to exit after its own shutdown timeout, before it is killed
+_SHUTDOWN_MARGIN_SECONDS = 1
+
+
+class AsyncTaskHandler:
+    """
+    Asyncio based alternative to `TaskHandler`.
+
+    Instead of one process per worker, all the workers are run by a single process on one event loop, with up to
+    `concurrency` tasks in flight per worker.  Best suited for I/O bound workers written as `async def` functions.
+    """
+
+    def __init__(
+            self,
+            workers: List[WorkerInterface] = None,
+            configuration: Configuration = None,
+            metrics_settings: MetricsSettings = None,
+            scan_for_annotated_workers: bool = True,
+            import_modules: List[str] = None,
+            concurrency: int = DEFAULT_CONCURRENCY
+    ):
+        self.logger_process, self.queue = _setup_logging_queue(configuration)
+        self.__configuration = configuration if configuration is not None else Configuration()
+        self.__stop_requested = False
+
+        # imports
+        importlib.import_module('conductor.client.http.models.task')
+        importlib.import_module('conductor.client.worker.worker_task')
+        if import_modules is not None:
+            for module in import_modules:
+                logger.info(f'loading module {module}')
+                importlib.import_module(module)
+
+        if workers is None:
+            workers = []
+        elif not isinstance(workers, list):
+            workers = [workers]
+        else:
+            workers = list(workers)
+        if scan_for_annotated_workers is True:
+            workers.extend(_create_annotated_workers())
+
+        self.task_runners = [
+            AsyncTaskRunner(worker, configuration, metrics_settings, concurrency) for worker in workers
+        ]
+        self.task_runner_process = Process(target=_run_task_runners, args=(self.task_runners,))
+        self.metrics_provider_process = None
+        if metrics_settings is not None:
+            self.metrics_provider_process = Process(
+                target=MetricsCollector.provide_metrics,
+                args=(metrics_settings,)
+            )
+        logger.info('AsyncTaskHandler initialized')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop_processes()
+
+    def start_processes(self) -> None:
+        logger.info('Starting worker processes...')
+        freeze_support()
+        self.task_runner_process.start()
+        logger.info(f'Started {len(self.task_runners)} AsyncTaskRunner in process {self.task_runner_process.pid}')
+        if self.metrics_provider_process is not None:
+            self.metrics_provider_process.start()
+            logger.info('Started MetricsProvider process')
+
+    def join_processes(self) -> None:
+        """
+        Waits until the worker process stops.  On SIGTERM, the worker process is stopped gracefully, see
+        `stop_processes`.
+        """
+        previous_handler = None
+        if threading.current_thread() is threading.main_thread():
+            previous_handler = signal.signal(signal.SIGTERM, self.__stop_on_signal)
+        try:
+            while self.task_runner_process.is_alive() and not self.__stop_requested:
+                self.task_runner_process.join(_SHUTDOWN_MARGIN_SECONDS)
+            if self.__stop_requested:
+                self.stop_processes()
+            self.task_runner_process.join()
+            if self.metrics_provider_process is not None:
+                self.metrics_provider_process.join()
+            logger.info('Joined all processes')
+        except KeyboardInterrupt:
+            logger.info('KeyboardInterrupt: Stopping all processes')
+            self.stop_processes()
+        finally:
+            if previous_handler is not None:
+                signal.signal(signal.SIGTERM, previous_handler)
+
+    def stop_processes(self) -> None:
+        """
+        Sends SIGTERM to the worker process, which stops polling, finishes its in-flight tasks and sends the results,
+        and kills it when still running after `Configuration.shutdown_timeout_seconds`.
+        """
+        self.__stop_task_runner_process()
+        self.__stop_process(self.metrics_provider_process)
+        logger.info('Stopped worker processes...')
+        self.queue.put(None)
+        self.logger_process.terminate()
+
+    def __stop_on_signal(self, signum, frame) -> None:
+        logger.info(f'Received signal {signum}: Stopping all processes')
+        self.__stop_requested = True
+
+    def __stop_task_runner_process(self) -> None:
+        process = self.task_runner_process
+        if process.pid is None:
+            return
+        self.__stop_process(process)
+        process.join(self.__configuration.shutdown_timeout_seconds + _SHUTDOWN_MARGIN_SECONDS)
+        if process.is_alive():
+            logger.warning(f'AsyncTaskRunner process {process.pid} did not stop in time, killing it')
+            process.kill()
+            process.join()
+
+    def __stop_process(self, process: Process):
+        if process is None or process.pid is None:
+            return
+        try:
+            logger.debug(f'Terminating process: {process.pid}')
+            process.terminate()
+        except Exception as e:
+            logger.debug(f'Failed to terminate process: {process.pid}, reason: {e}')
+            process.kill()
+            logger.debug(f'Killed process: {process.pid}')
+
+
+def _run_task_runners(task_runners: List[AsyncTaskRunner]) -> None:
+    """
+    Runs the task runners on one event loop, until they are drained on SIGTERM.
+    """
+
+    def drain_on_signal() -> None:
+        logger.info(f'Received signal {signal.SIGTERM}, finishing the in-flight tasks before exiting')
+        for task_runner in task_runners:
+            task_runner.drain()
+
+    async def run_all():
+        loop = asyncio.get_event_loop()
+        loop.add_signal_handler(signal.SIGTERM, drain_on_signal)
+        await asyncio.gather(*[task_runner.run() for task_runner in task_runners])
+
+    asyncio.run(run_all())
@@ -0,0 +1,392 @@
+import asyncio
+import functools
+import logging
+import sys
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from conductor.client.automator.poll_scheduler import PollScheduler
+from conductor.client.automator.task_result_sender import get_retry_delay
+from conductor.client.automator.task_runner import get_polling_interval_from_env, set_worker_properties_from_env
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.configuration.settings.metrics_settings import MetricsSettings
+from conductor.client.http.api.task_resource_api import TaskResourceApi
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models.task import Task
+from conductor.client.http.models.task_exec_log import TaskExecLog
+from conductor.client.http.models.task_result import TaskResult
+from conductor.client.http.rest import AuthorizationException
+from conductor.client.telemetry.metrics_collector import MetricsCollector, get_task_queue_wait_time
+from conductor.client.worker.worker_interface import WorkerInterface
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+DEFAULT_CONCURRENCY = 10
+
+
+class AsyncTaskRunner:
+    """
+    Runs a worker on an asyncio event loop.
+
+    Up to `concurrency` tasks are executed at the same time.  Coroutine functions are awaited on the loop, while
+    synchronous workers and the blocking HTTP calls to the server are run on a thread pool of the runner, sized to
+    `concurrency`, so polling, execution and updates never block the event loop.  Each task type of the worker is
+    polled on its own schedule, like with TaskRunner.
+    """
+
+    def __init__(
+            self,
+            worker: WorkerInterface,
+            configuration: Configuration = None,
+            metrics_settings: MetricsSettings = None,
+            concurrency: int = DEFAULT_CONCURRENCY
+    ):
+        if not isinstance(worker, WorkerInterface):
+            raise Exception('Invalid worker')
+        self.worker = worker
+        set_worker_properties_from_env(self.worker)
+        if not isinstance(configuration, Configuration):
+            configuration = Configuration()
+        self.configuration = configuration
+        self.concurrency = concurrency if concurrency else DEFAULT_CONCURRENCY
+        self.metrics_collector = None
+        if metrics_settings is not None:
+            self.metrics_collector = MetricsCollector(
+                metrics_settings
+            )
+        self.task_client = TaskResourceApi(
+            ApiClient(
+                configuration=self.configuration,
+                metrics_collector=self.metrics_collector
+            )
+        )
+        self._in_flight_tasks = set()
+        # Each task type of the worker is polled on its own schedule
+        self._poll_schedulers = {}
+        self._next_poll_times = {}
+        self._polling_intervals = {}
+        for task_definition_name in self.worker.task_definition_names:
+            self._poll_schedulers[task_definition_name] = PollScheduler()
+            self._next_poll_times[task_definition_name] = 0
+            self._polling_intervals[task_definition_name] = get_polling_interval_from_env(task_definition_name)
+        self.draining = False
+        # set when draining, created on the event loop
+        self._draining_event = None
+        self._executor = None
+
+    async def run(self) -> None:
+        if self.configuration is not None:
+            self.configuration.apply_logging_config()
+        else:
+            logger.setLevel(logging.DEBUG)
+
+        task_names = ','.join(self.worker.task_definition_names)
+        logger.info(f'Polling task {task_names} with domain {self.worker.get_domain()} with polling '
+                    f'interval {self.worker.get_polling_interval_in_seconds()} and concurrency {self.concurrency}')
+
+        self._draining_event = asyncio.Event()
+        if self.draining:
+            self._draining_event.set()
+        try:
+            while not self.draining:
+                try:
+                    await self.run_once()
+                except Exception as e:
+                    pass
+        finally:
+            await self.__finish_in_flight_tasks()
+
+    def drain(self) -> None:
+        """
+        Stops polling.  `run` returns once the tasks already polled have been executed and their results sent, or
+        after `Configuration.shutdown_timeout_seconds`.  Must be called from the event loop.
+        """
+        self.draining = True
+        if self._draining_event is not None:
+            self._draining_event.set()
+
+    async def __finish_in_flight_tasks(self) -> None:
+        if len(self._in_flight_tasks) > 0:
+            logger.info(f'Waiting for {len(self._in_flight_tasks)} in-flight tasks to finish')
+            _, pending = await asyncio.wait(
+                list(self._in_flight_tasks), timeout=self.configuration.shutdown_timeout_seconds
+            )
+            if len(pending) > 0:
+                logger.warning(f'{len(pending)} in-flight tasks did not finish in time')
+                for execution in pending:
+                    execution.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def run_once(self) -> None:
+        task_definition_names = self.__get_task_definition_names_to_poll()
+        for task_definition_name in task_definition_names:
+            await self.__poll_and_dispatch_tasks(task_definition_name)
+        await self.__wait_for_polling_interval(task_definition_names)
+        self.worker.clear_task_definition_name_cache()
+
+    def __get_task_definition_names_to_poll(self) -> List[str]:
+        """
+        All the task types of the worker that are due to be polled, starting with a different one every cycle.
+        """
+        task_definition_names = self.worker.task_definition_names
+        first_task_definition_name = self.worker.get_task_definition_name()
+        if first_task_definition_name in task_definition_names:
+            first_index = task_definition_names.index(first_task_definition_name)
+            task_definition_names = task_definition_names[first_index:] + task_definition_names[:first_index]
+        now = time.time()
+        return [
+            task_definition_name for task_definition_name in task_definition_names
+            if self._next_poll_times.get(task_definition_name, 0) <= now
+        ]
+
+    async def __poll_and_dispatch_tasks(self, task_definition_name: str) -> None:
+        poll_scheduler = self.__get_poll_scheduler(task_definition_name)
+        available_slots = self.concurrency - len(self._in_flight_tasks)
+        if available_slots <= 0:
+            poll_scheduler.record_skipped_poll()
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_execution_queue_full(task_definition_name)
+            return
+        count = available_slots
+        if self.worker.batch_size:
+            count = min(self.worker.batch_size, available_slots)
+        tasks = await self.__poll_tasks(count, task_definition_name)
+        received_time = time.time()
+        poll_scheduler.record_poll(len(tasks))
+        for task in tasks:
+            if task is not None and task.task_id is not None:
+                self.__record_task_queue_wait_time(task, task_definition_name)
+                execution = asyncio.ensure_future(
+                    self.__execute_and_update_task(task, task_definition_name, received_time)
+                )
+                self._in_flight_tasks.add(execution)
+                execution.add_done_callback(self._in_flight_tasks.discard)
+
+    async def __execute_and_update_task(self, task: Task, task_definition_name: str,
+                                        received_time: float = None) -> None:
+        task_result = await self.__execute_task(task, task_definition_name)
+        response = await self.__update_task(task_result, task_definition_name)
+        if response is not None and received_time is not None and self.metrics_collector is not None:
+            total_time = time.time() - received_time + (get_task_queue_wait_time(task) or 0)
+            self.metrics_collector.record_task_total_time(task_definition_name, total_time, self.worker.get_domain())
+
+    def __record_task_queue_wait_time(self, task: Task, task_definition_name: str) -> None:
+        if self.metrics_collector is None:
+            return
+        queue_wait_time = get_task_queue_wait_time(task)
+        if queue_wait_time is not None:
+            self.metrics_collector.record_task_queue_wait_time(
+                task_definition_name, queue_wait_time, self.worker.get_domain()
+            )
+
+    async def __poll_tasks(self, count: int, task_definition_name: str) -> List[Task]:
+        if self.worker.paused():
+            logger.debug(f'Stop polling task for: {task_definition_name}')
+            return []
+        if self.metrics_collector is not None:
+            self.metrics_collector.increment_task_poll(
+                task_definition_name
+            )
+
+        try:
+            start_time = time.time()
+            domain = self.worker.get_domain()
+            params = {
+                'workerid': self.worker.get_identity(),
+                'count': count,
+                'timeout': self.worker.get_poll_timeout_in_millis()
+            }
+            if domain is not None:
+                params['domain'] = domain
+            tasks = await self.__run_in_executor(self.task_client.batch_poll, tasktype=task_definition_name, **params)
+            finish_time = time.time()
+            time_spent = finish_time - start_time
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_task_poll_time(task_definition_name, time_spent, domain)
+        except AuthorizationException as auth_exception:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_poll_error(task_definition_name, type(auth_exception))
+            if auth_exception.invalid_token:
+                logger.fatal(f'failed to poll task {task_definition_name} due to invalid auth token')
+            else:
+                logger.fatal(f'failed to poll task {task_definition_name} error: {auth_exception.status} - {auth_exception.error_code}')
+            return []
+        except Exception as e:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_poll_error(task_definition_name, type(e))
+            logger.error(
+                f'Failed to poll task for: {task_definition_name}, reason: {traceback.format_exc()}'
+            )
+            return []
+        if tasks is None:
+            return []
+        if len(tasks) > 0:
+            logger.debug(
+                f'Polled {len(tasks)} tasks: {task_definition_name}, worker_id: {self.worker.get_identity()}, domain: {self.worker.get_domain()}')
+        return tasks
+
+    async def __execute_task(self, task: Task, task_definition_name: str) -> TaskResult:
+        if not isinstance(task, Task):
+            return None
+        logger.debug(
+            'Executing task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, task_definition_name: {task_definition_name}'.format(
+                task_id=task.task_id,
+                workflow_instance_id=task.workflow_instance_id,
+                task_definition_name=task_definition_name
+            )
+        )
+        try:
+            start_time = time.time()
+            task_result = await self.worker.execute_async(task, executor=self.__get_executor())
+            finish_time = time.time()
+            time_spent = finish_time - start_time
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_task_execute_time(
+                    task_definition_name,
+                    time_spent,
+                    self.worker.get_domain()
+                )
+                self.metrics_collector.record_task_result_payload_size(
+                    task_definition_name,
+                    sys.getsizeof(task_result)
+                )
+            logger.debug(
+                'Executed task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, task_definition_name: {task_definition_name}'.format(
+                    task_id=task.task_id,
+                    workflow_instance_id=task.workflow_instance_id,
+                    task_definition_name=task_definition_name
+                )
+            )
+        except Exception as e:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_execution_error(
+                    task_definition_name, type(e)
+                )
+            task_result = TaskResult(
+                task_id=task.task_id,
+                workflow_instance_id=task.workflow_instance_id,
+                worker_id=self.worker.get_identity()
+            )
+            task_result.status = 'FAILED'
+            task_result.reason_for_incompletion = str(e)
+            task_result.logs = [TaskExecLog(
+                traceback.format_exc(), task_result.task_id, int(time.time()))]
+            logger.error(
+                'Failed to execute task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, task_definition_name: {task_definition_name}, reason: {reason}'.format(
+                    task_id=task.task_id,
+                    workflow_instance_id=task.workflow_instance_id,
+                    task_definition_name=task_definition_name,
+                    reason=traceback.format_exc()
+                )
+            )
+        return task_result
+
+    async def __update_task(self, task_result: TaskResult, task_definition_name: str):
+        if not isinstance(task_result, TaskResult):
+            return None
+        logger.debug(
+            'Updating task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, task_definition_name: {task_definition_name}'.format(
+                task_id=task_result.task_id,
+                workflow_instance_id=task_result.workflow_instance_id,
+                task_definition_name=task_definition_name
+            )
+        )
+        for attempt in range(self.configuration.task_update_retry_count + 1):
+            if attempt > 0:
+                if self.metrics_collector is not None:
+                    self.metrics_collector.increment_task_update_retry(task_definition_name)
+                # without blocking the other executions
+                await asyncio.sleep(get_retry_delay(
+                    attempt,
+                    self.configuration.task_update_backoff_seconds,
+                    self.configuration.task_update_max_backoff_seconds
+                ))
+            try:
+                start_time = time.time()
+                response = await self.__run_in_executor(self.task_client.update_task, body=task_result)
+                if self.metrics_collector is not None:
+                    self.metrics_collector.record_task_update_time(
+                        task_definition_name, time.time() - start_time, self.worker.get_domain()
+                    )
+                logger.debug(
+                    'Updated task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, task_definition_name: {task_definition_name}, response: {response}'.format(
+                        task_id=task_result.task_id,
+                        workflow_instance_id=task_result.workflow_instance_id,
+                        task_definition_name=task_definition_name,
+                        response=response
+                    )
+                )
+                return response
+            except Exception as e:
+                if self.metrics_collector is not None:
+                    self.metrics_collector.increment_task_update_error(
+                        task_definition_name, type(e)
+                    )
+                logger.error(
+                    'Failed to update task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, '
+                    'task_definition_name: {task_definition_name}, reason: {reason}'.format(
+                        task_id=task_result.task_id,
+                        workflow_instance_id=task_result.workflow_instance_id,
+                        task_definition_name=task_definition_name,
+                        reason=traceback.format_exc()
+                    )
+                )
+        return None
+
+    async def __wait_for_polling_interval(self, polled_task_definition_names: List[str]) -> None:
+        """
+        Schedules the next poll of the task types polled in this cycle, and waits until the next poll of any type.
+        """
+        now = time.time()
+        wait_times = []
+        for task_definition_name in polled_task_definition_names:
+            wait_time = self.__get_poll_scheduler(task_definition_name).get_wait_time(
+                self.__get_polling_interval_in_seconds(task_definition_name),
+                self.worker.get_max_polling_interval_in_seconds(),
+                self.worker.get_poll_jitter()
+            )
+            self._next_poll_times[task_definition_name] = now + wait_time
+            wait_times.append(wait_time)
+        for task_definition_name, next_poll_time in self._next_poll_times.items():
+            if task_definition_name not in polled_task_definition_names:
+                wait_times.append(next_poll_time - now)
+        polling_interval = max(0, min(wait_times)) if len(wait_times) > 0 else 0
+        if self._draining_event is None:
+            await asyncio.sleep(polling_interval)
+            return
+        try:
+            # woken up when draining
+            await asyncio.wait_for(self._draining_event.wait(), polling_interval)
+        except asyncio.TimeoutError:
+            pass
+
+    def __get_poll_scheduler(self, task_definition_name: str) -> PollScheduler:
+        if task_definition_name not in self._poll_schedulers:
+            self._poll_schedulers[task_definition_name] = PollScheduler()
+        return self._poll_schedulers[task_definition_name]
+
+    def __get_polling_interval_in_seconds(self, task_definition_name: str) -> float:
+        polling_interval = self._polling_intervals.get(task_definition_name)
+        if polling_interval is None:
+            return self.worker.get_polling_interval_in_seconds()
+        return polling_interval / 1000
+
+    def __get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            # the executions or updates of up to `concurrency` tasks, and a poll
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.concurrency + 1, thread_name_prefix=f'{self.worker.get_task_definition_name()}-io'
+            )
+        return self._executor
+
+    async def __run_in_executor(self, function, *args, **kwargs):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.__get_executor(), functools.partial(function, *args, **kwargs))
@@ -0,0 +1,86 @@
+import abc
+import os
+import uuid
+from enum import Enum
+from typing import Any, Dict
+
+from conductor.client.http import json_codec
+from conductor.client.http.api.task_resource_api import TaskResourceApi
+
+
+class PayloadOperation(str, Enum):
+    READ = "READ"
+    WRITE = "WRITE"
+
+
+class PayloadType(str, Enum):
+    TASK_INPUT = "TASK_INPUT"
+    TASK_OUTPUT = "TASK_OUTPUT"
+    WORKFLOW_INPUT = "WORKFLOW_INPUT"
+    WORKFLOW_OUTPUT = "WORKFLOW_OUTPUT"
+
+
+class ExternalPayloadStorage(abc.ABC):
+    """
+    Stores the payloads too large to be sent inline in the task updates, and retrieves the ones the server stored.
+    """
+
+    @abc.abstractmethod
+    def download(self, path: str, payload_type: PayloadType) -> Dict[str, Any]:
+        """
+        :param path: the path of the payload, e.g. `Task.external_input_payload_storage_path`
+        :return: the payload
+        """
+        pass
+
+    @abc.abstractmethod
+    def upload(self, payload: bytes, payload_type: PayloadType) -> str:
+        """
+        :param payload: the payload, encoded to JSON
+        :return: the path of the payload, e.g. for `TaskResult.external_output_payload_storage_path`
+        """
+        pass
+
+
+class ServerExternalPayloadStorage(ExternalPayloadStorage):
+    """
+    The external payload storage configured on the server, accessed through the locations, e.g. presigned S3 URLs,
+    that the server hands out.
+    """
+
+    def __init__(self, task_client: TaskResourceApi):
+        self.task_client = task_client
+
+    def download(self, path: str, payload_type: PayloadType) -> Dict[str, Any]:
+        location = self.task_client.get_external_storage_location1(path, PayloadOperation.READ.value, payload_type.value)
+        response = self.task_client.api_client.rest_client.GET(location.uri)
+        return json_codec.loads(response.resp.content)
+
+    def upload(self, payload: bytes, payload_type: PayloadType) -> str:
+        location = self.task_client.get_external_storage_location1('', PayloadOperation.WRITE.value, payload_type.value)
+        self.task_client.api_client.rest_client.PUT(location.uri, body=payload)
+        return location.path
+
+
+class LocalFileSystemPayloadStorage(ExternalPayloadStorage):
+    """
+    Stores the payloads as JSON files in a local directory, for tests and local development against a server storing
+    its payloads in the same directory.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def download(self, path: str, payload_type: PayloadType) -> Dict[str, Any]:
+        with open(os.path.join(self.directory, path), 'rb') as file:
+            return json_codec.loads(file.read())
+
+    def upload(self, payload: bytes, payload_type: PayloadType) -> str:
+        path = f'{uuid.uuid4()}.json'
+        # written under a temporary name, so that no partial payload is ever read
+        temporary_path = os.path.join(self.directory, f'.{path}.tmp')
+        with open(temporary_path, 'wb') as file:
+            file.write(payload)
+        os.replace(temporary_path, os.path.join(self.directory, path))
+        return path
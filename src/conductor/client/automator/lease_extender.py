@@ -0,0 +1,109 @@
+import heapq
+import logging
+import threading
+import time
+import traceback
+from typing import Any, Callable, Optional
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.models.task import Task
+from conductor.client.http.models.task_result import TaskResult
+from conductor.client.http.models.task_result_status import TaskResultStatus
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+# the lease of a task is extended once this fraction of its response timeout has elapsed
+LEASE_EXTENSION_FRACTION = 0.8
+
+
+def get_lease_extension_interval(task: Task) -> Optional[float]:
+    """
+    :return: the time in seconds between two extensions of the lease of the task, None when it has no response timeout
+    """
+    if not task.response_timeout_seconds or task.response_timeout_seconds <= 0:
+        return None
+    return task.response_timeout_seconds * LEASE_EXTENSION_FRACTION
+
+
+class LeaseExtender:
+    """
+    Extends the lease of the tasks being executed, from a background thread, so that long tasks are not timed out by
+    the server while their response timeout can stay short enough to detect crashed workers quickly.
+    """
+
+    def __init__(self, update_task: Callable[[TaskResult], Any], worker_id: str):
+        self.update_task = update_task
+        self.worker_id = worker_id
+        # (next extension time, task id) of the tasks being executed
+        self._schedule = []
+        self._tasks = {}
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def start(self, task: Task) -> bool:
+        """
+        :return: True if the lease of the task is extended until `stop` is called, False if it has no response timeout
+        """
+        interval = get_lease_extension_interval(task)
+        if interval is None:
+            return False
+        with self._condition:
+            self.__start_thread()
+            self._tasks[task.task_id] = (task, interval)
+            heapq.heappush(self._schedule, (time.time() + interval, task.task_id))
+            self._condition.notify()
+        return True
+
+    def stop(self, task: Task) -> None:
+        """
+        No extension of the lease of the task is started after it returns.  An extension already in flight may still
+        reach the server after the result of the task, which then ignores it as the task is no longer in progress.
+        """
+        with self._condition:
+            self._tasks.pop(task.task_id, None)
+
+    def __start_thread(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.__run, name='lease-extender', daemon=True)
+            self._thread.start()
+
+    def __run(self) -> None:
+        while True:
+            with self._condition:
+                while len(self._schedule) == 0 or self._schedule[0][0] > time.time():
+                    # drop the tasks stopped meanwhile
+                    while len(self._schedule) > 0 and self._schedule[0][1] not in self._tasks:
+                        heapq.heappop(self._schedule)
+                    timeout = None if len(self._schedule) == 0 else self._schedule[0][0] - time.time()
+                    if timeout is None or timeout > 0:
+                        self._condition.wait(timeout)
+                _, task_id = heapq.heappop(self._schedule)
+            self.__extend_lease(task_id)
+
+    def __extend_lease(self, task_id: str) -> None:
+        with self._condition:
+            if task_id not in self._tasks:
+                return
+            task, interval = self._tasks[task_id]
+            heapq.heappush(self._schedule, (time.time() + interval, task_id))
+        task_result = TaskResult(
+            task_id=task.task_id,
+            workflow_instance_id=task.workflow_instance_id,
+            worker_id=self.worker_id,
+            status=TaskResultStatus.IN_PROGRESS,
+            extend_lease=True
+        )
+        # the lock is not held during the request, so that the tasks completing meanwhile are not delayed
+        try:
+            self.update_task(task_result)
+        except Exception:
+            with self._condition:
+                stopped = task_id not in self._tasks
+            if not stopped:
+                logger.warning(f'Failed to extend the lease of task {task_id}, reason: {traceback.format_exc()}')
+            return
+        logger.debug(f'Extended the lease of task {task_id}')
@@ -0,0 +1,53 @@
+import random
+
+# caps the exponent, the wait time is bounded by the maximum polling interval long before
+_MAX_BACKOFF_EXPONENT = 30
+
+
+class PollScheduler:
+    """
+    Decides how long a task runner waits before its next poll.
+
+    Without a maximum polling interval the worker's polling interval is always used.  With one, polling is adaptive:
+    the server is polled again right away while tasks keep arriving, and the wait is doubled after every consecutive
+    empty poll, starting from the polling interval, up to the maximum.
+
+    The optional jitter randomizes each wait by up to that fraction of it, so that many workers started together
+    don't keep polling in lockstep.
+    """
+
+    def __init__(self):
+        self._consecutive_empty_polls = 0
+        self._last_poll_had_tasks = False
+
+    def record_poll(self, task_count: int) -> None:
+        if task_count > 0:
+            self._consecutive_empty_polls = 0
+            self._last_poll_had_tasks = True
+        else:
+            self._consecutive_empty_polls += 1
+            self._last_poll_had_tasks = False
+
+    def record_skipped_poll(self) -> None:
+        """
+        Called when there was no capacity to execute more tasks, so the server was not polled.
+        """
+        self._last_poll_had_tasks = False
+
+    def get_wait_time(self, polling_interval: float, max_polling_interval: float = None, jitter: float = 0) -> float:
+        """
+        :param polling_interval: in seconds
+        :param max_polling_interval: in seconds, enables adaptive polling when set
+        :param jitter: fraction of the wait time, between 0 and 1
+        :return: the time to wait in seconds
+        """
+        if max_polling_interval is None:
+            wait_time = polling_interval
+        elif self._last_poll_had_tasks:
+            wait_time = 0
+        else:
+            backoff = 2 ** min(_MAX_BACKOFF_EXPONENT, max(0, self._consecutive_empty_polls - 1))
+            wait_time = min(max_polling_interval, polling_interval * backoff)
+        if jitter:
+            wait_time *= random.uniform(1 - jitter, 1 + jitter)
+        return wait_time
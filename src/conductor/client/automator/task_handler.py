@@ -1,14 +1,22 @@
 import importlib
 import logging
 import os
+import signal
+import sys
+import tempfile
+import threading
+import time
 from multiprocessing import Process, freeze_support, Queue, set_start_method, get_context
+from multiprocessing.connection import wait
 from sys import platform
 from typing import List
 
+from conductor.client.automator.external_payload_storage import ExternalPayloadStorage
 from conductor.client.automator.task_runner import TaskRunner
 from conductor.client.configuration.configuration import Configuration
 from conductor.client.configuration.settings.metrics_settings import MetricsSettings
 from conductor.client.telemetry.metrics_collector import MetricsCollector
+from conductor.client.telemetry.task_listener import TaskListener
 from conductor.client.worker.worker import Worker
 from conductor.client.worker.worker_interface import WorkerInterface
 
@@ -18,6 +26,11 @@ logger = logging.getLogger(
     )
 )
 
+# exit code of the worker processes that must be replaced, see Configuration.process_max_tasks
+RECYCLE_EXIT_CODE = 75
+# how often the supervisor checks the worker processes, at most
+_SUPERVISOR_INTERVAL_SECONDS = 1
+
 _decorated_functions = {}
 _mp_fork_set = False
 if not _mp_fork_set:
@@ -32,16 +45,62 @@ if not _mp_fork_set:
     if platform == "darwin":
         os.environ['no_proxy'] = '*'
 
-def register_decorated_fn(name: str, poll_interval: int, domain: str, worker_id: str, func):
+def register_decorated_fn(name: str, poll_interval: int, domain: str, worker_id: str, func,
+                          batch_size: int = None, poll_timeout: int = None, thread_count: int = None,
+                          max_poll_interval: int = None, poll_jitter: float = None, process_count: int = None,
+                          process_group: str = None, lease_extend_enabled: bool = False):
     logger.info(f'decorated {name}')
     _decorated_functions[(name, domain)] = {
         'func': func,
         'poll_interval': poll_interval,
         'domain': domain,
-        'worker_id': worker_id
+        'worker_id': worker_id,
+        'batch_size': batch_size,
+        'poll_timeout': poll_timeout,
+        'thread_count': thread_count,
+        'max_poll_interval': max_poll_interval,
+        'poll_jitter': poll_jitter,
+        'process_count': process_count,
+        'process_group': process_group,
+        'lease_extend_enabled': lease_extend_enabled
     }
 
 
+def _create_annotated_workers() -> List[WorkerInterface]:
+    workers = []
+    for (task_def_name, domain) in _decorated_functions:
+        record = _decorated_functions[(task_def_name, domain)]
+        fn = record['func']
+        worker_id = record['worker_id']
+        poll_interval = record['poll_interval']
+        batch_size = record['batch_size']
+        poll_timeout = record['poll_timeout']
+        thread_count = record['thread_count']
+        max_poll_interval = record['max_poll_interval']
+        poll_jitter = record['poll_jitter']
+        process_count = record['process_count']
+        process_group = record['process_group']
+        lease_extend_enabled = record['lease_extend_enabled']
+
+        worker = Worker(
+            task_definition_name=task_def_name,
+            execute_function=fn,
+            worker_id=worker_id,
+            domain=domain,
+            poll_interval=poll_interval,
+            batch_size=batch_size,
+            poll_timeout=poll_timeout,
+            thread_count=thread_count,
+            max_poll_interval=max_poll_interval,
+            poll_jitter=poll_jitter,
+            process_count=process_count,
+            process_group=process_group,
+            lease_extend_enabled=lease_extend_enabled)
+        logger.info(f'created worker with name={task_def_name} and domain={domain}')
+        workers.append(worker)
+    return workers
+
+
 class TaskHandler:
     def __init__(
             self,
@@ -49,7 +108,9 @@ class TaskHandler:
             configuration: Configuration = None,
             metrics_settings: MetricsSettings = None,
             scan_for_annotated_workers: bool = True,
-            import_modules: List[str] = None
+            import_modules: List[str] = None,
+            listeners: List[TaskListener] = None,
+            external_payload_storage: ExternalPayloadStorage = None
     ):
         self.logger_process, self.queue = _setup_logging_queue(configuration)
 
@@ -66,22 +127,17 @@ class TaskHandler:
         elif not isinstance(workers, list):
             workers = [workers]
         if scan_for_annotated_workers is True:
-            for (task_def_name, domain) in _decorated_functions:
-                record = _decorated_functions[(task_def_name, domain)]
-                fn = record['func']
-                worker_id = record['worker_id']
-                poll_interval = record['poll_interval']
-
-                worker = Worker(
-                    task_definition_name=task_def_name,
-                    execute_function=fn,
-                    worker_id=worker_id,
-                    domain=domain,
-                    poll_interval=poll_interval)
-                logger.info(f'created worker with name={task_def_name} and domain={domain}')
-                workers.append(worker)
-
-        self.__create_task_runner_processes(workers, configuration, metrics_settings)
+            workers.extend(_create_annotated_workers())
+
+        self.__token_cache_file = _create_token_cache_file(configuration)
+        self.__configuration = configuration if configuration is not None else Configuration()
+        self.__stopping = False
+        self.__stop_requested = False
+        self.__processes_lock = threading.Lock()
+        self.metrics_collector = MetricsCollector(metrics_settings) if metrics_settings is not None else None
+        self.__create_task_runner_processes(
+            workers, configuration, metrics_settings, listeners, external_payload_storage
+        )
         self.__create_metrics_provider_process(metrics_settings)
         logger.info('TaskHandler initialized')
 
@@ -92,11 +148,14 @@ class TaskHandler:
         self.stop_processes()
 
     def stop_processes(self) -> None:
+        with self.__processes_lock:
+            self.__stopping = True
         self.__stop_task_runner_processes()
         self.__stop_metrics_provider_process()
         logger.info('Stopped worker processes...')
         self.queue.put(None)
         self.logger_process.terminate()
+        self.__remove_token_cache_file()
 
     def start_processes(self) -> None:
         logger.info('Starting worker processes...')
@@ -106,13 +165,42 @@ class TaskHandler:
         logger.info('Started all processes')
 
     def join_processes(self) -> None:
+        """
+        Waits until the worker processes stop, restarting the ones that die in the meantime.  On SIGTERM, the worker
+        processes are stopped gracefully, see `stop_processes`.
+        """
+        previous_handler = None
+        if threading.current_thread() is threading.main_thread():
+            previous_handler = signal.signal(signal.SIGTERM, self.__stop_on_signal)
         try:
+            self.__supervise_task_runner_processes()
+            if self.__stop_requested:
+                self.stop_processes()
             self.__join_task_runner_processes()
             self.__join_metrics_provider_process()
             logger.info('Joined all processes')
         except KeyboardInterrupt:
             logger.info('KeyboardInterrupt: Stopping all processes')
             self.stop_processes()
+        finally:
+            if previous_handler is not None:
+                signal.signal(signal.SIGTERM, previous_handler)
+
+    def __stop_on_signal(self, signum, frame) -> None:
+        logger.info(f'Received signal {signum}: Stopping all processes')
+        self.__stop_requested = True
+
+    def __remove_token_cache_file(self) -> None:
+        if self.__token_cache_file is None:
+            return
+        try:
+            os.remove(self.__token_cache_file)
+            os.rmdir(os.path.dirname(self.__token_cache_file))
+        except OSError as e:
+            logger.debug(f'Failed to remove the token cache file {self.__token_cache_file}, reason: {e}')
+        if self.__configuration.auth_token_cache_file == self.__token_cache_file:
+            self.__configuration.auth_token_cache_file = None
+        self.__token_cache_file = None
 
     def __create_metrics_provider_process(self, metrics_settings: MetricsSettings) -> None:
         if metrics_settings is None:
@@ -128,23 +216,47 @@ class TaskHandler:
             self,
             workers: List[WorkerInterface],
             configuration: Configuration,
-            metrics_settings: MetricsSettings
+            metrics_settings: MetricsSettings,
+            listeners: List[TaskListener] = None,
+            external_payload_storage: ExternalPayloadStorage = None
     ) -> None:
+        """
+        Creates `process_count` processes per worker, except for the workers in a process group, which share the
+        processes of their group.
+        """
+        # the task runners of each process
+        self.task_runners = []
         self.task_runner_processes = []
+        self.task_runner_restart_counts = []
+        self.__consecutive_failures = []
+        self.__start_times = []
+        worker_groups = {}
         for worker in workers:
-            self.__create_task_runner_process(
-                worker, configuration, metrics_settings
-            )
-
-    def __create_task_runner_process(
-            self,
-            worker: WorkerInterface,
-            configuration: Configuration,
-            metrics_settings: MetricsSettings
-    ) -> None:
-        task_runner = TaskRunner(worker, configuration, metrics_settings)
-        process = Process(target=task_runner.run)
-        self.task_runner_processes.append(process)
+            task_runner = TaskRunner(worker, configuration, metrics_settings, listeners, external_payload_storage)
+            process_group = worker.get_process_group()
+            if process_group is None:
+                process_group = worker
+            if process_group not in worker_groups:
+                worker_groups[process_group] = []
+            worker_groups[process_group].append(task_runner)
+        for task_runners in worker_groups.values():
+            process_count = max(task_runner.worker.get_process_count() for task_runner in task_runners)
+            for i in range(process_count):
+                if i > 0:
+                    task_runners = [
+                        TaskRunner(
+                            task_runner.worker, configuration, metrics_settings, listeners, external_payload_storage
+                        )
+                        for task_runner in task_runners
+                    ]
+                self.__create_task_runner_process(task_runners)
+
+    def __create_task_runner_process(self, task_runners: List[TaskRunner]) -> None:
+        self.task_runners.append(task_runners)
+        self.task_runner_processes.append(_create_task_runner_process(task_runners))
+        self.task_runner_restart_counts.append(0)
+        self.__consecutive_failures.append(0)
+        self.__start_times.append(None)
 
     def __start_metrics_provider_process(self):
         if self.metrics_provider_process is None:
@@ -154,11 +266,77 @@ class TaskHandler:
 
     def __start_task_runner_processes(self):
         n = 0
-        for task_runner_process in self.task_runner_processes:
+        for index, task_runner_process in enumerate(self.task_runner_processes):
             task_runner_process.start()
+            self.__start_times[index] = time.time()
             n = n + 1
         logger.info(f'Started {n} TaskRunner process')
 
+    def __supervise_task_runner_processes(self) -> None:
+        """
+        Restarts the worker processes that exited with an error, e.g. killed when out of memory, with a backoff
+        for the ones failing repeatedly, and the ones exiting to be recycled right away.  Returns when stopping, or
+        when all the processes have exited normally.
+        """
+        restart_times = {}
+        while not self.__stopping and not self.__stop_requested:
+            now = time.time()
+            sentinels = []
+            for index, process in enumerate(self.task_runner_processes):
+                if process.is_alive():
+                    sentinels.append(process.sentinel)
+                    continue
+                if process.exitcode is None or process.exitcode == 0:
+                    continue
+                if index not in restart_times:
+                    restart_times[index] = now + self.__get_restart_delay(index, process.exitcode)
+                if restart_times[index] <= now:
+                    del restart_times[index]
+                    self.__restart_task_runner_process(index, process.exitcode)
+                    sentinels.append(self.task_runner_processes[index].sentinel)
+            if len(sentinels) == 0 and len(restart_times) == 0:
+                return
+            timeout = _SUPERVISOR_INTERVAL_SECONDS
+            if len(restart_times) > 0:
+                timeout = max(0, min(timeout, min(restart_times.values()) - now))
+            wait(sentinels, timeout)
+
+    def __get_restart_delay(self, index: int, exit_code: int) -> float:
+        if exit_code == RECYCLE_EXIT_CODE:
+            return 0
+        max_backoff = self.__configuration.process_max_restart_backoff_seconds
+        if time.time() - self.__start_times[index] >= max_backoff:
+            # the process had been running fine for a while
+            self.__consecutive_failures[index] = 0
+        self.__consecutive_failures[index] += 1
+        return min(
+            max_backoff,
+            self.__configuration.process_restart_backoff_seconds * (2 ** (self.__consecutive_failures[index] - 1))
+        )
+
+    def __restart_task_runner_process(self, index: int, exit_code: int) -> None:
+        task_runners = self.task_runners[index]
+        task_names = ','.join(
+            task_name for task_runner in task_runners for task_name in task_runner.worker.task_definition_names
+        )
+        if exit_code == RECYCLE_EXIT_CODE:
+            logger.info(f'Replacing the TaskRunner process of {task_names}')
+        else:
+            logger.error(f'TaskRunner process of {task_names} exited with code {exit_code}, restarting it')
+        if self.metrics_collector is not None:
+            for task_runner in task_runners:
+                self.metrics_collector.increment_worker_restart(
+                    task_runner.worker.get_task_definition_name(), exit_code
+                )
+        with self.__processes_lock:
+            if self.__stopping:
+                return
+            process = _create_task_runner_process(task_runners)
+            self.task_runner_processes[index] = process
+            self.task_runner_restart_counts[index] += 1
+            process.start()
+            self.__start_times[index] = time.time()
+
     def __join_metrics_provider_process(self):
         if self.metrics_provider_process is None:
             return
@@ -174,11 +352,25 @@ class TaskHandler:
         self.__stop_process(self.metrics_provider_process)
 
     def __stop_task_runner_processes(self):
+        """
+        Sends SIGTERM to the worker processes, which stop polling, finish their in-flight tasks and send the results,
+        and kills the ones still running after `Configuration.shutdown_timeout_seconds`.
+        """
         for task_runner_process in self.task_runner_processes:
             self.__stop_process(task_runner_process)
+        # leave the processes some time to exit after their own timeout
+        deadline = time.time() + self.__configuration.shutdown_timeout_seconds + _SUPERVISOR_INTERVAL_SECONDS
+        for task_runner_process in self.task_runner_processes:
+            if task_runner_process.pid is None:
+                continue
+            task_runner_process.join(max(0, deadline - time.time()))
+            if task_runner_process.is_alive():
+                logger.warning(f'TaskRunner process {task_runner_process.pid} did not stop in time, killing it')
+                task_runner_process.kill()
+                task_runner_process.join()
 
     def __stop_process(self, process: Process):
-        if process is None:
+        if process is None or process.pid is None:
             return
         try:
             logger.debug(f'Terminating process: {process.pid}')
@@ -189,6 +381,66 @@ class TaskHandler:
             logger.debug(f'Killed process: {process.pid}')
 
 
+def _create_task_runner_process(task_runners: List[TaskRunner]) -> Process:
+    return Process(target=_run_task_runners, args=(task_runners,))
+
+
+def _run_task_runners(task_runners: List[TaskRunner]) -> None:
+    """
+    Runs the task runners of a process, each on its own thread when there are several.  Exits with code 0 once
+    drained, or with RECYCLE_EXIT_CODE when a task runner returned because the process must be replaced.
+    """
+    if len(task_runners) == 1:
+        task_runners[0].run()
+        sys.exit(0 if task_runners[0].draining else RECYCLE_EXIT_CODE)
+    stopped = threading.Event()
+
+    def run(task_runner: TaskRunner) -> None:
+        try:
+            task_runner.run()
+        finally:
+            stopped.set()
+
+    def drain_on_signal(signum, frame) -> None:
+        logger.info(f'Received signal {signum}, finishing the in-flight tasks before exiting')
+        for task_runner in task_runners:
+            task_runner.drain()
+
+    signal.signal(signal.SIGTERM, drain_on_signal)
+    threads = []
+    for task_runner in task_runners:
+        thread = threading.Thread(
+            target=run, args=(task_runner,), name=f'{task_runner.worker.get_task_definition_name()}-poller'
+        )
+        thread.start()
+        threads.append(thread)
+    stopped.wait()
+    draining = all(task_runner.draining for task_runner in task_runners)
+    for task_runner in task_runners:
+        task_runner.drain()
+    for thread in threads:
+        thread.join()
+    sys.exit(0 if draining else RECYCLE_EXIT_CODE)
+
+
+def _create_token_cache_file(configuration: Configuration):
+    """
+    Creates the file through which the worker processes share the authentication token, so that they request one
+    token per refresh instead of one each.  The file is readable only by the user, in a directory of its own.
+
+    :return: the path of the file, None when the configuration does not share the token or already has a cache file
+    """
+    if configuration is None or configuration.authentication_settings is None:
+        return None
+    if not configuration.auth_token_shared_by_worker_processes or configuration.auth_token_cache_file is not None:
+        return None
+    directory = tempfile.mkdtemp(prefix='conductor-token-')
+    path = os.path.join(directory, 'token.json')
+    os.close(os.open(path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o600))
+    configuration.auth_token_cache_file = path
+    return path
+
+
 # Setup centralized logging queue
 def _setup_logging_queue(configuration: Configuration):
     queue = Queue()
@@ -0,0 +1,225 @@
+import heapq
+import itertools
+import logging
+import queue
+import random
+import threading
+import time
+import traceback
+from typing import Any, Callable, List
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.models.task_result import TaskResult
+from conductor.client.telemetry import task_listener
+from conductor.client.telemetry.metrics_collector import MetricsCollector
+from conductor.client.telemetry.model.task_phase import TaskPhase
+from conductor.client.telemetry.task_listener import TaskListener
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+_STOP = object()
+_WAKE_UP = object()
+
+
+def get_retry_delay(attempt: int, backoff_seconds: float, max_backoff_seconds: float) -> float:
+    """
+    Exponential backoff with jitter: the delay doubles with every attempt, up to `max_backoff_seconds`,
+    and a random value between half and all of it is picked so that workers don't retry in lockstep.
+    """
+    delay = min(max_backoff_seconds, backoff_seconds * (2 ** (attempt - 1)))
+    return random.uniform(delay / 2, delay)
+
+
+class _PendingUpdate:
+    def __init__(self, task_definition_name: str, task_result: TaskResult, on_update: Callable[[], None] = None):
+        self.task_definition_name = task_definition_name
+        self.task_result = task_result
+        self.on_update = on_update
+        self.attempt = 0
+
+
+class TaskResultSender:
+    """
+    Sends task results to the server from `thread_count` background threads, so that polling and execution are not
+    held up by slow or failing updates, and the results of tasks executed concurrently are sent concurrently.
+
+    Results are queued in a bounded queue; when it is full, `submit` blocks until there is room.  Failed updates
+    are retried with jittered exponential backoff without delaying the results queued after them.
+    """
+
+    def __init__(
+            self,
+            update_task: Callable[[TaskResult], Any],
+            queue_size: int,
+            retry_count: int,
+            backoff_seconds: float,
+            max_backoff_seconds: float,
+            metrics_collector: MetricsCollector = None,
+            domain: str = None,
+            listeners: List[TaskListener] = None,
+            thread_count: int = 1
+    ):
+        self.update_task = update_task
+        self.retry_count = retry_count
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.metrics_collector = metrics_collector
+        self.domain = domain
+        self.listeners = listeners
+        self.thread_count = max(1, thread_count)
+        self._queue = queue.Queue(maxsize=queue_size)
+        # (retry time, sequence, update) of the failed updates, shared by the sender threads
+        self._retries = []
+        self._retries_lock = threading.Lock()
+        self._sequence = itertools.count()
+        self._pending = 0
+        self._pending_condition = threading.Condition()
+        self._flushing = False
+        self._threads = []
+        self._threads_lock = threading.Lock()
+
+    def submit(self, task_definition_name: str, task_result: TaskResult, on_update: Callable[[], None] = None) -> None:
+        """
+        :param on_update: called from the sender thread once the result has been sent
+        """
+        self.__start()
+        with self._pending_condition:
+            self._pending += 1
+        self._queue.put(_PendingUpdate(task_definition_name, task_result, on_update))
+        self.__record_queue_depth()
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Waits until every submitted result has been sent, or given up on after all the retries.
+        Retries are no longer delayed while flushing.
+
+        :return: True if all the results were processed before the timeout
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        with self._pending_condition:
+            self._flushing = True
+            try:
+                # wake up the sender threads waiting for their next retry
+                for _ in self._threads:
+                    self._queue.put_nowait(_WAKE_UP)
+            except queue.Full:
+                # the threads are woken up by the queued results
+                pass
+            try:
+                while self._pending > 0:
+                    remaining = None if deadline is None else deadline - time.time()
+                    if remaining is not None and remaining <= 0:
+                        logger.warning(f'{self._pending} task results were not sent before the flush timeout')
+                        return False
+                    self._pending_condition.wait(remaining)
+                return True
+            finally:
+                self._flushing = False
+
+    def stop(self, timeout: float = None) -> bool:
+        flushed = self.flush(timeout)
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join(timeout)
+        return flushed
+
+    def __start(self) -> None:
+        if len(self._threads) > 0:
+            return
+        with self._threads_lock:
+            if len(self._threads) == 0:
+                for i in range(self.thread_count):
+                    thread = threading.Thread(target=self.__run, name=f'task-result-sender-{i}', daemon=True)
+                    thread.start()
+                    self._threads.append(thread)
+
+    def __run(self) -> None:
+        while True:
+            timeout = None
+            with self._retries_lock:
+                if len(self._retries) > 0:
+                    timeout = max(0, self._retries[0][0] - time.time())
+            try:
+                update = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                update = None
+            if update is _STOP:
+                return
+            if update is not None and update is not _WAKE_UP:
+                self.__send(update)
+            retry = self.__pop_due_retry()
+            while retry is not None:
+                self.__send(retry)
+                retry = self.__pop_due_retry()
+            self.__record_queue_depth()
+
+    def __pop_due_retry(self):
+        with self._retries_lock:
+            if len(self._retries) > 0 and (self._flushing or self._retries[0][0] <= time.time()):
+                return heapq.heappop(self._retries)[2]
+        return None
+
+    def __send(self, update: _PendingUpdate) -> None:
+        task_result = update.task_result
+        update.attempt += 1
+        if self.listeners:
+            task_listener.set_phase_context(update.task_definition_name, task_result.task_id, self.listeners)
+        try:
+            start_time = time.time()
+            phase_start_time = time.perf_counter()
+            response = self.update_task(task_result)
+            finish_time = time.time()
+            task_listener.record_phase(TaskPhase.UPDATE, phase_start_time)
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_task_update_time(
+                    update.task_definition_name, finish_time - start_time, self.domain
+                )
+            logger.debug(
+                'Updated task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, task_definition_name: {task_definition_name}, response: {response}'.format(
+                    task_id=task_result.task_id,
+                    workflow_instance_id=task_result.workflow_instance_id,
+                    task_definition_name=update.task_definition_name,
+                    response=response
+                )
+            )
+        except Exception as e:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_update_error(update.task_definition_name, type(e))
+            logger.error(
+                'Failed to update task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, '
+                'task_definition_name: {task_definition_name}, attempt: {attempt}, reason: {reason}'.format(
+                    task_id=task_result.task_id,
+                    workflow_instance_id=task_result.workflow_instance_id,
+                    task_definition_name=update.task_definition_name,
+                    attempt=update.attempt,
+                    reason=traceback.format_exc()
+                )
+            )
+            if update.attempt <= self.retry_count:
+                if self.metrics_collector is not None:
+                    self.metrics_collector.increment_task_update_retry(update.task_definition_name)
+                delay = get_retry_delay(update.attempt, self.backoff_seconds, self.max_backoff_seconds)
+                with self._retries_lock:
+                    heapq.heappush(self._retries, (time.time() + delay, next(self._sequence), update))
+                return
+        else:
+            if update.on_update is not None:
+                try:
+                    update.on_update()
+                except Exception as e:
+                    logger.warning(f'Failed to handle the update of task {task_result.task_id}, reason: {e}')
+        finally:
+            if self.listeners:
+                task_listener.clear_phase_context()
+        with self._pending_condition:
+            self._pending -= 1
+            self._pending_condition.notify_all()
+
+    def __record_queue_depth(self) -> None:
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_task_update_queue_depth(self._queue.qsize() + len(self._retries))
@@ -1,18 +1,32 @@
+import functools
 import logging
 import os
+import signal
 import sys
+import threading
 import time
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import List, Optional
 
+from conductor.client.automator.external_payload_storage import ExternalPayloadStorage, PayloadOperation, \
+    PayloadType, ServerExternalPayloadStorage
+from conductor.client.automator.lease_extender import LeaseExtender
+from conductor.client.automator.poll_scheduler import PollScheduler
+from conductor.client.automator.task_result_sender import TaskResultSender, get_retry_delay
 from conductor.client.configuration.configuration import Configuration
 from conductor.client.configuration.settings.metrics_settings import MetricsSettings
 from conductor.client.http.api.task_resource_api import TaskResourceApi
+from conductor.client.http import json_codec
 from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.task import Task
 from conductor.client.http.models.task_exec_log import TaskExecLog
 from conductor.client.http.models.task_result import TaskResult
 from conductor.client.http.rest import AuthorizationException
-from conductor.client.telemetry.metrics_collector import MetricsCollector
+from conductor.client.telemetry import task_listener
+from conductor.client.telemetry.metrics_collector import MetricsCollector, get_task_queue_wait_time
+from conductor.client.telemetry.model.task_phase import TaskPhase
+from conductor.client.telemetry.task_listener import TaskListener
 from conductor.client.worker.worker_interface import WorkerInterface
 
 logger = logging.getLogger(
@@ -21,21 +35,28 @@ logger = logging.getLogger(
     )
 )
 
+# how often the memory of the process is compared to process_max_memory_mb
+_MEMORY_CHECK_INTERVAL_SECONDS = 5
+
 
 class TaskRunner:
     def __init__(
             self,
             worker: WorkerInterface,
             configuration: Configuration = None,
-            metrics_settings: MetricsSettings = None
+            metrics_settings: MetricsSettings = None,
+            listeners: List[TaskListener] = None,
+            external_payload_storage: ExternalPayloadStorage = None
     ):
         if not isinstance(worker, WorkerInterface):
             raise Exception('Invalid worker')
         self.worker = worker
-        self.__set_worker_properties()
+        set_worker_properties_from_env(self.worker)
         if not isinstance(configuration, Configuration):
             configuration = Configuration()
         self.configuration = configuration
+        # receive the timings of the phases of the tasks
+        self.listeners = list(listeners) if listeners is not None else []
         self.metrics_collector = None
         if metrics_settings is not None:
             self.metrics_collector = MetricsCollector(
@@ -43,9 +64,50 @@ class TaskRunner:
             )
         self.task_client = TaskResourceApi(
             ApiClient(
-                configuration=self.configuration
+                configuration=self.configuration,
+                metrics_collector=self.metrics_collector
             )
         )
+        # Stores the large task inputs and outputs, see Configuration.task_output_payload_threshold_kb
+        self.external_payload_storage = external_payload_storage
+        if self.external_payload_storage is None:
+            self.external_payload_storage = ServerExternalPayloadStorage(self.task_client)
+        # Created lazily so that the threads are started in the process running the worker
+        self._executor = None
+        self._in_flight_tasks = set()
+        self._in_flight_lock = threading.Lock()
+        # Each task type of the worker is polled on its own schedule
+        self._poll_schedulers = {}
+        self._next_poll_times = {}
+        self._polling_intervals = {}
+        for task_definition_name in self.worker.task_definition_names:
+            self._poll_schedulers[task_definition_name] = PollScheduler()
+            self._next_poll_times[task_definition_name] = 0
+            self._polling_intervals[task_definition_name] = get_polling_interval_from_env(task_definition_name)
+        # Number of tasks executed, to replace the process after process_max_tasks, incremented by the worker threads
+        self._executed_task_count = 0
+        self._executed_task_count_lock = threading.Lock()
+        self._next_memory_check_time = 0
+        # Set when the process is stopped, the tasks already polled are still executed and updated
+        self.draining = False
+        self._waiting_for_polling_interval = False
+        # Started on the first task executed with lease extension enabled
+        self._lease_extender = LeaseExtender(self.__send_task_result, self.worker.get_identity())
+        self._task_result_sender = None
+        if self.configuration.task_update_in_background:
+            # The sender thread is only started on the first submitted result
+            self._task_result_sender = TaskResultSender(
+                update_task=self.__send_task_result,
+                queue_size=self.configuration.task_update_queue_size,
+                retry_count=self.configuration.task_update_retry_count,
+                backoff_seconds=self.configuration.task_update_backoff_seconds,
+                max_backoff_seconds=self.configuration.task_update_max_backoff_seconds,
+                metrics_collector=self.metrics_collector,
+                domain=self.worker.get_domain(),
+                listeners=self.listeners,
+                # the results of the tasks executed concurrently are sent concurrently
+                thread_count=self.configuration.task_update_thread_count or self.worker.get_thread_count()
+            )
 
     def run(self) -> None:
         if self.configuration is not None:
@@ -55,24 +117,214 @@ class TaskRunner:
 
         task_names = ','.join(self.worker.task_definition_names)
         logger.info(f'Polling task {task_names} with domain {self.worker.get_domain()} with polling '
-                    f'interval {self.worker.get_polling_interval_in_seconds()}')
+                    f'interval {self.worker.get_polling_interval_in_seconds()}, batch size {self.worker.get_batch_size()} '
+                    f'and thread count {self.worker.get_thread_count()}')
 
-        while True:
-            try:
-                self.run_once()
-            except Exception as e:
-                pass
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.__drain_on_signal)
+        try:
+            while not self.draining and not self.__is_process_recycling_due():
+                try:
+                    self.run_once()
+                except Exception as e:
+                    pass
+        finally:
+            self.__flush_task_results()
+
+    def drain(self) -> None:
+        """
+        Stops polling.  `run` returns once the tasks already polled have been executed and their results sent, or
+        after `Configuration.shutdown_timeout_seconds`.
+        """
+        self.draining = True
+
+    def __drain_on_signal(self, signum, frame) -> None:
+        if not self.draining:
+            logger.info(f'Received signal {signum}, finishing the in-flight tasks before exiting')
+        self.drain()
+        if self._waiting_for_polling_interval:
+            # nothing is in flight in this thread, stop waiting for the next poll
+            raise _DrainInterrupt()
+
+    def __is_process_recycling_due(self) -> bool:
+        max_tasks = self.configuration.process_max_tasks
+        with self._executed_task_count_lock:
+            executed_task_count = self._executed_task_count
+        if max_tasks is not None and executed_task_count >= max_tasks:
+            logger.info(f'Executed {executed_task_count} tasks, replacing the worker process')
+            return True
+        max_memory_mb = self.configuration.process_max_memory_mb
+        if max_memory_mb is not None and time.time() >= self._next_memory_check_time:
+            self._next_memory_check_time = time.time() + _MEMORY_CHECK_INTERVAL_SECONDS
+            memory_mb = get_resident_memory_mb()
+            if memory_mb is not None and memory_mb >= max_memory_mb:
+                logger.info(f'Using {memory_mb:.0f} MB of memory, replacing the worker process')
+                return True
+        return False
 
     def run_once(self) -> None:
-        task = self.__poll_task()
-        if task is not None and task.task_id is not None:
-            task_result = self.__execute_task(task)
-            self.__update_task(task_result)
-        self.__wait_for_polling_interval()
+        task_definition_names = self.__get_task_definition_names_to_poll()
+        for task_definition_name in task_definition_names:
+            self.__poll_and_dispatch_tasks(task_definition_name)
+        self.__wait_for_polling_interval(task_definition_names)
         self.worker.clear_task_definition_name_cache()
 
-    def __poll_task(self) -> Task:
-        task_definition_name = self.worker.get_task_definition_name()
+    def __get_task_definition_names_to_poll(self) -> List[str]:
+        """
+        All the task types of the worker that are due to be polled.  The type polled first rotates with every cycle,
+        so that no type keeps taking all the free execution slots.
+        """
+        task_definition_names = self.worker.task_definition_names
+        first_task_definition_name = self.worker.get_task_definition_name()
+        if first_task_definition_name in task_definition_names:
+            first_index = task_definition_names.index(first_task_definition_name)
+            task_definition_names = task_definition_names[first_index:] + task_definition_names[:first_index]
+        now = time.time()
+        return [
+            task_definition_name for task_definition_name in task_definition_names
+            if self._next_poll_times.get(task_definition_name, 0) <= now
+        ]
+
+    def __poll_and_dispatch_tasks(self, task_definition_name: str) -> None:
+        poll_scheduler = self.__get_poll_scheduler(task_definition_name)
+        count = self.worker.get_batch_size()
+        if self.worker.get_thread_count() > 1:
+            # only poll for as many tasks as there are free execution slots
+            count = min(count, self.__get_available_execution_slots())
+        max_tasks = self.configuration.process_max_tasks
+        if max_tasks is not None:
+            # do not poll for more tasks than the process executes before it is replaced
+            count = min(count, self.__get_remaining_task_count(max_tasks))
+        if count <= 0:
+            poll_scheduler.record_skipped_poll()
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_execution_queue_full(
+                    task_definition_name
+                )
+            return
+        tasks = self.__poll_tasks(count, task_definition_name)
+        received_time = time.time()
+        poll_scheduler.record_poll(len(tasks))
+        for task in tasks:
+            if task is not None and task.task_id is not None:
+                self.__record_task_queue_wait_time(task, task_definition_name)
+                self.__dispatch_task(task, task_definition_name, received_time)
+
+    def __get_remaining_task_count(self, max_tasks: int) -> int:
+        # the tasks in flight may have been counted as executed already, so this errs on polling fewer tasks
+        with self._in_flight_lock:
+            in_flight_task_count = len(self._in_flight_tasks)
+        with self._executed_task_count_lock:
+            return max_tasks - self._executed_task_count - in_flight_task_count
+
+    def __get_available_execution_slots(self) -> int:
+        with self._in_flight_lock:
+            return self.worker.get_thread_count() - len(self._in_flight_tasks)
+
+    def __dispatch_task(self, task: Task, task_definition_name: str, received_time: float = None) -> None:
+        if self.worker.get_thread_count() <= 1:
+            self.__execute_and_update_task(task, task_definition_name, received_time)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.worker.get_thread_count(),
+                thread_name_prefix=f'{self.worker.get_task_definition_name()}-worker'
+            )
+        with self._in_flight_lock:
+            future = self._executor.submit(
+                self.__execute_and_update_task, task, task_definition_name, received_time
+            )
+            self._in_flight_tasks.add(future)
+        future.add_done_callback(self.__release_execution_slot)
+
+    def __release_execution_slot(self, future: Future) -> None:
+        with self._in_flight_lock:
+            self._in_flight_tasks.discard(future)
+
+    def __execute_and_update_task(self, task: Task, task_definition_name: str, received_time: float = None) -> None:
+        with self._executed_task_count_lock:
+            self._executed_task_count += 1
+        if self.listeners:
+            task_listener.set_phase_context(task_definition_name, task.task_id, self.listeners)
+        try:
+            task_result = self.__execute_task_extending_lease(task, task_definition_name)
+            if self._task_result_sender is not None and isinstance(task_result, TaskResult):
+                on_update = None
+                if self.metrics_collector is not None:
+                    on_update = functools.partial(
+                        self.__record_task_total_time, task, task_definition_name, received_time
+                    )
+                self._task_result_sender.submit(task_definition_name, task_result, on_update)
+            elif self.__update_task(task_result, task_definition_name) is not None:
+                self.__record_task_total_time(task, task_definition_name, received_time)
+        finally:
+            if self.listeners:
+                task_listener.clear_phase_context()
+
+    def __execute_task_extending_lease(self, task: Task, task_definition_name: str) -> TaskResult:
+        if not self.worker.lease_extend_enabled or not isinstance(task, Task):
+            return self.__execute_task(task, task_definition_name)
+        self._lease_extender.start(task)
+        try:
+            return self.__execute_task(task, task_definition_name)
+        finally:
+            self._lease_extender.stop(task)
+
+    def __record_task_queue_wait_time(self, task: Task, task_definition_name: str) -> None:
+        if self.metrics_collector is None:
+            return
+        queue_wait_time = get_task_queue_wait_time(task)
+        if queue_wait_time is not None:
+            self.metrics_collector.record_task_queue_wait_time(
+                task_definition_name, queue_wait_time, self.worker.get_domain()
+            )
+
+    def __record_task_total_time(self, task: Task, task_definition_name: str, received_time: float) -> None:
+        """
+        Records the time from scheduling the task to updating its result: the time it waited in the queue, plus the
+        time since it was polled.
+        """
+        if self.metrics_collector is None or received_time is None:
+            return
+        total_time = time.time() - received_time + (get_task_queue_wait_time(task) or 0)
+        self.metrics_collector.record_task_total_time(task_definition_name, total_time, self.worker.get_domain())
+
+    def __send_task_result(self, task_result: TaskResult):
+        return self.task_client.update_task(body=task_result)
+
+    def __flush_task_results(self) -> None:
+        deadline = time.time() + self.configuration.shutdown_timeout_seconds
+        if self._executor is not None:
+            with self._in_flight_lock:
+                in_flight_tasks = list(self._in_flight_tasks)
+            _, not_done = wait(in_flight_tasks, timeout=self.configuration.shutdown_timeout_seconds)
+            if len(not_done) > 0:
+                logger.warning(f'{len(not_done)} tasks were still executing after the shutdown timeout')
+            self._executor.shutdown(wait=False)
+        if self._task_result_sender is not None:
+            self._task_result_sender.stop(
+                max(0, min(self.configuration.task_update_flush_timeout_seconds, deadline - time.time()))
+            )
+
+    def __poll_tasks(self, count: int, task_definition_name: str) -> List[Task]:
+        if self.listeners:
+            task_listener.set_phase_context(task_definition_name, None, self.listeners)
+        try:
+            start_time = time.perf_counter()
+            if count > 1:
+                tasks = self.__batch_poll_tasks(count, task_definition_name)
+            else:
+                task = self.__poll_task(task_definition_name)
+                tasks = [task] if task is not None else []
+            task_listener.record_phase(TaskPhase.POLL, start_time)
+            return tasks
+        finally:
+            if self.listeners:
+                task_listener.clear_phase_context()
+
+    def __poll_task(self, task_definition_name: str = None) -> Task:
+        if task_definition_name is None:
+            task_definition_name = self.worker.get_task_definition_name()
         if self.worker.paused():
             logger.debug(f'Stop polling task for: {task_definition_name}')
             return None
@@ -91,7 +343,7 @@ class TaskRunner:
             finish_time = time.time()
             time_spent = finish_time - start_time
             if self.metrics_collector is not None:
-                self.metrics_collector.record_task_poll_time(task_definition_name, time_spent)
+                self.metrics_collector.record_task_poll_time(task_definition_name, time_spent, domain)
         except AuthorizationException as auth_exception:
             if self.metrics_collector is not None:
                 self.metrics_collector.increment_task_poll_error(task_definition_name, type(auth_exception))
@@ -112,10 +364,59 @@ class TaskRunner:
                 f'Polled task: {task_definition_name}, worker_id: {self.worker.get_identity()}, domain: {self.worker.get_domain()}')
         return task
 
-    def __execute_task(self, task: Task) -> TaskResult:
+    def __batch_poll_tasks(self, count: int, task_definition_name: str = None) -> List[Task]:
+        if task_definition_name is None:
+            task_definition_name = self.worker.get_task_definition_name()
+        if self.worker.paused():
+            logger.debug(f'Stop polling task for: {task_definition_name}')
+            return []
+        if self.metrics_collector is not None:
+            self.metrics_collector.increment_task_poll(
+                task_definition_name
+            )
+
+        try:
+            start_time = time.time()
+            domain = self.worker.get_domain()
+            params = {
+                'workerid': self.worker.get_identity(),
+                'count': count,
+                'timeout': self.worker.get_poll_timeout_in_millis()
+            }
+            if domain is not None:
+                params['domain'] = domain
+            tasks = self.task_client.batch_poll(tasktype=task_definition_name, **params)
+            finish_time = time.time()
+            time_spent = finish_time - start_time
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_task_poll_time(task_definition_name, time_spent, domain)
+        except AuthorizationException as auth_exception:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_poll_error(task_definition_name, type(auth_exception))
+            if auth_exception.invalid_token:
+                logger.fatal(f'failed to batch poll task {task_definition_name} due to invalid auth token')
+            else:
+                logger.fatal(f'failed to batch poll task {task_definition_name} error: {auth_exception.status} - {auth_exception.error_code}')
+            return []
+        except Exception as e:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_poll_error(task_definition_name, type(e))
+            logger.error(
+                f'Failed to batch poll task for: {task_definition_name}, reason: {traceback.format_exc()}'
+            )
+            return []
+        if tasks is None:
+            return []
+        if len(tasks) > 0:
+            logger.debug(
+                f'Polled {len(tasks)} tasks: {task_definition_name}, worker_id: {self.worker.get_identity()}, domain: {self.worker.get_domain()}')
+        return tasks
+
+    def __execute_task(self, task: Task, task_definition_name: str = None) -> TaskResult:
         if not isinstance(task, Task):
             return None
-        task_definition_name = self.worker.get_task_definition_name()
+        if task_definition_name is None:
+            task_definition_name = self.worker.get_task_definition_name()
         logger.debug(
             'Executing task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, task_definition_name: {task_definition_name}'.format(
                 task_id=task.task_id,
@@ -123,15 +424,20 @@ class TaskRunner:
                 task_definition_name=task_definition_name
             )
         )
+        start_time = time.time()
         try:
-            start_time = time.time()
+            self.__download_task_input(task, task_definition_name)
+            self.__notify_task_execution_started(task_definition_name, task)
+            phase_start_time = time.perf_counter()
             task_result = self.worker.execute(task)
             finish_time = time.time()
             time_spent = finish_time - start_time
+            task_listener.record_phase(TaskPhase.EXECUTE, phase_start_time)
             if self.metrics_collector is not None:
                 self.metrics_collector.record_task_execute_time(
                     task_definition_name,
-                    time_spent
+                    time_spent,
+                    self.worker.get_domain()
                 )
                 self.metrics_collector.record_task_result_payload_size(
                     task_definition_name,
@@ -166,12 +472,90 @@ class TaskRunner:
                     reason=traceback.format_exc()
                 )
             )
+        else:
+            self.__upload_large_task_output(task_result, task_definition_name)
+        self.__notify_task_execution_finished(task_definition_name, task, task_result, time.time() - start_time)
         return task_result
 
-    def __update_task(self, task_result: TaskResult):
+    def __download_task_input(self, task: Task, task_definition_name: str) -> None:
+        """
+        Retrieves the input of the task from the external payload storage, when the server stored it there.
+        """
+        if not task.external_input_payload_storage_path or task.input_data:
+            return
+        task.input_data = self.external_payload_storage.download(
+            task.external_input_payload_storage_path, PayloadType.TASK_INPUT
+        )
+        if self.metrics_collector is not None:
+            self.metrics_collector.increment_external_payload_used(
+                task_definition_name, PayloadOperation.READ.value, PayloadType.TASK_INPUT.value
+            )
+
+    def __upload_large_task_output(self, task_result: TaskResult, task_definition_name: str) -> None:
+        """
+        Uploads the output of the task to the external payload storage, and sends only its path to the server, when
+        it is larger than `Configuration.task_output_payload_threshold_kb`.  The upload is retried like the task
+        updates, and the task fails when it cannot be uploaded.  The retries wait in the thread executing the task,
+        which keeps its execution slot, so that the outputs waiting to be uploaded are bounded by the thread count.
+        """
+        threshold_kb = self.configuration.task_output_payload_threshold_kb
+        if threshold_kb is None or not isinstance(task_result, TaskResult) or not task_result.output_data:
+            return
+        payload = json_codec.dumps(self.task_client.api_client.sanitize_for_serialization(task_result.output_data))
+        if len(payload) <= threshold_kb * 1024:
+            return
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                task_result.external_output_payload_storage_path = self.external_payload_storage.upload(
+                    payload, PayloadType.TASK_OUTPUT
+                )
+                break
+            except Exception as e:
+                if attempt > self.configuration.task_update_retry_count:
+                    logger.error(
+                        f'Failed to upload the output of task {task_result.task_id} to the external payload storage, '
+                        f'reason: {e}'
+                    )
+                    task_result.status = 'FAILED'
+                    task_result.reason_for_incompletion = f'Failed to upload the task output to the external payload ' \
+                                                          f'storage: {e}'
+                    task_result.output_data = {}
+                    return
+                logger.warning(f'Failed to upload the output of task {task_result.task_id}, retrying, reason: {e}')
+                time.sleep(get_retry_delay(
+                    attempt,
+                    self.configuration.task_update_backoff_seconds,
+                    self.configuration.task_update_max_backoff_seconds
+                ))
+        task_result.output_data = {}
+        if self.metrics_collector is not None:
+            self.metrics_collector.increment_external_payload_used(
+                task_definition_name, PayloadOperation.WRITE.value, PayloadType.TASK_OUTPUT.value
+            )
+
+    def __notify_task_execution_started(self, task_definition_name: str, task: Task) -> None:
+        for listener in self.listeners:
+            try:
+                listener.on_task_execution_started(task_definition_name, task)
+            except Exception as e:
+                logger.warning(f'Task listener {type(listener).__name__} failed, reason: {e}')
+
+    def __notify_task_execution_finished(
+            self, task_definition_name: str, task: Task, task_result: TaskResult, time_spent: float
+    ) -> None:
+        for listener in self.listeners:
+            try:
+                listener.on_task_execution_finished(task_definition_name, task, task_result, time_spent)
+            except Exception as e:
+                logger.warning(f'Task listener {type(listener).__name__} failed, reason: {e}')
+
+    def __update_task(self, task_result: TaskResult, task_definition_name: str = None):
         if not isinstance(task_result, TaskResult):
             return None
-        task_definition_name = self.worker.get_task_definition_name()
+        if task_definition_name is None:
+            task_definition_name = self.worker.get_task_definition_name()
         logger.debug(
             'Updating task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, task_definition_name: {task_definition_name}'.format(
                 task_id=task_result.task_id,
@@ -179,12 +563,23 @@ class TaskRunner:
                 task_definition_name=task_definition_name
             )
         )
-        for attempt in range(4):
+        for attempt in range(self.configuration.task_update_retry_count + 1):
             if attempt > 0:
-                # Wait for [10s, 20s, 30s] before next attempt
-                time.sleep(attempt * 10)
+                time.sleep(get_retry_delay(
+                    attempt,
+                    self.configuration.task_update_backoff_seconds,
+                    self.configuration.task_update_max_backoff_seconds
+                ))
             try:
+                start_time = time.time()
+                phase_start_time = time.perf_counter()
                 response = self.task_client.update_task(body=task_result)
+                finish_time = time.time()
+                task_listener.record_phase(TaskPhase.UPDATE, phase_start_time)
+                if self.metrics_collector is not None:
+                    self.metrics_collector.record_task_update_time(
+                        task_definition_name, finish_time - start_time, self.worker.get_domain()
+                    )
                 logger.debug(
                     'Updated task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, task_definition_name: {task_definition_name}, response: {response}'.format(
                         task_id=task_result.task_id,
@@ -210,48 +605,169 @@ class TaskRunner:
                 )
         return None
 
-    def __wait_for_polling_interval(self) -> None:
-        polling_interval = self.worker.get_polling_interval_in_seconds()
-        time.sleep(polling_interval)
+    def __wait_for_polling_interval(self, polled_task_definition_names: List[str] = None) -> None:
+        """
+        Schedules the next poll of the task types polled in this cycle, and waits until the next poll of any type.
+        """
+        if polled_task_definition_names is None:
+            polled_task_definition_names = self.worker.task_definition_names
+        now = time.time()
+        wait_times = []
+        for task_definition_name in polled_task_definition_names:
+            wait_time = self.__get_poll_scheduler(task_definition_name).get_wait_time(
+                self.__get_polling_interval_in_seconds(task_definition_name),
+                self.worker.get_max_polling_interval_in_seconds(),
+                self.worker.get_poll_jitter()
+            )
+            self._next_poll_times[task_definition_name] = now + wait_time
+            wait_times.append(wait_time)
+        for task_definition_name, next_poll_time in self._next_poll_times.items():
+            if task_definition_name not in polled_task_definition_names:
+                wait_times.append(next_poll_time - now)
+        if len(wait_times) > 0 and not self.draining:
+            self._waiting_for_polling_interval = True
+            try:
+                time.sleep(max(0, min(wait_times)))
+            finally:
+                self._waiting_for_polling_interval = False
 
-    def __set_worker_properties(self) -> None:
-        # If multiple tasks are supplied to the same worker, then only first
-        # task will be considered for setting worker properties
-        task_type = self.worker.get_task_definition_name()
+    def __get_poll_scheduler(self, task_definition_name: str) -> PollScheduler:
+        if task_definition_name not in self._poll_schedulers:
+            self._poll_schedulers[task_definition_name] = PollScheduler()
+        return self._poll_schedulers[task_definition_name]
 
-        domain = self.__get_property_value_from_env("domain", task_type)
-        if domain:
-            self.worker.domain = domain
-        else:
-            self.worker.domain = self.worker.get_domain()
+    def __get_polling_interval_in_seconds(self, task_definition_name: str) -> float:
+        polling_interval = self._polling_intervals.get(task_definition_name)
+        if polling_interval is None:
+            return self.worker.get_polling_interval_in_seconds()
+        return polling_interval / 1000
 
-        polling_interval = self.__get_property_value_from_env("polling_interval", task_type)
-        if polling_interval:
-            try:
-                self.worker.poll_interval = float(polling_interval)
-            except Exception as e:
-                logger.error(f'error reading and parsing the polling interval value {polling_interval}')
-                self.worker.poll_interval = self.worker.get_polling_interval_in_seconds()
 
-        if polling_interval:
-            try:
-                self.worker.poll_interval = float(polling_interval)
-                polling_interval_initialized = True
-            except Exception as e:
-                logger.error("Exception in reading polling interval from environment variable: {0}.".format(str(e)))
+def get_resident_memory_mb() -> Optional[float]:
+    """
+    :return: the resident memory of this process in MB, its peak when the current one is unknown, None when unknown
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # in bytes on macOS, in KB elsewhere
+    return max_rss / (1024 * 1024) if sys.platform == 'darwin' else max_rss / 1024
 
-    def __get_property_value_from_env(self, prop, task_type):
-        """
-        get the property from the env variable
-        e.g. conductor_worker_"prop" or conductor_worker_"task_type"_"prop"
-        """
-        prefix = "conductor_worker"
-        # Look for generic property in both case environment variables
-        key = prefix + "_" + prop
-        value_all = os.getenv(key, os.getenv(key.upper()))
-
-        # Look for task specific property in both case environment variables
-        key_small = prefix + "_" + task_type + "_" + prop
-        key_upper = prefix.upper() + "_" + task_type + "_" + prop.upper()
-        value = os.getenv(key_small, os.getenv(key_upper, value_all))
-        return value
+
+class _DrainInterrupt(Exception):
+    pass
+
+
+def set_worker_properties_from_env(worker: WorkerInterface) -> None:
+    # If multiple tasks are supplied to the same worker, then only first
+    # task will be considered for setting worker properties
+    task_type = worker.get_task_definition_name()
+
+    domain = get_property_value_from_env("domain", task_type)
+    if domain:
+        worker.domain = domain
+    else:
+        worker.domain = worker.get_domain()
+
+    polling_interval = get_property_value_from_env("polling_interval", task_type)
+    if polling_interval:
+        try:
+            worker.poll_interval = float(polling_interval)
+        except Exception as e:
+            logger.error(f'error reading and parsing the polling interval value {polling_interval}')
+            worker.poll_interval = worker.get_polling_interval_in_seconds()
+
+    if polling_interval:
+        try:
+            worker.poll_interval = float(polling_interval)
+            polling_interval_initialized = True
+        except Exception as e:
+            logger.error("Exception in reading polling interval from environment variable: {0}.".format(str(e)))
+
+    batch_size = get_property_value_from_env("batch_size", task_type)
+    if batch_size:
+        try:
+            worker.batch_size = int(batch_size)
+        except Exception as e:
+            logger.error(f'error reading and parsing the batch size value {batch_size}')
+
+    poll_timeout = get_property_value_from_env("poll_timeout", task_type)
+    if poll_timeout:
+        try:
+            worker.poll_timeout = int(poll_timeout)
+        except Exception as e:
+            logger.error(f'error reading and parsing the poll timeout value {poll_timeout}')
+
+    thread_count = get_property_value_from_env("thread_count", task_type)
+    if thread_count:
+        try:
+            worker.thread_count = int(thread_count)
+        except Exception as e:
+            logger.error(f'error reading and parsing the thread count value {thread_count}')
+
+    max_polling_interval = get_property_value_from_env("max_polling_interval", task_type)
+    if max_polling_interval:
+        try:
+            worker.max_poll_interval = float(max_polling_interval)
+        except Exception as e:
+            logger.error(f'error reading and parsing the max polling interval value {max_polling_interval}')
+
+    poll_jitter = get_property_value_from_env("poll_jitter", task_type)
+    if poll_jitter:
+        try:
+            worker.poll_jitter = float(poll_jitter)
+        except Exception as e:
+            logger.error(f'error reading and parsing the poll jitter value {poll_jitter}')
+
+    process_count = get_property_value_from_env("process_count", task_type)
+    if process_count:
+        try:
+            worker.process_count = int(process_count)
+        except Exception as e:
+            logger.error(f'error reading and parsing the process count value {process_count}')
+
+    process_group = get_property_value_from_env("process_group", task_type)
+    if process_group:
+        worker.process_group = process_group
+
+    lease_extend_enabled = get_property_value_from_env("lease_extend_enabled", task_type)
+    if lease_extend_enabled:
+        worker.lease_extend_enabled = lease_extend_enabled.lower() == 'true'
+
+
+def get_polling_interval_from_env(task_type: str) -> float:
+    """
+    get the polling interval in milliseconds of a single task type, as workers can poll for several task types
+    """
+    polling_interval = get_property_value_from_env("polling_interval", task_type)
+    if not polling_interval:
+        return None
+    try:
+        return float(polling_interval)
+    except Exception as e:
+        logger.error(f'error reading and parsing the polling interval value {polling_interval}')
+        return None
+
+
+def get_property_value_from_env(prop, task_type):
+    """
+    get the property from the env variable
+    e.g. conductor_worker_"prop" or conductor_worker_"task_type"_"prop"
+    """
+    prefix = "conductor_worker"
+    # Look for generic property in both case environment variables
+    key = prefix + "_" + prop
+    value_all = os.getenv(key, os.getenv(key.upper()))
+
+    # Look for task specific property in both case environment variables
+    key_small = prefix + "_" + task_type + "_" + prop
+    key_upper = prefix.upper() + "_" + task_type + "_" + prop.upper()
+    value = os.getenv(key_small, os.getenv(key_upper, value_all))
+    return value
@@ -1,5 +1,6 @@
 import dataclasses
 import datetime
+import functools
 import inspect
 import logging
 import typing
@@ -27,6 +28,36 @@ collection_types = {
 }
 
 
+def compile_argument_binder(function: typing.Callable) -> typing.Callable[[dict], dict]:
+    """
+    Inspects the parameters of a worker function once, and returns a function that maps the input data of a task to
+    the keyword arguments of the worker function, converting each value to the type the parameter is annotated with.
+    """
+    bindings = []
+    parameters = inspect.signature(function).parameters
+    for name in parameters:
+        typ = parameters[name].annotation
+        default_value = parameters[name].default
+        if default_value is inspect.Parameter.empty:
+            default_value = None
+        converter = None
+        if typ not in simple_types:
+            converter = functools.partial(convert_from_dict_or_list, typ)
+        bindings.append((name, converter, default_value))
+
+    def bind_arguments(input_data: dict) -> dict:
+        kwargs = {}
+        for name, converter, default_value in bindings:
+            if name in input_data:
+                value = input_data[name]
+                kwargs[name] = value if converter is None else converter(value)
+            else:
+                kwargs[name] = default_value
+        return kwargs
+
+    return bind_arguments
+
+
 def convert_from_dict_or_list(cls: type, data: typing.Union[dict, list]) -> object:
     is_list = type(data) in collection_types
     if is_list:
@@ -46,53 +77,33 @@ def convert_from_dict(cls: type, data: dict) -> object:
     if type(data) == cls:
         return data
 
-    if dataclasses.is_dataclass(cls):
+    if _is_dataclass(cls):
         return from_dict(data_class=cls, data=data)
 
-    typ = type(data)
-    if not ((str(typ).startswith('dict[') or
-             str(typ).startswith('typing.Dict[') or
-             str(typ).startswith('requests.structures.CaseInsensitiveDict[') or
-             typ == dict or str(typ).startswith('OrderedDict['))):
+    if _get_type_kind(type(data)) not in (_DICT, _ORDERED_DICT):
         data = {}
 
-    members = inspect.signature(cls.__init__).parameters
     kwargs = {}
 
-    for member in members:
-        if 'self' == member:
-            continue
-        typ = members[member].annotation
-        generic_types = typing.get_args(members[member].annotation)
-
-        if typ in simple_types:
+    for member, kind, typ, generic_type, default_value, is_var_keyword in _get_constructor_parameters(cls):
+        if kind == _SIMPLE:
             if member in data:
                 kwargs[member] = data[member]
             else:
-                kwargs[member] = members[member].default
-        elif str(typ).startswith('typing.List[') or str(typ).startswith('typing.Set[') or str(typ).startswith('list['):
+                kwargs[member] = default_value
+        elif kind == _LIST:
             values = []
-            generic_type = object
-            if len(generic_types) > 0:
-                generic_type = generic_types[0]
             for val in data[member]:
                 values.append(get_value(generic_type, val))
             kwargs[member] = values
-        elif (str(typ).startswith('dict[') or
-              str(typ).startswith('typing.Dict[') or
-              str(typ).startswith('requests.structures.CaseInsensitiveDict[') or
-              typ == dict or str(typ).startswith('OrderedDict[')):
-
+        elif kind == _DICT or kind == _ORDERED_DICT:
             values = {}
-            generic_type = object
-            if len(generic_types) > 1:
-                generic_type = generic_types[1]
             for k in data[member]:
                 v = data[member][k]
                 values[k] = get_value(generic_type, v)
             kwargs[member] = values
-        elif typ == inspect.Parameter.empty:
-            if inspect.Parameter.VAR_KEYWORD == members[member].kind:
+        elif kind == _EMPTY:
+            if is_var_keyword:
                 if type(data) in dict_types:
                     kwargs.update(data)
                 else:
@@ -107,16 +118,16 @@ def convert_from_dict(cls: type, data: dict) -> object:
 
 
 def get_value(typ: type, val: object) -> object:
-    if typ in simple_types:
+    kind = _get_type_kind(typ)
+    if kind == _SIMPLE:
         return val
-    elif str(typ).startswith('typing.List[') or str(typ).startswith('typing.Set[') or str(typ).startswith('list['):
+    elif kind == _LIST:
         values = []
         for val in val:
             converted = get_value(type(val), val)
             values.append(converted)
         return values
-    elif str(typ).startswith('dict[') or str(typ).startswith(
-            'typing.Dict[') or str(typ).startswith('requests.structures.CaseInsensitiveDict[') or typ == dict:
+    elif kind == _DICT:
         values = {}
         for k in val:
             v = val[k]
@@ -124,3 +135,87 @@ def get_value(typ: type, val: object) -> object:
         return values
     else:
         return convert_from_dict(typ, val)
+
+
+# Kinds of types, looked up once per type instead of on every conversion
+_SIMPLE = 'simple'
+_LIST = 'list'
+_DICT = 'dict'
+_ORDERED_DICT = 'ordered_dict'
+_EMPTY = 'empty'
+_OTHER = 'other'
+
+_type_kinds = {}
+_constructor_parameters = {}
+_dataclasses = {}
+
+
+def _get_type_kind(typ: type) -> str:
+    try:
+        return _type_kinds[typ]
+    except KeyError:
+        kind = _compute_type_kind(typ)
+        _type_kinds[typ] = kind
+        return kind
+    except TypeError:
+        # not hashable
+        return _compute_type_kind(typ)
+
+
+def _compute_type_kind(typ: type) -> str:
+    if typ in simple_types:
+        return _SIMPLE
+    name = str(typ)
+    if name.startswith('typing.List[') or name.startswith('typing.Set[') or name.startswith('list['):
+        return _LIST
+    if (name.startswith('dict[') or
+            name.startswith('typing.Dict[') or
+            name.startswith('requests.structures.CaseInsensitiveDict[') or
+            typ == dict):
+        return _DICT
+    if name.startswith('OrderedDict['):
+        return _ORDERED_DICT
+    if typ == inspect.Parameter.empty:
+        return _EMPTY
+    return _OTHER
+
+
+def _is_dataclass(cls: type) -> bool:
+    try:
+        return _dataclasses[cls]
+    except KeyError:
+        is_dataclass = dataclasses.is_dataclass(cls)
+        _dataclasses[cls] = is_dataclass
+        return is_dataclass
+    except TypeError:
+        return dataclasses.is_dataclass(cls)
+
+
+def _get_constructor_parameters(cls: type) -> list:
+    try:
+        return _constructor_parameters[cls]
+    except KeyError:
+        parameters = _compute_constructor_parameters(cls)
+        _constructor_parameters[cls] = parameters
+        return parameters
+    except TypeError:
+        return _compute_constructor_parameters(cls)
+
+
+def _compute_constructor_parameters(cls: type) -> list:
+    members = inspect.signature(cls.__init__).parameters
+    parameters = []
+    for member in members:
+        if 'self' == member:
+            continue
+        typ = members[member].annotation
+        kind = _get_type_kind(typ)
+        generic_types = typing.get_args(typ)
+        generic_type = object
+        if kind == _LIST and len(generic_types) > 0:
+            generic_type = generic_types[0]
+        elif (kind == _DICT or kind == _ORDERED_DICT) and len(generic_types) > 1:
+            generic_type = generic_types[1]
+        is_var_keyword = inspect.Parameter.VAR_KEYWORD == members[member].kind
+        parameters.append((member, kind, typ, generic_type, members[member].default, is_var_keyword))
+    return parameters
@@ -68,9 +68,73 @@ class Configuration:
         # Provide an alterative to requests.Session() for HTTP connection.
         self.http_connection = None
 
+        # HTTP connection pool: number of hosts with pooled connections, and
+        # the connections kept open per host.
+        self.http_pool_connections = 10
+        self.http_pool_maxsize = 10
+        # Set this to True to make requests wait for a pooled connection, instead
+        # of opening a connection that is closed after the request.
+        self.http_pool_block = False
+        # Retries of the idempotent requests
+        self.http_retry_count = 3
+        self.http_retry_backoff_factor = 2
+        self.http_retry_status_codes = [429, 500, 502, 503, 504]
+        self.http_retry_methods = ["HEAD", "GET", "OPTIONS", "DELETE"]
+        # Request timeouts in seconds: a number, or a (connect, read) tuple.
+        self.http_timeout = (120, 120)
+        # Timeouts of task polls, task updates and metadata requests, http_timeout
+        # is used when not set.  The read timeout of polls must be longer than the
+        # time the server holds batch polls.
+        self.poll_request_timeout = None
+        self.update_request_timeout = None
+        self.metadata_request_timeout = None
+
+        # Send task results to the server from background threads, instead of
+        # blocking the polling loop until the update succeeds.  The results not
+        # sent yet are lost if the process is killed, see TaskResultSender.flush.
+        self.task_update_in_background = False
+        # Maximum number of task results waiting to be sent, submitting more blocks
+        self.task_update_queue_size = 1000
+        # Number of times a failed task update is retried
+        self.task_update_retry_count = 3
+        # Delay before the first retry, doubled (with jitter) for every next one
+        self.task_update_backoff_seconds = 2
+        self.task_update_max_backoff_seconds = 30
+        # Number of threads sending the task results of a worker, its thread_count when None
+        self.task_update_thread_count = None
+        # How long to wait for pending task results to be sent when the worker stops
+        self.task_update_flush_timeout_seconds = 30
+
+        # TaskHandler restarts the worker processes that die, waiting this long
+        # before a restart, doubled for every next failure of the same worker.
+        self.process_restart_backoff_seconds = 1
+        self.process_max_restart_backoff_seconds = 60
+        # Replace a worker process after it has executed this many tasks, or when
+        # its resident memory exceeds this many MB, to contain leaks of the
+        # worker code.  Not enforced when not set.
+        self.process_max_tasks = None
+        self.process_max_memory_mb = None
+        # When stopped, e.g. on SIGTERM, a worker process stops polling and is
+        # given this long to finish its in-flight tasks and send their results,
+        # before being killed.
+        self.shutdown_timeout_seconds = 30
+
+        # Task outputs larger than this are uploaded to the external payload
+        # storage, and only their path is sent to the server.  Not offloaded
+        # when not set.
+        self.task_output_payload_threshold_kb = None
+
         # not updated yet
         self.token_update_time = 0
         self.auth_token_ttl_msec = auth_token_ttl_min * 60 * 1000
+        # Refresh the token in the background this long before it expires,
+        # at most half of its time to live.
+        self.auth_token_refresh_ahead_seconds = 60
+        # File where the processes using this configuration share the token.
+        self.auth_token_cache_file = None
+        # Share the token between the worker processes of a TaskHandler through
+        # a file readable only by the user, removed when the processes stop.
+        self.auth_token_shared_by_worker_processes = False
 
     @property
     def debug(self):
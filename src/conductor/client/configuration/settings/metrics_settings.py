@@ -1,6 +1,7 @@
 import logging
 import os
 from pathlib import Path
+from typing import Sequence
 
 from conductor.client.configuration.configuration import Configuration
 
@@ -11,6 +12,10 @@ logger = logging.getLogger(
 )
 
 
+# Upper bounds, in seconds, of the buckets of the latency histograms
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+
+
 def get_default_temporary_folder() -> str:
     return f'{str(Path.home())}/tmp/'
 
@@ -20,12 +25,22 @@ class MetricsSettings:
             self,
             directory: str = None,
             file_name: str = 'metrics.log',
-            update_interval: float = 0.1):
+            update_interval: float = 0.1,
+            latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+            http_port: int = None,
+            http_address: str = '0.0.0.0'):
+        """
+        :param update_interval: minimum time in seconds between two writes of the metrics file
+        :param http_port: serves the metrics on /metrics from this port, instead of writing them to the file
+        """
         if directory is None:
             directory = get_default_temporary_folder()
         self.__set_dir(directory)
         self.file_name = file_name
         self.update_interval = update_interval
+        self.latency_buckets = latency_buckets
+        self.http_port = http_port
+        self.http_address = http_address
 
     def __set_dir(self, dir: str) -> None:
         if not os.path.isdir(dir):
@@ -0,0 +1,122 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Optional
+
+from conductor.client.configuration.configuration import Configuration
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+# with refresh_ahead, a value read after this fraction of its time to live is reloaded in the background
+REFRESH_AHEAD_FRACTION = 0.8
+
+# called with the key and whether the value was cached, on each read
+AccessCallback = Callable[[Hashable, bool], None]
+
+
+class TtlCache:
+    """
+    Keeps up to `max_size` values for `ttl_seconds` each, evicting the least recently used one when full, from any
+    number of threads.  With `refresh_ahead`, a value read after REFRESH_AHEAD_FRACTION of its time to live is
+    returned and reloaded in the background, so that the values read regularly are never loaded on the caller thread
+    again.  A value loaded while the cache was being invalidated is not kept.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int = 1000, refresh_ahead: bool = False,
+                 on_access: Optional[AccessCallback] = None):
+        if ttl_seconds <= 0:
+            raise ValueError('ttl_seconds must be positive')
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.refresh_ahead = refresh_ahead
+        self.on_access = on_access
+        self.hits = 0
+        self.misses = 0
+        # key -> (value, load time), from the least to the most recently used
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        # incremented on each invalidation, so that the values loaded before it are not kept
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._refresh_executor = None
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Any], on_access: Optional[AccessCallback] = None) -> Any:
+        """
+        :param on_access: called like the `on_access` of the cache, for this read only
+        :return: the cached value of the key, or the value returned by `load`, which is then cached
+        """
+        now = time.monotonic()
+        refresh = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[1] >= self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                if self.refresh_ahead and key not in self._refreshing \
+                        and now - entry[1] >= self.ttl_seconds * REFRESH_AHEAD_FRACTION:
+                    self._refreshing.add(key)
+                    refresh = True
+            else:
+                self.misses += 1
+            generation = self._generation
+        if self.on_access is not None:
+            self.on_access(key, entry is not None)
+        if on_access is not None:
+            on_access(key, entry is not None)
+        if entry is None:
+            value = load()
+            self.__put(key, value, now, generation)
+            return value
+        if refresh:
+            self.__get_refresh_executor().submit(self.__refresh, key, load, generation)
+        return entry[0]
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> None:
+        """
+        Removes the values of the keys matching `predicate`, all the values when None.
+        """
+        with self._lock:
+            self._generation += 1
+            if predicate is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __put(self, key: Hashable, value: Any, load_time: float, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (value, load_time)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __refresh(self, key: Hashable, load: Callable[[], Any], generation: int) -> None:
+        try:
+            load_time = time.monotonic()
+            self.__put(key, load(), load_time, generation)
+        except Exception as e:
+            # the cached value is used until it expires
+            logger.warning(f'Failed to refresh the cached value of {key}, reason: {e}')
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def __get_refresh_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='conductor-cache')
+            return self._refresh_executor
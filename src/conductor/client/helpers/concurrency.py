@@ -0,0 +1,158 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence
+
+# matches the default size of the HTTP connection pool, see Configuration.http_pool_maxsize
+DEFAULT_CONCURRENCY = 10
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class PartialFailureError(Exception):
+    """
+    Raised when some of the calls made by `run_concurrently` failed.  `results` holds the results of all the calls, in
+    the order of the items, with the exception raised by each failed call in place of its result.
+    """
+
+    def __init__(self, results: List[Any]):
+        self.results = results
+        self.exceptions = [result for result in results if isinstance(result, Exception)]
+        super(PartialFailureError, self).__init__(
+            f'{len(self.exceptions)} of {len(results)} calls failed, first error: {self.exceptions[0]}'
+        )
+
+
+class RateLimiter:
+    """
+    Spaces out calls to `acquire`, from any number of threads, to at most `rate_per_second` per second.
+    """
+
+    def __init__(self, rate_per_second: float):
+        if rate_per_second <= 0:
+            raise ValueError('rate_per_second must be positive')
+        self.interval = 1 / rate_per_second
+        self._next_time = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+def run_concurrently(
+        function: Callable[[Any], Any],
+        items: Sequence[Any],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limit_per_second: Optional[float] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        return_exceptions: bool = False
+) -> List[Any]:
+    """
+    Calls `function` with each item, from up to `concurrency` threads.
+
+    :param rate_limit_per_second: maximum number of calls started per second, not limited when None
+    :param on_progress: called with the number of calls completed and the total number of calls, after each call
+    :param return_exceptions: when True, the exception raised by a call is returned in place of its result, otherwise
+                              a PartialFailureError holding all the results is raised once all the calls completed
+    :return: the results of the calls, in the order of the items
+    """
+    call = _limit_rate(function, rate_limit_per_second)
+    progress = _Progress(len(items), on_progress)
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix='conductor-bulk') as executor:
+        futures = []
+        for item in items:
+            future = executor.submit(call, item)
+            future.add_done_callback(progress.record)
+            futures.append(future)
+    return _get_results(futures, return_exceptions)
+
+
+async def run_concurrently_async(
+        function: Callable[[Any], Any],
+        items: Sequence[Any],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limit_per_second: Optional[float] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        return_exceptions: bool = False
+) -> List[Any]:
+    """
+    Same as `run_concurrently`, without blocking the event loop: the blocking calls are made from a thread pool, and
+    `on_progress` is called from the event loop.  When the coroutine is cancelled, the calls not started yet are not
+    made.
+    """
+    loop = asyncio.get_running_loop()
+    cancelled = threading.Event()
+    call = _limit_rate(_unless_cancelled(function, cancelled), rate_limit_per_second)
+    progress = _Progress(len(items), on_progress)
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix='conductor-bulk')
+    futures = []
+    try:
+        for item in items:
+            future = loop.run_in_executor(executor, call, item)
+            future.add_done_callback(progress.record)
+            futures.append(future)
+        if len(futures) > 0:
+            await asyncio.wait(futures)
+    except asyncio.CancelledError:
+        cancelled.set()
+        for future in futures:
+            future.cancel()
+        raise
+    finally:
+        executor.shutdown(wait=False)
+    return _get_results(futures, return_exceptions)
+
+
+class _Progress:
+    def __init__(self, total: int, on_progress: Optional[ProgressCallback]):
+        self.total = total
+        self.on_progress = on_progress
+        self._completed = 0
+        self._lock = threading.Lock()
+
+    def record(self, future) -> None:
+        if self.on_progress is None:
+            return
+        with self._lock:
+            self._completed += 1
+            self.on_progress(self._completed, self.total)
+
+
+def _unless_cancelled(function: Callable[[Any], Any], cancelled: threading.Event) -> Callable[[Any], Any]:
+    def call(item):
+        # the call may have been waiting for the rate limiter
+        if cancelled.is_set():
+            raise asyncio.CancelledError()
+        return function(item)
+
+    return call
+
+
+def _limit_rate(function: Callable[[Any], Any], rate_limit_per_second: Optional[float]) -> Callable[[Any], Any]:
+    if rate_limit_per_second is None:
+        return function
+    rate_limiter = RateLimiter(rate_limit_per_second)
+
+    def call(item):
+        rate_limiter.acquire()
+        return function(item)
+
+    return call
+
+
+def _get_results(futures: list, return_exceptions: bool) -> List[Any]:
+    results = []
+    failed = False
+    for future in futures:
+        exception = future.exception()
+        failed = failed or exception is not None
+        results.append(future.result() if exception is None else exception)
+    if failed and not return_exceptions:
+        raise PartialFailureError(results)
+    return results
@@ -0,0 +1,30 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# returns the items of the page at the given position, and the position of the next page, None after the last page
+PageFetcher = Callable[[Any], Tuple[List[T], Optional[Any]]]
+
+
+def iter_pages(fetch_page: PageFetcher, first_page: Any, prefetch: bool = True) -> Iterator[T]:
+    """
+    Yields the items of all the pages, one at a time.  With `prefetch`, the next page is fetched from a background
+    thread while the items of the current one are consumed, so at most two pages are held in memory.
+    """
+    if not prefetch:
+        page = first_page
+        while page is not None:
+            items, page = fetch_page(page)
+            yield from items
+        return
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='conductor-prefetch')
+    try:
+        next_page = executor.submit(fetch_page, first_page)
+        while next_page is not None:
+            items, page = next_page.result()
+            next_page = executor.submit(fetch_page, page) if page is not None else None
+            yield from items
+    finally:
+        # the generator was exhausted, or closed by the caller
+        executor.shutdown(wait=False)
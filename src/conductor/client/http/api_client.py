@@ -15,9 +15,13 @@ from six.moves.urllib.parse import quote
 
 import conductor.client.http.models as http_models
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http import json_codec
 from conductor.client.http import rest
 from conductor.client.http.rest import AuthorizationException
 from conductor.client.http.thread import AwaitableThread
+from conductor.client.http.token_manager import get_token_manager
+from conductor.client.telemetry import task_listener
+from conductor.client.telemetry.model.task_phase import TaskPhase
 
 logger = logging.getLogger(
     Configuration.get_logging_formatted_name(
@@ -38,19 +42,35 @@ class ApiClient(object):
         'datetime': datetime.datetime,
         'object': object,
     }
+    TASK_UPDATE_PATHS = {
+        '/tasks',
+        '/tasks/{workflowId}/{taskRefName}/{status}',
+        '/tasks/{workflowId}/{taskRefName}/{status}/sync',
+    }
+    # Types returned as they are when sanitized for serialization
+    JSON_NATIVE_TYPES = (str, int, float, bool, type(None))
+    # Deserializers compiled per response type, shared by all the clients
+    __deserializers = {}
+    # (attribute, json key) of the swagger types of each model, shared by all the clients
+    __model_fields = {}
 
     def __init__(
             self,
             configuration=None,
             header_name=None,
             header_value=None,
-            cookie=None
+            cookie=None,
+            metrics_collector=None
     ):
         if configuration is None:
             configuration = Configuration()
         self.configuration = configuration
 
-        self.rest_client = rest.RESTClientObject(connection=configuration.http_connection)
+        self.rest_client = rest.RESTClientObject(
+            connection=configuration.http_connection,
+            configuration=configuration,
+            metrics_collector=metrics_collector
+        )
 
         self.default_headers = self.__get_default_headers(
             header_name, header_value
@@ -65,6 +85,7 @@ class ApiClient(object):
             files=None, response_type=None, auth_settings=None,
             _return_http_data_only=None, collection_formats=None,
             _preload_content=True, _request_timeout=None):
+        token_update_time = self.configuration.token_update_time
         try:
             return self.__call_api_no_retry(
                 resource_path=resource_path, method=method, path_params=path_params,
@@ -74,11 +95,11 @@ class ApiClient(object):
                 _preload_content=_preload_content, _request_timeout=_request_timeout
             )
         except AuthorizationException as ae:
-            if ae.token_expired:
+            if ae.token_expired and resource_path != '/token':
                 logger.error(
                     f'authentication token has expired, refreshing the token.  request= {method} {resource_path}')
                 # if the token has expired, lets refresh the token
-                self.__force_refresh_auth_token()
+                self.__force_refresh_auth_token(token_update_time)
                 # and now retry the same request
                 return self.__call_api_no_retry(
                     resource_path=resource_path, method=method, path_params=path_params,
@@ -98,6 +119,9 @@ class ApiClient(object):
 
         config = self.configuration
 
+        if _request_timeout is None:
+            _request_timeout = self.__get_request_timeout(resource_path, method)
+
         # header parameters
         header_params = header_params or {}
         header_params.update(self.default_headers)
@@ -145,7 +169,12 @@ class ApiClient(object):
 
         # body
         if body:
-            body = self.sanitize_for_serialization(body)
+            if task_listener.is_recording_phases():
+                start_time = time.perf_counter()
+                body = self.sanitize_for_serialization(body)
+                task_listener.record_phase(TaskPhase.SERIALIZE, start_time)
+            else:
+                body = self.sanitize_for_serialization(body)
 
         # request url
         url = self.configuration.host + resource_path
@@ -162,7 +191,11 @@ class ApiClient(object):
         return_data = response_data
         if _preload_content:
             # deserialize response data
-            if response_type:
+            if response_type and task_listener.is_recording_phases():
+                start_time = time.perf_counter()
+                return_data = self.deserialize(response_data, response_type)
+                task_listener.record_phase(TaskPhase.DESERIALIZE, start_time)
+            elif response_type:
                 return_data = self.deserialize(response_data, response_type)
             else:
                 return_data = None
@@ -173,6 +206,24 @@ class ApiClient(object):
             return (return_data, response_data.status,
                     response_data.getheaders())
 
+    def __get_request_timeout(self, resource_path, method):
+        """Returns the timeout configured for the kind of request.
+
+        :param resource_path: path of the endpoint, before replacing its path parameters.
+        :param method: http request method.
+        """
+        config = self.configuration
+        timeout = None
+        if resource_path.startswith('/tasks/poll/'):
+            timeout = config.poll_request_timeout
+        elif method == 'POST' and resource_path in self.TASK_UPDATE_PATHS:
+            timeout = config.update_request_timeout
+        elif resource_path.startswith('/metadata/'):
+            timeout = config.metadata_request_timeout
+        if timeout is None:
+            timeout = config.http_timeout
+        return timeout
+
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
 
@@ -187,8 +238,13 @@ class ApiClient(object):
         :param obj: The data to serialize.
         :return: The serialized form of data.
         """
-        if obj is None:
-            return None
+        obj_type = type(obj)
+        if obj_type in self.JSON_NATIVE_TYPES:
+            return obj
+        elif obj_type is dict:
+            return self.__sanitize_dict(obj)
+        elif obj_type is list:
+            return self.__sanitize_list(obj)
         elif isinstance(obj, self.PRIMITIVE_TYPES):
             return obj
         elif isinstance(obj, list):
@@ -211,9 +267,11 @@ class ApiClient(object):
             # Convert attribute name to json key in
             # model definition for request.
             if hasattr(obj, 'attribute_map') and hasattr(obj, 'swagger_types'):
-                obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
-                            for attr, _ in six.iteritems(obj.swagger_types)
-                            if getattr(obj, attr) is not None}
+                obj_dict = {}
+                for attr, key in self.__get_model_fields(obj):
+                    value = getattr(obj, attr)
+                    if value is not None:
+                        obj_dict[key] = value
             else:
                 try:
                     obj_dict = {name: getattr(obj, name)
@@ -226,6 +284,50 @@ class ApiClient(object):
         return {key: self.sanitize_for_serialization(val)
                 for key, val in six.iteritems(obj_dict)}
 
+    def __sanitize_dict(self, obj):
+        """Sanitizes the values of a plain dict.
+
+        The dict is only copied if one of its values had to be converted,
+        so plain JSON payloads are returned as they are.
+        """
+        sanitized = None
+        json_native_types = self.JSON_NATIVE_TYPES
+        for key, value in obj.items():
+            if type(value) in json_native_types:
+                continue
+            sanitized_value = self.sanitize_for_serialization(value)
+            if sanitized_value is not value:
+                if sanitized is None:
+                    sanitized = dict(obj)
+                sanitized[key] = sanitized_value
+        return obj if sanitized is None else sanitized
+
+    def __sanitize_list(self, obj):
+        """Sanitizes the items of a plain list, copying it only if needed."""
+        sanitized = None
+        json_native_types = self.JSON_NATIVE_TYPES
+        for index, value in enumerate(obj):
+            if type(value) in json_native_types:
+                continue
+            sanitized_value = self.sanitize_for_serialization(value)
+            if sanitized_value is not value:
+                if sanitized is None:
+                    sanitized = list(obj)
+                sanitized[index] = sanitized_value
+        return obj if sanitized is None else sanitized
+
+    def __get_model_fields(self, obj):
+        model_type = type(obj)
+        # only models declaring their swagger types on the class are cached
+        is_cacheable = obj.swagger_types is getattr(model_type, 'swagger_types', None)
+        fields = ApiClient.__model_fields.get(model_type) if is_cacheable else None
+        if fields is None:
+            fields = [(attr, obj.attribute_map[attr])
+                      for attr, _ in six.iteritems(obj.swagger_types)]
+            if is_cacheable:
+                ApiClient.__model_fields[model_type] = fields
+        return fields
+
     def deserialize(self, response, response_type):
         """Deserializes response into an object.
 
@@ -242,7 +344,7 @@ class ApiClient(object):
 
         # fetch data from response object
         try:
-            data = response.resp.json()
+            data = json_codec.loads(response.resp.content)
         except Exception:
             data = response.resp.text
 
@@ -266,21 +368,44 @@ class ApiClient(object):
         if data is None:
             return None
 
+        return self.__get_deserializer(klass)(self, data)
+
+    def __get_deserializer(self, klass):
+        """Returns the deserializer of a type, compiled on first use.
+
+        :param klass: class literal, or string of class name.
+        :return: function deserializing data with the given client.
+        """
+        deserializer = ApiClient.__deserializers.get(klass)
+        if deserializer is None:
+            deserializer = self.__compile_deserializer(klass)
+            ApiClient.__deserializers[klass] = deserializer
+        return deserializer
+
+    def __compile_deserializer(self, klass):
+        """Parses a type once into a function deserializing data into it.
+
+        The deserializers of nested types are looked up when called, as
+        models can reference themselves.
+
+        :param klass: class literal, or string of class name.
+        :return: function deserializing data with the given client.
+        """
         if type(klass) == str:
             if klass.startswith('list['):
                 sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
+                return lambda api_client, data: [api_client.__deserialize(sub_data, sub_kls)
+                                                 for sub_data in data]
 
             if klass.startswith('set['):
                 sub_kls = re.match(r'set\[(.*)\]', klass).group(1)
-                return set(self.__deserialize(sub_data, sub_kls)
-                           for sub_data in data)
+                return lambda api_client, data: set(api_client.__deserialize(sub_data, sub_kls)
+                                                    for sub_data in data)
 
             if klass.startswith('dict('):
                 sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in six.iteritems(data)}
+                return lambda api_client, data: {k: api_client.__deserialize(v, sub_kls)
+                                                 for k, v in six.iteritems(data)}
 
             # convert str to class
             if klass in self.NATIVE_TYPES_MAPPING:
@@ -289,15 +414,15 @@ class ApiClient(object):
                 klass = getattr(http_models, klass)
 
         if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+            return lambda api_client, data: api_client.__deserialize_primitive(data, klass)
         elif klass == object:
-            return self.__deserialize_object(data)
+            return lambda api_client, data: api_client.__deserialize_object(data)
         elif klass == datetime.date:
-            return self.__deserialize_date(data)
+            return lambda api_client, data: api_client.__deserialize_date(data)
         elif klass == datetime.datetime:
-            return self.__deserialize_datatime(data)
+            return lambda api_client, data: api_client.__deserialize_datatime(data)
         else:
-            return self.__deserialize_model(data, klass)
+            return self.__compile_model_deserializer(klass)
 
     def call_api(self, resource_path, method,
                  path_params=None, query_params=None, header_params=None,
@@ -627,55 +752,65 @@ class ApiClient(object):
     def __hasattr(self, object, name):
         return name in object.__class__.__dict__
 
-    def __deserialize_model(self, data, klass):
+    def __compile_model_deserializer(self, klass):
+        """Compiles the deserializer of a model from its swagger types.
+
+        :param klass: class literal.
+        :return: function deserializing a list or dict into a model object.
+        """
+        if not klass.swagger_types and not self.__hasattr(klass, 'get_real_child_model'):
+            return lambda api_client, data: data
+
+        fields = None
+        if klass.swagger_types is not None:
+            fields = [(attr, klass.attribute_map[attr], attr_type)
+                      for attr, attr_type in six.iteritems(klass.swagger_types)]
+        keeps_unknown_keys = issubclass(klass, dict) and klass.swagger_types is not None
+        has_real_child_model = 'get_real_child_model' in klass.__dict__
+
+        def deserialize_model(api_client, data):
+            return api_client.__deserialize_model(data, klass, fields, keeps_unknown_keys, has_real_child_model)
+
+        return deserialize_model
+
+    def __deserialize_model(self, data, klass, fields, keeps_unknown_keys, has_real_child_model):
         """Deserializes list or dict to model.
 
         :param data: dict, list.
         :param klass: class literal.
+        :param fields: (attribute, json key, type) of each swagger type.
         :return: model object.
         """
-        if not klass.swagger_types and not self.__hasattr(klass, 'get_real_child_model'):
-            return data
-
         kwargs = {}
-        if klass.swagger_types is not None:
-            for attr, attr_type in six.iteritems(klass.swagger_types):
+        if fields is not None:
+            for attr, key, attr_type in fields:
                 if (data is not None and
-                        klass.attribute_map[attr] in data and
+                        key in data and
                         isinstance(data, (list, dict))):
-                    value = data[klass.attribute_map[attr]]
+                    value = data[key]
                     kwargs[attr] = self.__deserialize(value, attr_type)
 
         instance = klass(**kwargs)
 
-        if (isinstance(instance, dict) and
-                klass.swagger_types is not None and
-                isinstance(data, dict)):
+        if keeps_unknown_keys and isinstance(data, dict):
             for key, value in data.items():
                 if key not in klass.swagger_types:
                     instance[key] = value
-        if self.__hasattr(instance, 'get_real_child_model'):
+        if has_real_child_model:
             klass_name = instance.get_real_child_model(data)
             if klass_name:
                 instance = self.__deserialize(data, klass_name)
         return instance
 
     def __get_authentication_headers(self):
-        if self.configuration.AUTH_TOKEN is None:
+        # refreshed by the token manager when expiring, once for all the threads
+        token = get_token_manager(self.configuration).get_token(self.__get_new_token)
+        if token is None:
             return None
 
-        now = round(time.time() * 1000)
-        time_since_last_update = now - self.configuration.token_update_time
-
-        if time_since_last_update > self.configuration.auth_token_ttl_msec:
-            # time to refresh the token
-            logger.debug(f'refreshing authentication token')
-            token = self.__get_new_token()
-            self.configuration.update_token(token)
-
         return {
             'header': {
-                'X-Authorization': self.configuration.AUTH_TOKEN
+                'X-Authorization': token
             }
         }
 
@@ -684,17 +819,16 @@ class ApiClient(object):
             return
         if self.configuration.authentication_settings is None:
             return
-        token = self.__get_new_token()
-        self.configuration.update_token(token)
+        get_token_manager(self.configuration).refresh(self.__get_new_token)
 
-    def __force_refresh_auth_token(self) -> None:
+    def __force_refresh_auth_token(self, seen_update_time: int = None) -> None:
         """
-        Forces the token refresh.  Unlike the __refresh_auth_token method above
+        Forces the token refresh.  Unlike the __refresh_auth_token method above, the token is refreshed even if set,
+        unless another thread has already refreshed it since `seen_update_time`.
         """
         if self.configuration.authentication_settings is None:
             return
-        token = self.__get_new_token()
-        self.configuration.update_token(token)
+        get_token_manager(self.configuration).refresh(self.__get_new_token, seen_update_time)
 
     def __get_new_token(self) -> str:
         try:
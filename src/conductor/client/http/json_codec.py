@@ -0,0 +1,64 @@
+import json
+import math
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def is_orjson_enabled() -> bool:
+    return orjson is not None
+
+
+def dumps(obj) -> bytes:
+    """Encodes an object, already sanitized for serialization, to JSON.
+
+    orjson is used when it is installed; the standard library is used
+    otherwise, or for the values orjson doesn't support, e.g. integers
+    larger than 64 bits.  Either way, NaN and infinite floats are encoded
+    as null, as they are not valid JSON.
+
+    :param obj: dict, list, str, int, float, bool or None.
+    :return: the UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    try:
+        return json.dumps(obj, allow_nan=False).encode('utf-8')
+    except ValueError:
+        # like orjson
+        return json.dumps(_replace_non_finite_floats(obj)).encode('utf-8')
+
+
+def _replace_non_finite_floats(obj):
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite_floats(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite_floats(value) for value in obj]
+    return obj
+
+
+def loads(data):
+    """Decodes a JSON document.
+
+    orjson is used when it is installed; the standard library is used
+    otherwise, or for the documents orjson rejects, e.g. with NaN values.
+
+    :param data: bytes or str.
+    :return: the decoded object.
+    :raises ValueError: if the document is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    return json.loads(data)
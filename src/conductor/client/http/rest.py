@@ -7,6 +7,8 @@ from requests.adapters import HTTPAdapter
 from six.moves.urllib.parse import urlencode
 from urllib3 import Retry
 
+from conductor.client.http import json_codec
+
 
 class RESTResponse(io.IOBase):
 
@@ -20,17 +22,87 @@ class RESTResponse(io.IOBase):
         return self.headers
 
 
+class PoolMetricsHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter reporting how many connections are taken out of its urllib3 pools, one per host, and each time a
+    request finds no free connection in the pool of its host.
+    """
+
+    def __init__(self, metrics_collector=None, **kwargs):
+        self.metrics_collector = metrics_collector
+        super(PoolMetricsHTTPAdapter, self).__init__(**kwargs)
+
+    @property
+    def connections_in_use(self):
+        """Connections taken out of the pools of all the hosts, not counting the ones opened beyond pool_maxsize."""
+        connections_in_use = 0
+        for pool_manager in [self.poolmanager] + list(self.proxy_manager.values()):
+            for key in pool_manager.pools.keys():
+                pool = pool_manager.pools.get(key)
+                if pool is not None and pool.pool is not None:
+                    connections_in_use += pool.pool.maxsize - pool.pool.qsize()
+        return connections_in_use
+
+    def get_connection_with_tls_context(self, *args, **kwargs):
+        # used by send since requests 2.32
+        return self.__check_pool(
+            super(PoolMetricsHTTPAdapter, self).get_connection_with_tls_context(*args, **kwargs)
+        )
+
+    def get_connection(self, *args, **kwargs):
+        return self.__check_pool(super(PoolMetricsHTTPAdapter, self).get_connection(*args, **kwargs))
+
+    def send(self, request, **kwargs):
+        try:
+            return super(PoolMetricsHTTPAdapter, self).send(request, **kwargs)
+        finally:
+            self.__record_connections_in_use()
+
+    def __check_pool(self, pool):
+        if self.metrics_collector is not None:
+            if pool.pool is not None and pool.pool.empty():
+                # the request waits for a connection with pool_block, or opens one closed afterwards
+                self.metrics_collector.increment_http_pool_exhausted()
+            self.__record_connections_in_use()
+        return pool
+
+    def __record_connections_in_use(self):
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_http_connections_in_use(self.connections_in_use)
+
+
 class RESTClientObject(object):
-    def __init__(self, connection=None):
+    def __init__(self, connection=None, configuration=None, metrics_collector=None):
         self.connection = connection or requests.Session()
+        self.timeout = (120, 120)
+        pool_connections = 10
+        pool_maxsize = 10
+        pool_block = False
         retry_strategy = Retry(
             total=3,
             backoff_factor=2,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS", "DELETE"],  # all the methods that are supposed to be idempotent
         )
-        self.connection.mount("https://", HTTPAdapter(max_retries=retry_strategy))
-        self.connection.mount("http://", HTTPAdapter(max_retries=retry_strategy))
+        if configuration is not None:
+            self.timeout = configuration.http_timeout
+            pool_connections = configuration.http_pool_connections
+            pool_maxsize = configuration.http_pool_maxsize
+            pool_block = configuration.http_pool_block
+            retry_strategy = Retry(
+                total=configuration.http_retry_count,
+                backoff_factor=configuration.http_retry_backoff_factor,
+                status_forcelist=configuration.http_retry_status_codes,
+                allowed_methods=configuration.http_retry_methods,
+            )
+        for prefix in ["https://", "http://"]:
+            self.connection.mount(prefix, PoolMetricsHTTPAdapter(
+                metrics_collector=metrics_collector,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                max_retries=retry_strategy
+            ))
 
     def request(self, method, url, query_params=None, headers=None,
                 body=None, post_params=None, _preload_content=True,
@@ -65,7 +137,7 @@ class RESTClientObject(object):
         post_params = post_params or {}
         headers = headers or {}
 
-        timeout = _request_timeout if _request_timeout is not None else (120, 120)
+        timeout = _request_timeout if _request_timeout is not None else self.timeout
 
         if 'Content-Type' not in headers:
             headers['Content-Type'] = 'application/json'
@@ -77,10 +149,13 @@ class RESTClientObject(object):
                     url += '?' + urlencode(query_params)
                 if re.search('json', headers['Content-Type'], re.IGNORECASE) or isinstance(body, str):
                     request_body = '{}'
-                    if body is not None:
-                        request_body = json.dumps(body)
-                        if isinstance(body, str):
-                            request_body = request_body.strip('"')
+                    if isinstance(body, str):
+                        request_body = json.dumps(body).strip('"')
+                    elif isinstance(body, bytes):
+                        # already encoded
+                        request_body = body
+                    elif body is not None:
+                        request_body = json_codec.dumps(body)
                     r = self.connection.request(
                         method, url,
                         data=request_body,
@@ -0,0 +1,208 @@
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import Callable, Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from conductor.client.configuration.configuration import Configuration
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+# minimum time between two background refreshes, so that a failing refresh is not retried on every request
+_BACKGROUND_REFRESH_RETRY_MSEC = 10 * 1000
+
+_token_managers = weakref.WeakKeyDictionary()
+_token_managers_lock = threading.Lock()
+
+
+def get_token_manager(configuration: Configuration) -> 'TokenManager':
+    """
+    :return: the token manager shared by all the clients of the configuration in this process
+    """
+    token_manager = _token_managers.get(configuration)
+    if token_manager is None:
+        with _token_managers_lock:
+            token_manager = _token_managers.get(configuration)
+            if token_manager is None:
+                token_manager = TokenManager(configuration)
+                _token_managers[configuration] = token_manager
+    return token_manager
+
+
+def _reset_token_managers() -> None:
+    # the locks of the parent process may have been held by one of its other threads when forking
+    global _token_managers, _token_managers_lock
+    _token_managers = weakref.WeakKeyDictionary()
+    _token_managers_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_token_managers)
+
+
+def _now_msec() -> int:
+    return round(time.time() * 1000)
+
+
+class TokenManager:
+    """
+    Keeps the authentication token of a configuration up to date.
+
+    Refreshes are single-flight: when the token has expired, one thread fetches a new one and the others wait for it
+    instead of requesting their own.  Shortly before the token expires it is refreshed by a background thread, so that
+    requests don't wait for it.
+
+    When the configuration has an `auth_token_cache_file`, the token is also shared through that file by all the
+    processes using it, e.g. the worker processes of a `TaskHandler`: only the first process to find the token expired
+    requests a new one, the others read it from the file.
+    """
+
+    def __init__(self, configuration: Configuration):
+        self.configuration = configuration
+        self._lock = threading.Lock()
+        self._background_lock = threading.Lock()
+        self._refreshing_in_background = False
+        self._next_background_refresh_time = 0
+
+    def get_token(self, fetch_token: Callable[[], Optional[str]]) -> Optional[str]:
+        """
+        :param fetch_token: requests a new token from the server, returns None when it fails
+        :return: the current token, None when not authenticated
+        """
+        configuration = self.configuration
+        token = configuration.AUTH_TOKEN
+        if token is None:
+            return None
+        token_update_time = configuration.token_update_time
+        token_age = _now_msec() - token_update_time
+        if token_age > configuration.auth_token_ttl_msec:
+            return self.refresh(fetch_token, token_update_time)
+        if token_age > configuration.auth_token_ttl_msec - self.__get_refresh_ahead_msec():
+            self.__refresh_in_background(fetch_token, token_update_time)
+        return token
+
+    def refresh(self, fetch_token: Callable[[], Optional[str]], seen_update_time: int = None) -> Optional[str]:
+        """
+        Gets a new token, unless the token has been refreshed since `seen_update_time` by another thread, or another
+        process sharing the cache file.
+
+        :param seen_update_time: update time of the token found stale, in milliseconds
+        :return: the current token
+        """
+        configuration = self.configuration
+        if seen_update_time is None:
+            seen_update_time = configuration.token_update_time
+        with self._lock:
+            if configuration.token_update_time > seen_update_time:
+                return configuration.AUTH_TOKEN
+            if configuration.auth_token_cache_file is None:
+                self.__fetch_token(fetch_token)
+            else:
+                self.__refresh_with_cache_file(fetch_token, seen_update_time)
+            return configuration.AUTH_TOKEN
+
+    def __refresh_with_cache_file(self, fetch_token: Callable[[], Optional[str]], seen_update_time: int) -> None:
+        configuration = self.configuration
+        try:
+            fd = os.open(configuration.auth_token_cache_file, os.O_RDWR | os.O_CREAT, 0o600)
+        except OSError as e:
+            logger.warning(f'Failed to open the token cache file {configuration.auth_token_cache_file}, reason: {e}')
+            self.__fetch_token(fetch_token)
+            return
+        with os.fdopen(fd, 'r+') as cache_file:
+            if fcntl is not None:
+                # held until the file is closed, so that only one process requests a new token
+                fcntl.flock(cache_file, fcntl.LOCK_EX)
+            cached = self.__read_cached_token(cache_file)
+            if cached is not None and seen_update_time < cached['updateTime'] \
+                    and _now_msec() - cached['updateTime'] <= configuration.auth_token_ttl_msec:
+                configuration.AUTH_TOKEN = cached['token']
+                configuration.token_update_time = cached['updateTime']
+                logger.debug('using the authentication token refreshed by another process')
+                return
+            if self.__fetch_token(fetch_token):
+                self.__write_cached_token(cache_file)
+
+    def __fetch_token(self, fetch_token: Callable[[], Optional[str]]) -> bool:
+        logger.debug('refreshing authentication token')
+        token = fetch_token()
+        if token is None:
+            # keep the current token, it may still be accepted and the next request will try again
+            return False
+        self.configuration.update_token(token)
+        return True
+
+    def __read_cached_token(self, cache_file) -> Optional[dict]:
+        try:
+            cache_file.seek(0)
+            content = cache_file.read()
+            if content == '':
+                return None
+            cached = json.loads(content)
+        except ValueError as e:
+            logger.warning(f'Ignoring the invalid token cache file, reason: {e}')
+            return None
+        if cached.get('host') != self.configuration.host or cached.get('keyId') != self.__get_key_id():
+            return None
+        return cached
+
+    def __write_cached_token(self, cache_file) -> None:
+        cache_file.seek(0)
+        cache_file.truncate()
+        json.dump(
+            {
+                'host': self.configuration.host,
+                'keyId': self.__get_key_id(),
+                'token': self.configuration.AUTH_TOKEN,
+                'updateTime': self.configuration.token_update_time
+            },
+            cache_file
+        )
+        cache_file.flush()
+
+    def __refresh_in_background(self, fetch_token: Callable[[], Optional[str]], seen_update_time: int) -> None:
+        if self._refreshing_in_background or _now_msec() < self._next_background_refresh_time:
+            return
+        with self._background_lock:
+            if self._refreshing_in_background:
+                return
+            self._refreshing_in_background = True
+            self._next_background_refresh_time = _now_msec() + _BACKGROUND_REFRESH_RETRY_MSEC
+        thread = threading.Thread(
+            target=self.__run_background_refresh,
+            args=(fetch_token, seen_update_time),
+            name='auth-token-refresh',
+            daemon=True
+        )
+        thread.start()
+
+    def __run_background_refresh(self, fetch_token: Callable[[], Optional[str]], seen_update_time: int) -> None:
+        try:
+            self.refresh(fetch_token, seen_update_time)
+        except Exception as e:
+            logger.warning(f'Failed to refresh the authentication token in background, reason: {e}')
+        finally:
+            self._refreshing_in_background = False
+
+    def __get_refresh_ahead_msec(self) -> float:
+        # never refresh during the first half of the token's lifetime
+        return min(
+            self.configuration.auth_token_refresh_ahead_seconds * 1000,
+            self.configuration.auth_token_ttl_msec / 2
+        )
+
+    def __get_key_id(self) -> Optional[str]:
+        if self.configuration.authentication_settings is None:
+            return None
+        return self.configuration.authentication_settings.key_id
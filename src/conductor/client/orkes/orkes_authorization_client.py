@@ -2,6 +2,7 @@ from typing import Dict, List, Optional
 
 from conductor.client.authorization_client import AuthorizationClient
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.authorization_request import AuthorizationRequest
 from conductor.client.http.models.conductor_application import ConductorApplication
 from conductor.client.http.models.conductor_user import ConductorUser
@@ -20,8 +21,8 @@ from conductor.client.orkes.orkes_base_client import OrkesBaseClient
 
 
 class OrkesAuthorizationClient(OrkesBaseClient, AuthorizationClient):
-    def __init__(self, configuration: Configuration):
-        super(OrkesAuthorizationClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: ApiClient = None):
+        super(OrkesAuthorizationClient, self).__init__(configuration, api_client)
 
     # Applications
     def create_application(
@@ -13,28 +13,52 @@ from conductor.client.http.api.secret_resource_api import SecretResourceApi
 from conductor.client.http.api.service_registry_resource_api import ServiceRegistryResourceApi
 from conductor.client.http.api.task_resource_api import TaskResourceApi
 from conductor.client.http.api.user_resource_api import UserResourceApi
+from conductor.client.http.api.workflow_bulk_resource_api import WorkflowBulkResourceApi
 from conductor.client.http.api.workflow_resource_api import WorkflowResourceApi
 from conductor.client.http.api_client import ApiClient
 from conductor.client.orkes.api.tags_api import TagsApi
 
 
+class _LazyResourceApi(object):
+    """Creates a resource API on first access, and keeps it on the client."""
+
+    def __init__(self, api_class):
+        self.api_class = api_class
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return instance.__dict__.setdefault(self.name, self.api_class(instance.api_client))
+
+
 class OrkesBaseClient(object):
-    def __init__(self, configuration: Configuration):
-        self.api_client = ApiClient(configuration)
+    metadataResourceApi = _LazyResourceApi(MetadataResourceApi)
+    taskResourceApi = _LazyResourceApi(TaskResourceApi)
+    workflowResourceApi = _LazyResourceApi(WorkflowResourceApi)
+    workflowBulkResourceApi = _LazyResourceApi(WorkflowBulkResourceApi)
+    applicationResourceApi = _LazyResourceApi(ApplicationResourceApi)
+    secretResourceApi = _LazyResourceApi(SecretResourceApi)
+    userResourceApi = _LazyResourceApi(UserResourceApi)
+    groupResourceApi = _LazyResourceApi(GroupResourceApi)
+    authorizationResourceApi = _LazyResourceApi(AuthorizationResourceApi)
+    schedulerResourceApi = _LazyResourceApi(SchedulerResourceApi)
+    tagsApi = _LazyResourceApi(TagsApi)
+    integrationApi = _LazyResourceApi(IntegrationResourceApi)
+    promptApi = _LazyResourceApi(PromptResourceApi)
+    schemaApi = _LazyResourceApi(SchemaResourceApi)
+    serviceRegistryResourceApi = _LazyResourceApi(ServiceRegistryResourceApi)
+
+    def __init__(self, configuration: Configuration, api_client: ApiClient = None):
+        """
+        :param api_client: shared by the clients created with OrkesClients, a new one is created when not given
+        """
+        if api_client is None:
+            api_client = ApiClient(configuration)
+        self.api_client = api_client
         self.logger = logging.getLogger(
             Configuration.get_logging_formatted_name(__name__)
         )
-        self.metadataResourceApi = MetadataResourceApi(self.api_client)
-        self.taskResourceApi = TaskResourceApi(self.api_client)
-        self.workflowResourceApi = WorkflowResourceApi(self.api_client)
-        self.applicationResourceApi = ApplicationResourceApi(self.api_client)
-        self.secretResourceApi = SecretResourceApi(self.api_client)
-        self.userResourceApi = UserResourceApi(self.api_client)
-        self.groupResourceApi = GroupResourceApi(self.api_client)
-        self.authorizationResourceApi = AuthorizationResourceApi(self.api_client)
-        self.schedulerResourceApi = SchedulerResourceApi(self.api_client)
-        self.tagsApi = TagsApi(self.api_client)
-        self.integrationApi = IntegrationResourceApi(self.api_client)
-        self.promptApi = PromptResourceApi(self.api_client)
-        self.schemaApi = SchemaResourceApi(self.api_client)
-        self.serviceRegistryResourceApi = ServiceRegistryResourceApi(self.api_client)
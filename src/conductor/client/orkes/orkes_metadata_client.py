@@ -1,6 +1,9 @@
-from typing import Optional, List
+import copy
+from typing import Any, Callable, Hashable, Optional, List
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.helpers.cache import TtlCache
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.tag_string import TagString
 from conductor.client.http.models.task_def import TaskDef
 from conductor.client.http.models.workflow_def import WorkflowDef
@@ -8,47 +11,85 @@ from conductor.client.metadata_client import MetadataClient
 from conductor.client.orkes.models.metadata_tag import MetadataTag
 from conductor.client.orkes.models.ratelimit_tag import RateLimitTag
 from conductor.client.orkes.orkes_base_client import OrkesBaseClient
+from conductor.client.telemetry.metrics_collector import MetricsCollector
+
+# the first element of the keys of the cached definitions
+_WORKFLOW_DEF = 'workflow_def'
+_WORKFLOW_DEFS = 'workflow_defs'
+_TASK_DEF = 'task_def'
+_TASK_DEFS = 'task_defs'
 
 
 class OrkesMetadataClient(OrkesBaseClient, MetadataClient):
-    def __init__(self, configuration: Configuration):
-        super(OrkesMetadataClient, self).__init__(configuration)
+    def __init__(
+            self,
+            configuration: Configuration,
+            api_client: ApiClient = None,
+            cache_ttl_seconds: Optional[float] = None,
+            cache_max_size: int = 1000,
+            cache_refresh_ahead: bool = False,
+            metrics_collector: Optional[MetricsCollector] = None,
+            cache: Optional[TtlCache] = None
+    ):
+        """
+        :param cache_ttl_seconds: when set, the workflow and task definitions read are cached for this time, by name
+                                  and version, and the cached definitions of a name are invalidated when it is
+                                  registered, updated or unregistered through this client.  The definitions returned
+                                  are copies, the cached ones are never modified by the callers.
+        :param cache_max_size: maximum number of cached definitions and lists of definitions, the least recently used
+                               ones are evicted first
+        :param cache_refresh_ahead: reload the definitions read shortly before they expire in the background, see
+                                    TtlCache
+        :param metrics_collector: counts the hits and misses of the cache
+        :param cache: the cache of another metadata client, shared with it instead of creating one from the cache_*
+                      parameters, see OrkesClients.get_metadata_client
+        """
+        super(OrkesMetadataClient, self).__init__(configuration, api_client)
+        self.metrics_collector = metrics_collector
+        self.cache = cache
+        if cache is None and cache_ttl_seconds is not None:
+            self.cache = TtlCache(cache_ttl_seconds, cache_max_size, cache_refresh_ahead)
 
     def register_workflow_def(self, workflow_def: WorkflowDef, overwrite: Optional[bool] = True):
         self.metadataResourceApi.create(workflow_def, overwrite=overwrite)
+        self.__invalidate_workflow_def(workflow_def.name)
 
     def update_workflow_def(self, workflow_def: WorkflowDef, overwrite: Optional[bool] = True):
         self.metadataResourceApi.update1([workflow_def], overwrite=overwrite)
+        self.__invalidate_workflow_def(workflow_def.name)
 
     def unregister_workflow_def(self, name: str, version: int):
         self.metadataResourceApi.unregister_workflow_def(name, version)
+        self.__invalidate_workflow_def(name)
 
     def get_workflow_def(self, name: str, version: Optional[int] = None) -> WorkflowDef:
-        workflow = None
         if version:
-            workflow = self.metadataResourceApi.get(name, version=version)
-        else:
-            workflow = self.metadataResourceApi.get(name)
-
-        return workflow
+            return self.__get_cached(
+                (_WORKFLOW_DEF, name, version), lambda: self.metadataResourceApi.get(name, version=version)
+            )
+        # the latest version
+        return self.__get_cached((_WORKFLOW_DEF, name, None), lambda: self.metadataResourceApi.get(name))
 
     def get_all_workflow_defs(self) -> List[WorkflowDef]:
-        return self.metadataResourceApi.get_all_workflows()
+        return self.__get_cached((_WORKFLOW_DEFS,), self.metadataResourceApi.get_all_workflows)
 
     def register_task_def(self, task_def: TaskDef):
         self.metadataResourceApi.register_task_def([task_def])
+        self.__invalidate_task_def(task_def.name)
 
     def update_task_def(self, task_def: TaskDef):
         self.metadataResourceApi.update_task_def(task_def)
+        self.__invalidate_task_def(task_def.name)
 
     def unregister_task_def(self, task_type: str):
         self.metadataResourceApi.unregister_task_def(task_type)
+        self.__invalidate_task_def(task_type)
 
     def get_task_def(self, task_type: str) -> TaskDef:
-        return self.metadataResourceApi.get_task_def(task_type)
+        return self.__get_cached((_TASK_DEF, task_type), lambda: self.metadataResourceApi.get_task_def(task_type))
 
     def get_all_task_defs(self) -> List[TaskDef]:
-        return self.metadataResourceApi.get_task_defs()
+        return self.__get_cached((_TASK_DEFS,), self.metadataResourceApi.get_task_defs)
 
     def add_workflow_tag(self, tag: MetadataTag, workflow_name: str):
         self.tagsApi.add_workflow_tag(tag, workflow_name)
@@ -94,3 +135,25 @@ class OrkesMetadataClient(OrkesBaseClient, MetadataClient):
         if current_rate_limit:
             rateLimitTag = RateLimitTag(workflowName, current_rate_limit)
             self.tagsApi.delete_workflow_tag(rateLimitTag, workflowName)
+
+    def __get_cached(self, key: tuple, load: Callable[[], Any]) -> Any:
+        if self.cache is None:
+            return load()
+        # the cached definitions are mutable, callers get their own copy
+        return copy.deepcopy(self.cache.get_or_load(key, load, on_access=self.__record_cache_access))
+
+    def __invalidate_workflow_def(self, name: str) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(lambda key: key[0] == _WORKFLOW_DEFS or (key[0] == _WORKFLOW_DEF and key[1] == name))
+
+    def __invalidate_task_def(self, task_type: str) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(lambda key: key[0] == _TASK_DEFS or key == (_TASK_DEF, task_type))
+
+    def __record_cache_access(self, key: Hashable, hit: bool) -> None:
+        if self.metrics_collector is None:
+            return
+        if hit:
+            self.metrics_collector.increment_metadata_cache_hit(key[0])
+        else:
+            self.metrics_collector.increment_metadata_cache_miss(key[0])
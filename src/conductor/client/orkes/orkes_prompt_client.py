@@ -4,6 +4,7 @@ import re  # noqa: F401
 from typing import List
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.prompt_template import PromptTemplate
 from conductor.client.http.models.prompt_test_request import PromptTemplateTestRequest
 from conductor.client.http.rest import ApiException
@@ -17,8 +18,8 @@ from conductor.client.prompt_client import PromptClient
 
 class OrkesPromptClient(OrkesBaseClient, PromptClient):
 
-    def __init__(self, configuration: Configuration):
-        super(OrkesPromptClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: ApiClient = None):
+        super(OrkesPromptClient, self).__init__(configuration, api_client)
 
     def save_prompt(self, prompt_name: str, description: str, prompt_template: str):
         self.promptApi.save_message_template(prompt_template, description, prompt_name)
@@ -1,6 +1,7 @@
 from typing import Optional, List
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models.save_schedule_request import SaveScheduleRequest
 from conductor.client.http.models.search_result_workflow_schedule_execution_model import \
     SearchResultWorkflowScheduleExecutionModel
@@ -11,8 +12,8 @@ from conductor.client.scheduler_client import SchedulerClient
 
 
 class OrkesSchedulerClient(OrkesBaseClient, SchedulerClient):
-    def __init__(self, configuration: Configuration):
-        super(OrkesSchedulerClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: ApiClient = None):
+        super(OrkesSchedulerClient, self).__init__(configuration, api_client)
 
     def save_schedule(self, save_schedule_request: SaveScheduleRequest):
         self.schedulerResourceApi.save_schedule(save_schedule_request)
@@ -1,7 +1,9 @@
-from typing import Optional, List
+from typing import Optional, List, Iterator
 
 from conductor.client.configuration.configuration import Configuration
-from conductor.client.http.models import PollData
+from conductor.client.helpers.pagination import iter_pages
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models import PollData, TaskSummary
 from conductor.client.http.models.task import Task
 from conductor.client.http.models.task_exec_log import TaskExecLog
 from conductor.client.http.models.task_result import TaskResult
@@ -11,8 +13,8 @@ from conductor.client.task_client import TaskClient
 
 
 class OrkesTaskClient(OrkesBaseClient, TaskClient):
-    def __init__(self, configuration: Configuration):
-        super(OrkesTaskClient, self).__init__(configuration)
+    def __init__(self, configuration: Configuration, api_client: ApiClient = None):
+        super(OrkesTaskClient, self).__init__(configuration, api_client)
 
     def poll_task(self, task_type: str, worker_id: Optional[str] = None, domain: Optional[str] = None) -> Optional[
         Task]:
@@ -93,3 +95,25 @@ class OrkesTaskClient(OrkesBaseClient, TaskClient):
 
     def get_task_poll_data(self, task_type: str) -> List[PollData]:
         return self.taskResourceApi.get_poll_data(task_type=task_type)
+
+    def iter_search(self, size: int = 100, free_text: str = '*', query: str = None, sort: str = None,
+                    prefetch: bool = True) -> Iterator[TaskSummary]:
+        """
+        Yields the summaries of all the tasks matching the search, one at a time, fetching them `size` at a time.
+        With `prefetch`, the next page is fetched in the background while the current one is consumed.
+        """
+        kwargs = {'size': size, 'free_text': free_text}
+        if query is not None:
+            kwargs['query'] = query
+        if sort is not None:
+            kwargs['sort'] = sort
+
+        def fetch_page(start: int):
+            result = self.taskResourceApi.search1(start=start, **kwargs)
+            summaries = result.results or []
+            next_start = start + len(summaries)
+            if len(summaries) < size or (result.total_hits is not None and next_start >= result.total_hits):
+                return summaries, None
+            return summaries, next_start
+
+        return iter_pages(fetch_page, 0, prefetch)
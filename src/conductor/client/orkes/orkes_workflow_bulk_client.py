@@ -0,0 +1,91 @@
+from typing import Callable, List, Optional
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.helpers.concurrency import DEFAULT_CONCURRENCY, ProgressCallback, run_concurrently
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models import BulkResponse, WorkflowSummary
+from conductor.client.orkes.orkes_base_client import OrkesBaseClient
+from conductor.client.workflow_bulk_client import WorkflowBulkClient, WorkflowIds
+
+# the maximum number of workflows the server accepts in a bulk request
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class OrkesWorkflowBulkClient(OrkesBaseClient, WorkflowBulkClient):
+    """
+    Applies an operation to any number of workflows: the workflow ids are split into chunks of `chunk_size`, sent in
+    up to `concurrency` concurrent bulk requests, and the responses are merged into one.  The ids, or the summaries
+    of a search, are all collected before the first request, so that searches for the workflows to operate on are not
+    affected by the operation.
+    """
+
+    def __init__(
+            self,
+            configuration: Configuration,
+            api_client: ApiClient = None,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            concurrency: int = DEFAULT_CONCURRENCY,
+            on_progress: Optional[ProgressCallback] = None
+    ):
+        """
+        :param on_progress: called with the number of chunks processed and the total number of chunks
+        """
+        super(OrkesWorkflowBulkClient, self).__init__(configuration, api_client)
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.on_progress = on_progress
+
+    def pause_workflows(self, workflow_ids: WorkflowIds) -> BulkResponse:
+        return self.__apply(self.workflowBulkResourceApi.pause_workflow, workflow_ids)
+
+    def resume_workflows(self, workflow_ids: WorkflowIds) -> BulkResponse:
+        return self.__apply(self.workflowBulkResourceApi.resume_workflow, workflow_ids)
+
+    def restart_workflows(self, workflow_ids: WorkflowIds, use_latest_definitions: bool = False) -> BulkResponse:
+        return self.__apply(
+            lambda chunk: self.workflowBulkResourceApi.restart(chunk, use_latest_definitions=use_latest_definitions),
+            workflow_ids
+        )
+
+    def retry_workflows(self, workflow_ids: WorkflowIds) -> BulkResponse:
+        return self.__apply(self.workflowBulkResourceApi.retry, workflow_ids)
+
+    def terminate_workflows(self, workflow_ids: WorkflowIds, reason: Optional[str] = None,
+                            trigger_failure_workflow: bool = False) -> BulkResponse:
+        kwargs = {'triggerFailureWorkflow': trigger_failure_workflow}
+        if reason is not None:
+            kwargs['reason'] = reason
+        return self.__apply(lambda chunk: self.workflowBulkResourceApi.terminate(chunk, **kwargs), workflow_ids)
+
+    def __apply(self, operation: Callable[[List[str]], BulkResponse], workflow_ids: WorkflowIds) -> BulkResponse:
+        chunks = self.__get_chunks(workflow_ids)
+        responses = run_concurrently(
+            operation, chunks, self.concurrency, on_progress=self.on_progress, return_exceptions=True
+        )
+        merged_response = BulkResponse(bulk_error_results={}, bulk_successful_results=[])
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, Exception):
+                # the whole request failed
+                self.logger.warning(f'Bulk request for {len(chunk)} workflows failed, reason: {response}')
+                for workflow_id in chunk:
+                    merged_response.bulk_error_results[workflow_id] = str(response)
+                continue
+            if response is None:
+                continue
+            merged_response.bulk_error_results.update(response.bulk_error_results or {})
+            merged_response.bulk_successful_results.extend(response.bulk_successful_results or [])
+        return merged_response
+
+    def __get_chunks(self, workflow_ids: WorkflowIds) -> List[List[str]]:
+        chunks = []
+        chunk = []
+        for workflow_id in workflow_ids:
+            if isinstance(workflow_id, WorkflowSummary):
+                workflow_id = workflow_id.workflow_id
+            chunk.append(workflow_id)
+            if len(chunk) >= self.chunk_size:
+                chunks.append(chunk)
+                chunk = []
+        if len(chunk) > 0:
+            chunks.append(chunk)
+        return chunks
@@ -1,15 +1,22 @@
-from typing import Optional, List, Dict
+import time
+from typing import Optional, List, Dict, Union, Iterator, Tuple, Iterable
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.helpers.concurrency import DEFAULT_CONCURRENCY, ProgressCallback, run_concurrently, \
+    run_concurrently_async
+from conductor.client.helpers.pagination import iter_pages
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models import SkipTaskRequest, WorkflowStatus, \
-    ScrollableSearchResultWorkflowSummary, SignalResponse
+    ScrollableSearchResultWorkflowSummary, SignalResponse, WorkflowSummary
 from conductor.client.http.models.correlation_ids_search_request import CorrelationIdsSearchRequest
 from conductor.client.http.models.rerun_workflow_request import RerunWorkflowRequest
 from conductor.client.http.models.start_workflow_request import StartWorkflowRequest
 from conductor.client.http.models.workflow import Workflow
 from conductor.client.http.models.workflow_run import WorkflowRun
 from conductor.client.http.models.workflow_state_update import WorkflowStateUpdate
+from conductor.client.http.models.workflow_status import terminal_status
 from conductor.client.http.models.workflow_test_request import WorkflowTestRequest
+from conductor.client.http.rest import ApiException
 from conductor.client.orkes.orkes_base_client import OrkesBaseClient
 from conductor.client.workflow_client import WorkflowClient
 
@@ -17,9 +24,10 @@ from conductor.client.workflow_client import WorkflowClient
 class OrkesWorkflowClient(OrkesBaseClient, WorkflowClient):
     def __init__(
             self,
-            configuration: Configuration
+            configuration: Configuration,
+            api_client: ApiClient = None
     ):
-        super(OrkesWorkflowClient, self).__init__(configuration)
+        super(OrkesWorkflowClient, self).__init__(configuration, api_client)
 
     def start_workflow_by_name(
             self,
@@ -42,6 +50,46 @@ class OrkesWorkflowClient(OrkesBaseClient, WorkflowClient):
     def start_workflow(self, start_workflow_request: StartWorkflowRequest) -> str:
         return self.workflowResourceApi.start_workflow(start_workflow_request)
 
+    def start_workflows(
+            self,
+            start_workflow_requests: List[StartWorkflowRequest],
+            concurrency: int = DEFAULT_CONCURRENCY,
+            rate_limit_per_second: Optional[float] = None,
+            on_progress: Optional[ProgressCallback] = None,
+            return_exceptions: bool = False
+    ) -> List[Union[str, Exception]]:
+        """
+        Starts the workflows concurrently, with up to `concurrency` requests in flight.
+
+        :param rate_limit_per_second: maximum number of workflows started per second, not limited when None
+        :param on_progress: called with the number of requests completed and the total number of requests
+        :param return_exceptions: when True, the exception raised by a failed start is returned in place of its
+                                  workflow id, otherwise a PartialFailureError is raised once all the requests
+                                  completed, with the ids of the started workflows and the exceptions in its `results`
+        :return: the ids of the workflows, in the order of the requests
+        """
+        return run_concurrently(
+            self.start_workflow, start_workflow_requests, concurrency, rate_limit_per_second, on_progress,
+            return_exceptions
+        )
+
+    async def start_workflows_async(
+            self,
+            start_workflow_requests: List[StartWorkflowRequest],
+            concurrency: int = DEFAULT_CONCURRENCY,
+            rate_limit_per_second: Optional[float] = None,
+            on_progress: Optional[ProgressCallback] = None,
+            return_exceptions: bool = False
+    ) -> List[Union[str, Exception]]:
+        """
+        Same as `start_workflows`, without blocking the event loop.  When cancelled, the workflows not being started
+        yet are not started.
+        """
+        return await run_concurrently_async(
+            self.start_workflow, start_workflow_requests, concurrency, rate_limit_per_second, on_progress,
+            return_exceptions
+        )
+
     def execute_workflow(
             self,
             start_workflow_request: StartWorkflowRequest,
@@ -160,6 +208,126 @@ class OrkesWorkflowClient(OrkesBaseClient, WorkflowClient):
         }
         return self.workflowResourceApi.search(**args)
 
+    def iter_search(self, size: int = 100, free_text: str = '*', query: str = None,
+                    prefetch: bool = True) -> Iterator[WorkflowSummary]:
+        """
+        Yields the summaries of all the workflows matching the search, one at a time, fetching them `size` at a time
+        and following the scroll `query_id`.  With `prefetch`, the next page is fetched in the background while the
+        current one is consumed.
+        """
+
+        def fetch_page(page: Tuple[int, Optional[str]]):
+            start, query_id = page
+            result = self.search(start=start, size=size, free_text=free_text, query=query, query_id=query_id)
+            summaries = result.results or []
+            if len(summaries) < size:
+                return summaries, None
+            return summaries, (start + len(summaries), result.query_id)
+
+        return iter_pages(fetch_page, (0, None), prefetch)
+
+    def as_completed(self, workflow_ids: Iterable[str], timeout_seconds: Optional[float] = None,
+                     poll_interval_seconds: float = 1, max_poll_interval_seconds: float = 30,
+                     batch_size: int = 100, concurrency: int = DEFAULT_CONCURRENCY) -> Iterator[WorkflowSummary]:
+        """
+        Yields the summary of each workflow as it reaches a terminal state, COMPLETED, FAILED, TIMED_OUT or
+        TERMINATED.  The workflows still running are looked up `batch_size` at a time with a search, so that each poll
+        makes one request per batch rather than one per workflow.  The interval between polls starts at
+        `poll_interval_seconds` and doubles after each wait, up to `max_poll_interval_seconds`, while no workflow
+        completes, and is reset to `poll_interval_seconds` when one does.
+        As the search is served by the index, a workflow is yielded once its terminal state has been indexed.  The
+        workflows not found by two consecutive searches, e.g. not indexed yet, are looked up one at a time.  The
+        searches and lookups that fail are retried on the next poll.
+
+        :raises TimeoutError: when some workflows have not completed within `timeout_seconds`
+        :raises ValueError: when some of the workflows do not exist
+        """
+        pending = dict.fromkeys(workflow_ids)
+        deadline = time.monotonic() + timeout_seconds if timeout_seconds is not None else None
+        interval = poll_interval_seconds
+        # the workflows not found by the previous search
+        not_indexed = set()
+        while True:
+            completed, not_found = self.__search_workflows(list(pending), batch_size, concurrency)
+            lookups = [workflow_id for workflow_id in not_found if workflow_id in not_indexed]
+            not_indexed = set(not_found)
+            unknown_workflow_ids = []
+            for workflow_id, result in zip(lookups, run_concurrently(
+                    self.__get_workflow_summary, lookups, concurrency, return_exceptions=True)):
+                if isinstance(result, ApiException) and result.status == 404:
+                    unknown_workflow_ids.append(workflow_id)
+                elif isinstance(result, Exception):
+                    self.logger.warning(f'Failed to get the status of workflow {workflow_id}, reason: {result}')
+                elif result.status in terminal_status:
+                    completed.append(result)
+            for summary in completed:
+                if summary.workflow_id in pending:
+                    del pending[summary.workflow_id]
+                    yield summary
+            if len(unknown_workflow_ids) > 0:
+                raise ValueError(f'Workflows not found: {", ".join(unknown_workflow_ids)}')
+            if len(pending) == 0:
+                return
+            if len(completed) > 0:
+                interval = poll_interval_seconds
+            wait_time = interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f'{len(pending)} workflows did not complete within {timeout_seconds} seconds')
+                wait_time = min(wait_time, remaining)
+            time.sleep(wait_time)
+            # the wait after the next poll, unless a workflow completes
+            interval = min(interval * 2, max_poll_interval_seconds)
+
+    def wait_for_all(self, workflow_ids: Iterable[str], timeout_seconds: Optional[float] = None,
+                     poll_interval_seconds: float = 1, max_poll_interval_seconds: float = 30,
+                     batch_size: int = 100, concurrency: int = DEFAULT_CONCURRENCY) -> Dict[str, WorkflowSummary]:
+        """
+        Waits for all the workflows to reach a terminal state, see `as_completed`, and returns their summaries by
+        workflow id, in the order of the ids.
+
+        :raises TimeoutError: when some workflows have not completed within `timeout_seconds`
+        """
+        workflow_ids = list(workflow_ids)
+        summaries = {
+            summary.workflow_id: summary
+            for summary in self.as_completed(
+                workflow_ids, timeout_seconds, poll_interval_seconds, max_poll_interval_seconds, batch_size,
+                concurrency
+            )
+        }
+        return {workflow_id: summaries[workflow_id] for workflow_id in workflow_ids}
+
+    def __search_workflows(self, workflow_ids: List[str], batch_size: int,
+                           concurrency: int) -> Tuple[List[WorkflowSummary], List[str]]:
+        """
+        :return: the summaries of the completed workflows, and the ids of the workflows not found
+        """
+        batches = [workflow_ids[i:i + batch_size] for i in range(0, len(workflow_ids), batch_size)]
+        completed = []
+        found = set()
+        for batch, result in zip(batches, run_concurrently(
+                self.__search_batch, batches, concurrency, return_exceptions=True)):
+            if isinstance(result, Exception):
+                self.logger.warning(f'Failed to search {len(batch)} workflows, reason: {result}')
+                # searched again on the next poll
+                found.update(batch)
+                continue
+            for summary in result:
+                found.add(summary.workflow_id)
+                if summary.status in terminal_status:
+                    completed.append(summary)
+        return completed, [workflow_id for workflow_id in workflow_ids if workflow_id not in found]
+
+    def __search_batch(self, workflow_ids: List[str]) -> List[WorkflowSummary]:
+        query = f'workflowId IN ({",".join(workflow_ids)})'
+        return self.search(start=0, size=len(workflow_ids), query=query).results or []
+
+    def __get_workflow_summary(self, workflow_id: str) -> WorkflowSummary:
+        status = self.get_workflow_status(workflow_id)
+        return WorkflowSummary(workflow_id=workflow_id, correlation_id=status.correlation_id, status=status.status)
+
     def get_by_correlation_ids_in_batch(
             self,
             batch_request: CorrelationIdsSearchRequest,
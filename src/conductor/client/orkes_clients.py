@@ -1,11 +1,15 @@
+import threading
+
 from conductor.client.authorization_client import AuthorizationClient
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
 from conductor.client.integration_client import IntegrationClient
 from conductor.client.metadata_client import MetadataClient
 from conductor.client.orkes.orkes_integration_client import OrkesIntegrationClient
 from conductor.client.orkes.orkes_metadata_client import OrkesMetadataClient
 from conductor.client.orkes.orkes_prompt_client import OrkesPromptClient
 from conductor.client.orkes.orkes_schema_client import OrkesSchemaClient
+from conductor.client.orkes.orkes_workflow_bulk_client import OrkesWorkflowBulkClient
 from conductor.client.orkes.orkes_workflow_client import OrkesWorkflowClient
 from conductor.client.orkes.orkes_task_client import OrkesTaskClient
 from conductor.client.orkes.orkes_scheduler_client import OrkesSchedulerClient
@@ -17,41 +21,77 @@ from conductor.client.schema_client import SchemaClient
 from conductor.client.secret_client import SecretClient
 from conductor.client.task_client import TaskClient
 from conductor.client.workflow.executor.workflow_executor import WorkflowExecutor
+from conductor.client.workflow_bulk_client import WorkflowBulkClient
 from conductor.client.workflow_client import WorkflowClient
 
 
 class OrkesClients:
+    """
+    Creates the clients of the Conductor APIs.  All the clients share the same ApiClient, and so the same HTTP
+    connection pool and authentication token.
+    """
+
     def __init__(self, configuration: Configuration = None):
         if configuration is None:
             configuration = Configuration()
         self.configuration = configuration
+        self.__api_client = None
+        self.__api_client_lock = threading.Lock()
+        self.__metadata_cache = None
+        self.__metadata_cache_lock = threading.Lock()
+
+    @property
+    def api_client(self) -> ApiClient:
+        if self.__api_client is None:
+            with self.__api_client_lock:
+                if self.__api_client is None:
+                    self.__api_client = ApiClient(self.configuration)
+        return self.__api_client
 
     def get_workflow_client(self) -> WorkflowClient:
-        return OrkesWorkflowClient(self.configuration)
+        return OrkesWorkflowClient(self.configuration, self.api_client)
+
+    def get_workflow_bulk_client(self, **kwargs) -> WorkflowBulkClient:
+        """
+        :param kwargs: chunk_size, concurrency and on_progress, see OrkesWorkflowBulkClient
+        """
+        return OrkesWorkflowBulkClient(self.configuration, self.api_client, **kwargs)
 
     def get_authorization_client(self) -> AuthorizationClient:
-        return OrkesAuthorizationClient(self.configuration)
+        return OrkesAuthorizationClient(self.configuration, self.api_client)
 
-    def get_metadata_client(self) -> MetadataClient:
-        return OrkesMetadataClient(self.configuration)
+    def get_metadata_client(self, **kwargs) -> MetadataClient:
+        """
+        :param kwargs: cache_ttl_seconds, cache_max_size, cache_refresh_ahead and metrics_collector, see
+                       OrkesMetadataClient.  The cache is created by the first client with cache_ttl_seconds, and shared
+                       by all the next ones with cache_ttl_seconds, so that they see each other's invalidations.
+        """
+        if kwargs.get('cache_ttl_seconds') is None or 'cache' in kwargs:
+            return OrkesMetadataClient(self.configuration, self.api_client, **kwargs)
+        with self.__metadata_cache_lock:
+            metadata_client = OrkesMetadataClient(
+                self.configuration, self.api_client, cache=self.__metadata_cache, **kwargs
+            )
+            self.__metadata_cache = metadata_client.cache
+        return metadata_client
 
     def get_scheduler_client(self) -> SchedulerClient:
-        return OrkesSchedulerClient(self.configuration)
+        return OrkesSchedulerClient(self.configuration, self.api_client)
 
     def get_secret_client(self) -> SecretClient:
-        return OrkesSecretClient(self.configuration)
+        return OrkesSecretClient(self.configuration, self.api_client)
 
     def get_task_client(self) -> TaskClient:
-        return OrkesTaskClient(self.configuration)
+        return OrkesTaskClient(self.configuration, self.api_client)
 
     def get_integration_client(self) -> IntegrationClient:
-        return OrkesIntegrationClient(self.configuration)
+        return OrkesIntegrationClient(self.configuration, self.api_client)
 
     def get_workflow_executor(self) -> WorkflowExecutor:
-        return WorkflowExecutor(self.configuration)
+        return WorkflowExecutor(self.configuration, self.api_client)
 
     def get_prompt_client(self) -> PromptClient:
-        return OrkesPromptClient(self.configuration)
+        return OrkesPromptClient(self.configuration, self.api_client)
 
     def get_schema_client(self) -> SchemaClient:
-        return OrkesSchemaClient(self.configuration)
\ No newline at end of file
+        return OrkesSchemaClient(self.configuration, self.api_client)
@@ -1,16 +1,20 @@
 import logging
 import os
+import threading
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from prometheus_client import CollectorRegistry
 from prometheus_client import Counter
 from prometheus_client import Gauge
+from prometheus_client import Histogram
+from prometheus_client import start_http_server
 from prometheus_client import write_to_textfile
 from prometheus_client.multiprocess import MultiProcessCollector
 
 from conductor.client.configuration.configuration import Configuration
-from conductor.client.configuration.settings.metrics_settings import MetricsSettings
+from conductor.client.configuration.settings.metrics_settings import MetricsSettings, DEFAULT_LATENCY_BUCKETS
+from conductor.client.http.models.task import Task
 from conductor.client.telemetry.model.metric_documentation import MetricDocumentation
 from conductor.client.telemetry.model.metric_label import MetricLabel
 from conductor.client.telemetry.model.metric_name import MetricName
@@ -22,34 +26,78 @@ logger = logging.getLogger(
 )
 
 
+# the metrics file is aggregated at most this fraction of the time, however many worker processes write metrics
+_MAX_METRICS_WRITE_LOAD = 0.1
+
+
+def get_metrics_write_interval(update_interval: float, write_time: float) -> float:
+    """
+    :param write_time: time it took to aggregate and write the metrics, in seconds
+    :return: the time to wait in seconds before the next write
+    """
+    return max(update_interval, write_time / _MAX_METRICS_WRITE_LOAD - write_time)
+
+
+def get_task_queue_wait_time(task: Task) -> Optional[float]:
+    """
+    :return: the time in seconds the task waited in the queue before being polled, None when unknown
+    """
+    if task.queue_wait_time is not None:
+        return task.queue_wait_time / 1000
+    if task.scheduled_time and task.start_time:
+        return max(0, task.start_time - task.scheduled_time) / 1000
+    return None
+
+
 class MetricsCollector:
     counters = {}
     gauges = {}
+    histograms = {}
     registry = CollectorRegistry()
+    # the metrics are shared by the task runners and threads of a process, and registered once
+    metrics_lock = threading.Lock()
     must_collect_metrics = False
+    latency_buckets = DEFAULT_LATENCY_BUCKETS
 
     def __init__(self, settings: MetricsSettings):
         if settings != None:
             os.environ["PROMETHEUS_MULTIPROC_DIR"] = settings.directory
             MultiProcessCollector(self.registry)
             self.must_collect_metrics = True
+            self.latency_buckets = settings.latency_buckets
 
     @staticmethod
     def provide_metrics(settings: MetricsSettings) -> None:
+        """
+        Aggregates the metrics of all the worker processes, either on each scrape of the HTTP endpoint when
+        `http_port` is set, or periodically into the metrics file.
+        """
         if settings == None:
             return
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry, path=settings.directory)
+        if settings.http_port is not None:
+            MetricsCollector.__serve_metrics(settings, registry)
+            return
         OUTPUT_FILE_PATH = os.path.join(
             settings.directory,
             settings.file_name
         )
-        registry = CollectorRegistry()
-        MultiProcessCollector(registry)
         while True:
+            start_time = time.time()
             write_to_textfile(
                 OUTPUT_FILE_PATH,
                 registry
             )
-            time.sleep(settings.update_interval)
+            write_time = time.time() - start_time
+            time.sleep(get_metrics_write_interval(settings.update_interval, write_time))
+
+    @staticmethod
+    def __serve_metrics(settings: MetricsSettings, registry: CollectorRegistry) -> None:
+        start_http_server(settings.http_port, addr=settings.http_address, registry=registry)
+        logger.info(f'Serving metrics on http://{settings.http_address}:{settings.http_port}/metrics')
+        # the server runs on a daemon thread
+        threading.Event().wait()
 
     def increment_task_poll(self, task_type: str) -> None:
         self.__increment_counter(
@@ -134,6 +182,40 @@ class MetricsCollector:
             }
         )
 
+    def increment_http_pool_exhausted(self) -> None:
+        self.__increment_counter(
+            name=MetricName.HTTP_POOL_EXHAUSTED,
+            documentation=MetricDocumentation.HTTP_POOL_EXHAUSTED,
+            labels={}
+        )
+
+    def increment_metadata_cache_hit(self, metadata_type: str) -> None:
+        self.__increment_counter(
+            name=MetricName.METADATA_CACHE_HIT,
+            documentation=MetricDocumentation.METADATA_CACHE_HIT,
+            labels={
+                MetricLabel.METADATA_TYPE: metadata_type
+            }
+        )
+
+    def increment_metadata_cache_miss(self, metadata_type: str) -> None:
+        self.__increment_counter(
+            name=MetricName.METADATA_CACHE_MISS,
+            documentation=MetricDocumentation.METADATA_CACHE_MISS,
+            labels={
+                MetricLabel.METADATA_TYPE: metadata_type
+            }
+        )
+
+    def increment_task_update_retry(self, task_type: str) -> None:
+        self.__increment_counter(
+            name=MetricName.TASK_UPDATE_RETRY,
+            documentation=MetricDocumentation.TASK_UPDATE_RETRY,
+            labels={
+                MetricLabel.TASK_TYPE: task_type
+            }
+        )
+
     def increment_external_payload_used(self, entity_name: str, operation: str, payload_type: str) -> None:
         self.__increment_counter(
             name=MetricName.EXTERNAL_PAYLOAD_USED,
@@ -155,6 +237,16 @@ class MetricsCollector:
             }
         )
 
+    def increment_worker_restart(self, task_type: str, exit_code: int) -> None:
+        self.__increment_counter(
+            name=MetricName.WORKER_RESTART,
+            documentation=MetricDocumentation.WORKER_RESTART,
+            labels={
+                MetricLabel.TASK_TYPE: task_type,
+                MetricLabel.EXIT_CODE: str(exit_code)
+            }
+        )
+
     def record_workflow_input_payload_size(self, workflow_type: str, version: str, payload_size: int) -> None:
         self.__record_gauge(
             name=MetricName.WORKFLOW_INPUT_SIZE,
@@ -176,7 +268,7 @@ class MetricsCollector:
             value=payload_size
         )
 
-    def record_task_poll_time(self, task_type: str, time_spent: float) -> None:
+    def record_task_poll_time(self, task_type: str, time_spent: float, domain: str = None) -> None:
         self.__record_gauge(
             name=MetricName.TASK_POLL_TIME,
             documentation=MetricDocumentation.TASK_POLL_TIME,
@@ -185,8 +277,14 @@ class MetricsCollector:
             },
             value=time_spent
         )
+        self.__observe_histogram(
+            name=MetricName.TASK_POLL_LATENCY,
+            documentation=MetricDocumentation.TASK_POLL_LATENCY,
+            labels=self.__get_task_labels(task_type, domain),
+            value=time_spent
+        )
 
-    def record_task_execute_time(self, task_type: str, time_spent: float) -> None:
+    def record_task_execute_time(self, task_type: str, time_spent: float, domain: str = None) -> None:
         self.__record_gauge(
             name=MetricName.TASK_EXECUTE_TIME,
             documentation=MetricDocumentation.TASK_EXECUTE_TIME,
@@ -195,6 +293,60 @@ class MetricsCollector:
             },
             value=time_spent
         )
+        self.__observe_histogram(
+            name=MetricName.TASK_EXECUTE_LATENCY,
+            documentation=MetricDocumentation.TASK_EXECUTE_LATENCY,
+            labels=self.__get_task_labels(task_type, domain),
+            value=time_spent
+        )
+
+    def record_task_update_time(self, task_type: str, time_spent: float, domain: str = None) -> None:
+        self.__record_gauge(
+            name=MetricName.TASK_UPDATE_TIME,
+            documentation=MetricDocumentation.TASK_UPDATE_TIME,
+            labels={
+                MetricLabel.TASK_TYPE: task_type
+            },
+            value=time_spent
+        )
+        self.__observe_histogram(
+            name=MetricName.TASK_UPDATE_LATENCY,
+            documentation=MetricDocumentation.TASK_UPDATE_LATENCY,
+            labels=self.__get_task_labels(task_type, domain),
+            value=time_spent
+        )
+
+    def record_task_queue_wait_time(self, task_type: str, time_spent: float, domain: str = None) -> None:
+        self.__observe_histogram(
+            name=MetricName.TASK_QUEUE_WAIT_TIME,
+            documentation=MetricDocumentation.TASK_QUEUE_WAIT_TIME,
+            labels=self.__get_task_labels(task_type, domain),
+            value=time_spent
+        )
+
+    def record_task_total_time(self, task_type: str, time_spent: float, domain: str = None) -> None:
+        self.__observe_histogram(
+            name=MetricName.TASK_TOTAL_TIME,
+            documentation=MetricDocumentation.TASK_TOTAL_TIME,
+            labels=self.__get_task_labels(task_type, domain),
+            value=time_spent
+        )
+
+    def record_task_update_queue_depth(self, queue_depth: int) -> None:
+        self.__record_gauge(
+            name=MetricName.TASK_UPDATE_QUEUE_DEPTH,
+            documentation=MetricDocumentation.TASK_UPDATE_QUEUE_DEPTH,
+            labels={},
+            value=queue_depth
+        )
+
+    def record_http_connections_in_use(self, connections_in_use: int) -> None:
+        self.__record_gauge(
+            name=MetricName.HTTP_CONNECTIONS_IN_USE,
+            documentation=MetricDocumentation.HTTP_CONNECTIONS_IN_USE,
+            labels={},
+            value=connections_in_use
+        )
 
     def __increment_counter(
             self,
@@ -209,7 +361,9 @@ class MetricsCollector:
             documentation=documentation,
             labelnames=labels.keys()
         )
-        counter.labels(*labels.values()).inc()
+        if len(labels) > 0:
+            counter = counter.labels(*labels.values())
+        counter.inc()
 
     def __record_gauge(
             self,
@@ -225,7 +379,33 @@ class MetricsCollector:
             documentation=documentation,
             labelnames=labels.keys()
         )
-        gauge.labels(*labels.values()).set(value)
+        if len(labels) > 0:
+            gauge = gauge.labels(*labels.values())
+        gauge.set(value)
+
+    def __observe_histogram(
+            self,
+            name: MetricName,
+            documentation: MetricDocumentation,
+            labels: Dict[MetricLabel, str],
+            value: float
+    ) -> None:
+        if not self.must_collect_metrics:
+            return
+        histogram = self.__get_histogram(
+            name=name,
+            documentation=documentation,
+            labelnames=labels.keys()
+        )
+        if len(labels) > 0:
+            histogram = histogram.labels(*labels.values())
+        histogram.observe(value)
+
+    def __get_task_labels(self, task_type: str, domain: str) -> Dict[MetricLabel, str]:
+        return {
+            MetricLabel.TASK_TYPE: task_type,
+            MetricLabel.DOMAIN: domain if domain is not None else ''
+        }
 
     def __get_counter(
             self,
@@ -234,9 +414,11 @@ class MetricsCollector:
             labelnames: List[MetricLabel]
     ) -> Counter:
         if name not in self.counters:
-            self.counters[name] = self.__generate_counter(
-                name, documentation, labelnames
-            )
+            with self.metrics_lock:
+                if name not in self.counters:
+                    self.counters[name] = self.__generate_counter(
+                        name, documentation, labelnames
+                    )
         return self.counters[name]
 
     def __get_gauge(
@@ -246,11 +428,27 @@ class MetricsCollector:
             labelnames: List[MetricLabel]
     ) -> Gauge:
         if name not in self.gauges:
-            self.gauges[name] = self.__generate_gauge(
-                name, documentation, labelnames
-            )
+            with self.metrics_lock:
+                if name not in self.gauges:
+                    self.gauges[name] = self.__generate_gauge(
+                        name, documentation, labelnames
+                    )
         return self.gauges[name]
 
+    def __get_histogram(
+            self,
+            name: MetricName,
+            documentation: MetricDocumentation,
+            labelnames: List[MetricLabel]
+    ) -> Histogram:
+        if name not in self.histograms:
+            with self.metrics_lock:
+                if name not in self.histograms:
+                    self.histograms[name] = self.__generate_histogram(
+                        name, documentation, labelnames
+                    )
+        return self.histograms[name]
+
     def __generate_counter(
             self,
             name: MetricName,
@@ -276,3 +474,17 @@ class MetricsCollector:
             labelnames=labelnames,
             registry=self.registry
         )
+
+    def __generate_histogram(
+            self,
+            name: MetricName,
+            documentation: MetricDocumentation,
+            labelnames: List[MetricLabel]
+    ) -> Histogram:
+        return Histogram(
+            name=name,
+            documentation=documentation,
+            labelnames=labelnames,
+            buckets=self.latency_buckets,
+            registry=self.registry
+        )
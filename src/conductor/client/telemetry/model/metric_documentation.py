@@ -3,17 +3,30 @@ from enum import Enum
 
 class MetricDocumentation(str, Enum):
     EXTERNAL_PAYLOAD_USED = "Incremented each time external payload storage is used"
+    HTTP_CONNECTIONS_IN_USE = "Number of HTTP connections taken out of the connection pools, of all the hosts"
+    HTTP_POOL_EXHAUSTED = "Incremented each time a request finds all the pooled HTTP connections to its host in use"
+    METADATA_CACHE_HIT = "Incremented each time a definition is read from the metadata cache"
+    METADATA_CACHE_MISS = "Incremented each time a definition is fetched from the server on a metadata cache miss"
     TASK_ACK_ERROR = "Task ack has encountered an exception"
     TASK_ACK_FAILED = "Task ack failed"
     TASK_EXECUTE_ERROR = "Execution error"
+    TASK_EXECUTE_LATENCY = "Distribution of the time to execute a task"
     TASK_EXECUTE_TIME = "Time to execute a task"
     TASK_EXECUTION_QUEUE_FULL = "Counter to record execution queue has saturated"
     TASK_PAUSED = "Counter for number of times the task has been polled, when the worker has been paused"
     TASK_POLL = "Incremented each time polling is done"
     TASK_POLL_ERROR = "Client error when polling for a task queue"
+    TASK_POLL_LATENCY = "Distribution of the time to poll for a batch of tasks"
     TASK_POLL_TIME = "Time to poll for a batch of tasks"
+    TASK_QUEUE_WAIT_TIME = "Distribution of the time tasks waited in the queue before being polled"
     TASK_RESULT_SIZE = "Records output payload size of a task"
+    TASK_TOTAL_TIME = "Distribution of the time from scheduling a task to updating its result"
     TASK_UPDATE_ERROR = "Task status cannot be updated back to server"
+    TASK_UPDATE_LATENCY = "Distribution of the time to update a task"
+    TASK_UPDATE_QUEUE_DEPTH = "Number of task results waiting to be sent to the server"
+    TASK_UPDATE_RETRY = "Incremented each time a task update is retried"
+    TASK_UPDATE_TIME = "Time to update a task"
     THREAD_UNCAUGHT_EXCEPTION = "thread_uncaught_exceptions"
+    WORKER_RESTART = "Incremented each time a worker process is restarted"
     WORKFLOW_START_ERROR = "Counter for workflow start errors"
     WORKFLOW_INPUT_SIZE = "Records input payload size of a workflow"
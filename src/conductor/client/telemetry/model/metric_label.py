@@ -2,8 +2,11 @@ from enum import Enum
 
 
 class MetricLabel(str, Enum):
+    DOMAIN = "domain"
     ENTITY_NAME = "entityName"
     EXCEPTION = "exception"
+    EXIT_CODE = "exitCode"
+    METADATA_TYPE = "metadataType"
     OPERATION = "operation"
     PAYLOAD_TYPE = "payload_type"
     TASK_TYPE = "taskType"
@@ -3,17 +3,30 @@ from enum import Enum
 
 class MetricName(str, Enum):
     EXTERNAL_PAYLOAD_USED = "external_payload_used"
+    HTTP_CONNECTIONS_IN_USE = "http_connections_in_use"
+    HTTP_POOL_EXHAUSTED = "http_pool_exhausted"
+    METADATA_CACHE_HIT = "metadata_cache_hit"
+    METADATA_CACHE_MISS = "metadata_cache_miss"
     TASK_ACK_ERROR = "task_ack_error"
     TASK_ACK_FAILED = "task_ack_failed"
     TASK_EXECUTE_ERROR = "task_execute_error"
+    TASK_EXECUTE_LATENCY = "task_execute_time_seconds"
     TASK_EXECUTE_TIME = "task_execute_time"
     TASK_EXECUTION_QUEUE_FULL = "task_execution_queue_full"
     TASK_PAUSED = "task_paused"
     TASK_POLL = "task_poll"
     TASK_POLL_ERROR = "task_poll_error"
+    TASK_POLL_LATENCY = "task_poll_time_seconds"
     TASK_POLL_TIME = "task_poll_time"
+    TASK_QUEUE_WAIT_TIME = "task_queue_wait_time_seconds"
     TASK_RESULT_SIZE = "task_result_size"
+    TASK_TOTAL_TIME = "task_total_time_seconds"
     TASK_UPDATE_ERROR = "task_update_error"
+    TASK_UPDATE_LATENCY = "task_update_time_seconds"
+    TASK_UPDATE_QUEUE_DEPTH = "task_update_queue_depth"
+    TASK_UPDATE_RETRY = "task_update_retry"
+    TASK_UPDATE_TIME = "task_update_time"
     THREAD_UNCAUGHT_EXCEPTION = "thread_uncaught_exceptions"
+    WORKER_RESTART = "worker_restart"
     WORKFLOW_INPUT_SIZE = "workflow_input_size"
     WORKFLOW_START_ERROR = "workflow_start_error"
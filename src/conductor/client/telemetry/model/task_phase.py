@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class TaskPhase(str, Enum):
+    BIND_ARGUMENTS = "bind_arguments"
+    DESERIALIZE = "deserialize"
+    EXECUTE = "execute"
+    POLL = "poll"
+    SERIALIZE = "serialize"
+    UPDATE = "update"
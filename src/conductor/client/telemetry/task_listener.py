@@ -0,0 +1,83 @@
+import logging
+import threading
+import time
+from typing import List, Optional
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.models.task import Task
+from conductor.client.http.models.task_result import TaskResult
+from conductor.client.telemetry.model.task_phase import TaskPhase
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+
+class TaskListener:
+    """
+    Receives the timings of the phases of the tasks of a worker, e.g. to find where the time of slow tasks goes.
+
+    The phases nest: `poll` includes `deserialize`, the decoding of the polled tasks; `execute` includes
+    `bind_arguments`, the conversion of the task input to the arguments of the worker function; and `update` includes
+    `serialize`, the conversion of the task result to JSON.
+
+    The methods are called from the threads polling, executing and updating the tasks, so they must be thread-safe
+    and fast.  Exceptions raised by them are logged and ignored.
+    """
+
+    def on_task_phase(self, task_type: str, task_id: Optional[str], phase: TaskPhase, duration: float) -> None:
+        """
+        :param task_id: None for the `poll` and `deserialize` phases, common to all the polled tasks
+        :param duration: in seconds
+        """
+        pass
+
+    def on_task_execution_started(self, task_type: str, task: Task) -> None:
+        pass
+
+    def on_task_execution_finished(self, task_type: str, task: Task, task_result: TaskResult, duration: float) -> None:
+        pass
+
+
+class _PhaseContext:
+    __slots__ = ('task_type', 'task_id', 'listeners')
+
+    def __init__(self, task_type: str, task_id: Optional[str], listeners: List[TaskListener]):
+        self.task_type = task_type
+        self.task_id = task_id
+        self.listeners = listeners
+
+
+_current_context = threading.local()
+
+
+def set_phase_context(task_type: str, task_id: Optional[str], listeners: List[TaskListener]) -> None:
+    """
+    Sends the phases recorded by this thread to the listeners, until `clear_phase_context` is called.
+    """
+    _current_context.value = _PhaseContext(task_type, task_id, listeners)
+
+
+def clear_phase_context() -> None:
+    _current_context.value = None
+
+
+def is_recording_phases() -> bool:
+    return getattr(_current_context, 'value', None) is not None
+
+
+def record_phase(phase: TaskPhase, start_time: float) -> None:
+    """
+    :param start_time: `time.perf_counter()` at the start of the phase, which ends now
+    """
+    context = getattr(_current_context, 'value', None)
+    if context is None:
+        return
+    duration = time.perf_counter() - start_time
+    for listener in context.listeners:
+        try:
+            listener.on_task_phase(context.task_type, context.task_id, phase, duration)
+        except Exception as e:
+            logger.warning(f'Task listener {type(listener).__name__} failed, reason: {e}')
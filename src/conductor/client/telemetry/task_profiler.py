@@ -0,0 +1,63 @@
+import cProfile
+import itertools
+import logging
+import os
+import threading
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.models.task import Task
+from conductor.client.http.models.task_result import TaskResult
+from conductor.client.telemetry.task_listener import TaskListener
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+
+class TaskProfiler(TaskListener):
+    """
+    Profiles the execution of one task out of every `sample_every`, with cProfile, and writes the profiles of those
+    that took at least `min_duration` seconds to `directory`, as `<task type>-<task id>.prof` files readable with
+    `pstats` or `snakeviz`.
+
+    Only one task is profiled at a time per process, tasks executed meanwhile by other threads are not sampled.
+    """
+
+    def __init__(self, directory: str, sample_every: int = 100, min_duration: float = 1.0):
+        self.directory = directory
+        self.sample_every = max(1, sample_every)
+        self.min_duration = min_duration
+        self._task_count = itertools.count()
+        self._profiling_lock = threading.Lock()
+        self._profiled = threading.local()
+        os.makedirs(directory, exist_ok=True)
+
+    def on_task_execution_started(self, task_type: str, task: Task) -> None:
+        if next(self._task_count) % self.sample_every != 0:
+            return
+        if not self._profiling_lock.acquire(blocking=False):
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # another profiler is active in the process
+            self._profiling_lock.release()
+            return
+        self._profiled.profile = profile
+
+    def on_task_execution_finished(self, task_type: str, task: Task, task_result: TaskResult, duration: float) -> None:
+        profile = getattr(self._profiled, 'profile', None)
+        if profile is None:
+            return
+        self._profiled.profile = None
+        try:
+            profile.disable()
+            if duration >= self.min_duration:
+                path = os.path.join(self.directory, f'{task_type}-{task.task_id}.prof')
+                profile.dump_stats(path)
+                logger.info(f'Task {task.task_id} of {task_type} took {duration:.3f}s, profile written to {path}')
+        finally:
+            self._profiling_lock.release()
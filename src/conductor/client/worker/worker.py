@@ -1,21 +1,24 @@
+import asyncio
 import dataclasses
 import inspect
 import logging
 import time
 import traceback
+from concurrent.futures import Executor
 from copy import deepcopy
-from typing import Any, Callable, Union
+from typing import Any, Callable, Optional, Union
 
 from typing_extensions import Self
 
-from conductor.client.automator import utils
-from conductor.client.automator.utils import convert_from_dict_or_list
+from conductor.client.automator.utils import compile_argument_binder
 from conductor.client.configuration.configuration import Configuration
 from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models import TaskExecLog
 from conductor.client.http.models.task import Task
 from conductor.client.http.models.task_result import TaskResult
 from conductor.client.http.models.task_result_status import TaskResultStatus
+from conductor.client.telemetry import task_listener
+from conductor.client.telemetry.model.task_phase import TaskPhase
 from conductor.client.worker.exception import NonRetryableException
 from conductor.client.worker.worker_interface import WorkerInterface, DEFAULT_POLLING_INTERVAL
 
@@ -53,6 +56,14 @@ class Worker(WorkerInterface):
                  poll_interval: float = None,
                  domain: str = None,
                  worker_id: str = None,
+                 batch_size: int = None,
+                 poll_timeout: int = None,
+                 thread_count: int = None,
+                 max_poll_interval: float = None,
+                 poll_jitter: float = None,
+                 process_count: int = None,
+                 process_group: str = None,
+                 lease_extend_enabled: bool = False,
                  ) -> Self:
         super().__init__(task_definition_name)
         self.api_client = ApiClient()
@@ -61,6 +72,20 @@ class Worker(WorkerInterface):
         else:
             self.poll_interval = deepcopy(poll_interval)
         self.domain = deepcopy(domain)
+        if batch_size is not None:
+            self.batch_size = batch_size
+        if poll_timeout is not None:
+            self.poll_timeout = poll_timeout
+        if thread_count is not None:
+            self.thread_count = thread_count
+        if max_poll_interval is not None:
+            self.max_poll_interval = max_poll_interval
+        if poll_jitter is not None:
+            self.poll_jitter = poll_jitter
+        if process_count is not None:
+            self.process_count = process_count
+        self.process_group = process_group
+        self.lease_extend_enabled = lease_extend_enabled
         if worker_id is None:
             self.worker_id = deepcopy(super().get_identity())
         else:
@@ -68,54 +93,63 @@ class Worker(WorkerInterface):
         self.execute_function = deepcopy(execute_function)
 
     def execute(self, task: Task) -> TaskResult:
-        task_input = {}
-        task_output = None
         task_result: TaskResult = self.get_task_result_from_task(task)
-
         try:
-
-            if self._is_execute_function_input_parameter_a_task:
-                task_output = self.execute_function(task)
-            else:
-                params = inspect.signature(self.execute_function).parameters
-                for input_name in params:
-                    typ = params[input_name].annotation
-                    default_value = params[input_name].default
-                    if input_name in task.input_data:
-                        if typ in utils.simple_types:
-                            task_input[input_name] = task.input_data[input_name]
-                        else:
-                            task_input[input_name] = convert_from_dict_or_list(typ, task.input_data[input_name])
-                    else:
-                        if default_value is not inspect.Parameter.empty:
-                            task_input[input_name] = default_value
-                        else:
-                            task_input[input_name] = None
-                task_output = self.execute_function(**task_input)
-
-            if type(task_output) == TaskResult:
-                task_output.task_id = task.task_id
-                task_output.workflow_instance_id = task.workflow_instance_id
-                return task_output
-            else:
-                task_result.status = TaskResultStatus.COMPLETED
-                task_result.output_data = task_output
-
-        except NonRetryableException as ne:
+            task_output = self.__invoke_execute_function(task)
+            if inspect.iscoroutine(task_output):
+                # async functions executed outside an event loop are run to completion on a new loop
+                task_output = asyncio.run(task_output)
+        except Exception as e:
+            return self.__get_failed_task_result(task, task_result, e)
+        return self.__get_completed_task_result(task, task_result, task_output)
+
+    async def execute_async(self, task: Task, executor: Optional[Executor] = None) -> TaskResult:
+        if not self._is_execute_function_a_coroutine:
+            return await super().execute_async(task, executor)
+        task_result: TaskResult = self.get_task_result_from_task(task)
+        try:
+            task_output = await self.__invoke_execute_function(task)
+        except Exception as e:
+            return self.__get_failed_task_result(task, task_result, e)
+        return self.__get_completed_task_result(task, task_result, task_output)
+
+    def __invoke_execute_function(self, task: Task) -> Any:
+        if self._is_execute_function_input_parameter_a_task:
+            return self.execute_function(task)
+        if task_listener.is_recording_phases():
+            start_time = time.perf_counter()
+            arguments = self._bind_arguments(task.input_data)
+            task_listener.record_phase(TaskPhase.BIND_ARGUMENTS, start_time)
+            return self.execute_function(**arguments)
+        return self.execute_function(**self._bind_arguments(task.input_data))
+
+    def __get_completed_task_result(self, task: Task, task_result: TaskResult, task_output: Any) -> TaskResult:
+        if type(task_output) == TaskResult:
+            task_output.task_id = task.task_id
+            task_output.workflow_instance_id = task.workflow_instance_id
+            return task_output
+        task_result.status = TaskResultStatus.COMPLETED
+        task_result.output_data = task_output
+        return self.__sanitize_output_data(task_result)
+
+    def __get_failed_task_result(self, task: Task, task_result: TaskResult, error: Exception) -> TaskResult:
+        if isinstance(error, NonRetryableException):
             task_result.status = TaskResultStatus.FAILED_WITH_TERMINAL_ERROR
-            if len(ne.args) > 0:
-                task_result.reason_for_incompletion = ne.args[0]
+            if len(error.args) > 0:
+                task_result.reason_for_incompletion = error.args[0]
+            return self.__sanitize_output_data(task_result)
 
-        except Exception as ne:
-            logger.error(
-                f'Error executing task {task.task_def_name} with id {task.task_id}.  error = {traceback.format_exc()}')
+        logger.error(
+            f'Error executing task {task.task_def_name} with id {task.task_id}.  error = {traceback.format_exc()}')
 
-            task_result.logs = [TaskExecLog(
-                traceback.format_exc(), task_result.task_id, int(time.time()))]
-            task_result.status = TaskResultStatus.FAILED
-            if len(ne.args) > 0:
-                task_result.reason_for_incompletion = ne.args[0]
+        task_result.logs = [TaskExecLog(
+            traceback.format_exc(), task_result.task_id, int(time.time()))]
+        task_result.status = TaskResultStatus.FAILED
+        if len(error.args) > 0:
+            task_result.reason_for_incompletion = error.args[0]
+        return self.__sanitize_output_data(task_result)
 
+    def __sanitize_output_data(self, task_result: TaskResult) -> TaskResult:
         if dataclasses.is_dataclass(type(task_result.output_data)):
             task_output = dataclasses.asdict(task_result.output_data)
             task_result.output_data = task_output
@@ -142,6 +176,11 @@ class Worker(WorkerInterface):
             callable=execute_function,
             object_type=Task,
         )
+        self._is_execute_function_a_coroutine = inspect.iscoroutinefunction(execute_function)
+        self._bind_arguments = None
+        if not self._is_execute_function_input_parameter_a_task:
+            # inspecting the parameters once, instead of on every task
+            self._bind_arguments = compile_argument_binder(execute_function)
         self._is_execute_function_return_value_a_task_result = is_callable_return_value_of_type(
             callable=execute_function,
             object_type=TaskResult,
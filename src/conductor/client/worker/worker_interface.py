@@ -1,11 +1,16 @@
 import abc
+import asyncio
 import socket
-from typing import Union
+from concurrent.futures import Executor
+from typing import Optional, Union
 
 from conductor.client.http.models.task import Task
 from conductor.client.http.models.task_result import TaskResult
 
 DEFAULT_POLLING_INTERVAL = 100  # ms
+DEFAULT_POLL_TIMEOUT = 100  # ms
+DEFAULT_THREAD_COUNT = 1
+DEFAULT_PROCESS_COUNT = 1
 
 
 class WorkerInterface(abc.ABC):
@@ -15,6 +20,14 @@ class WorkerInterface(abc.ABC):
         self._task_definition_name_cache = None
         self._domain = None
         self._poll_interval = DEFAULT_POLLING_INTERVAL
+        self._batch_size = None
+        self._poll_timeout = DEFAULT_POLL_TIMEOUT
+        self._thread_count = DEFAULT_THREAD_COUNT
+        self._max_poll_interval = None
+        self._poll_jitter = 0
+        self._process_count = DEFAULT_PROCESS_COUNT
+        self._process_group = None
+        self._lease_extend_enabled = False
 
     @abc.abstractmethod
     def execute(self, task: Task) -> TaskResult:
@@ -27,6 +40,18 @@ class WorkerInterface(abc.ABC):
         """
         pass
 
+    async def execute_async(self, task: Task, executor: Optional[Executor] = None) -> TaskResult:
+        """
+        Executes a task from an asyncio event loop and returns the updated task.
+        By default, `execute` is run on `executor` so that it does not block the loop.
+
+        :param Task: (required)
+        :param executor: the executor of the AsyncTaskRunner, the event loop's default executor when None
+        :return: TaskResult
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(executor, self.execute, task)
+
     def get_identity(self) -> str:
         """
         Retrieve the hostname of the instance that the worker is running.
@@ -44,6 +69,73 @@ class WorkerInterface(abc.ABC):
         """
         return (self.poll_interval if self.poll_interval else DEFAULT_POLLING_INTERVAL) / 1000
 
+    def get_batch_size(self) -> int:
+        """
+        Retrieve the maximum number of tasks requested from the server in a single poll.
+        When greater than 1, tasks are polled using the batch poll endpoint.
+
+        :return: int
+                 Default: the number of threads executing tasks for this worker
+        """
+        return self.batch_size if self.batch_size else self.get_thread_count()
+
+    def get_thread_count(self) -> int:
+        """
+        Retrieve the number of tasks that can be executed concurrently by the worker.
+
+        :return: int
+                 Default: 1
+        """
+        return self.thread_count if self.thread_count else DEFAULT_THREAD_COUNT
+
+    def get_poll_timeout_in_millis(self) -> int:
+        """
+        Retrieve the time in milliseconds the server may hold a batch poll request open waiting for tasks.
+
+        :return: int
+                 Default: 100ms
+        """
+        return self.poll_timeout if self.poll_timeout else DEFAULT_POLL_TIMEOUT
+
+    def get_max_polling_interval_in_seconds(self) -> float:
+        """
+        Retrieve the maximum interval in seconds between two polls.  When set, polling is adaptive: the server is
+        polled again right away while tasks keep arriving, and the interval is doubled after every empty poll, up to
+        this maximum.
+
+        :return: float
+                 Default: None, the polling interval is fixed
+        """
+        return self.max_poll_interval / 1000 if self.max_poll_interval else None
+
+    def get_poll_jitter(self) -> float:
+        """
+        Retrieve the fraction by which each wait between two polls is randomized, to spread the polls of many workers.
+
+        :return: float
+                 Default: 0, no jitter
+        """
+        return self.poll_jitter if self.poll_jitter else 0
+
+    def get_process_count(self) -> int:
+        """
+        Retrieve the number of processes the TaskHandler runs this worker in, each polling and executing tasks.
+
+        :return: int
+                 Default: 1
+        """
+        return self.process_count if self.process_count else DEFAULT_PROCESS_COUNT
+
+    def get_process_group(self) -> str:
+        """
+        Retrieve the name of the process group of the worker.  The workers of a group share their processes, each
+        polling from its own thread, instead of having processes of their own.
+
+        :return: str
+                 Default: None, the worker has its own processes
+        """
+        return self.process_group
+
     def get_task_definition_name(self) -> str:
         """
         Retrieve the name of the task definition the worker is currently working on.
@@ -117,3 +209,70 @@ class WorkerInterface(abc.ABC):
     @poll_interval.setter
     def poll_interval(self, value):
         self._poll_interval = value
+
+    @property
+    def batch_size(self):
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, value):
+        self._batch_size = value
+
+    @property
+    def poll_timeout(self):
+        return self._poll_timeout
+
+    @poll_timeout.setter
+    def poll_timeout(self, value):
+        self._poll_timeout = value
+
+    @property
+    def thread_count(self):
+        return self._thread_count
+
+    @thread_count.setter
+    def thread_count(self, value):
+        self._thread_count = value
+
+    @property
+    def max_poll_interval(self):
+        return self._max_poll_interval
+
+    @max_poll_interval.setter
+    def max_poll_interval(self, value):
+        self._max_poll_interval = value
+
+    @property
+    def poll_jitter(self):
+        return self._poll_jitter
+
+    @poll_jitter.setter
+    def poll_jitter(self, value):
+        self._poll_jitter = value
+
+    @property
+    def process_count(self):
+        return self._process_count
+
+    @process_count.setter
+    def process_count(self, value):
+        self._process_count = value
+
+    @property
+    def process_group(self):
+        return self._process_group
+
+    @process_group.setter
+    def process_group(self, value):
+        self._process_group = value
+
+    @property
+    def lease_extend_enabled(self):
+        """
+        Whether the lease of the tasks is extended while they are executed, see `LeaseExtender`.
+        """
+        return self._lease_extend_enabled
+
+    @lease_extend_enabled.setter
+    def lease_extend_enabled(self, value):
+        self._lease_extend_enabled = value
@@ -5,7 +5,9 @@ from conductor.client.workflow.task.simple_task import SimpleTask
 
 
 def WorkerTask(task_definition_name: str, poll_interval: int = 100, domain: str = None, worker_id: str = None,
-               poll_interval_seconds: int = 0):
+               poll_interval_seconds: int = 0, batch_size: int = None, poll_timeout: int = None,
+               thread_count: int = None, max_poll_interval: int = None, poll_jitter: float = None,
+               process_count: int = None, process_group: str = None, lease_extend_enabled: bool = False):
     poll_interval_millis = poll_interval
     if poll_interval_seconds > 0:
         poll_interval_millis = 1000 * poll_interval_seconds
@@ -13,7 +15,11 @@ def WorkerTask(task_definition_name: str, poll_interval: int = 100, domain: str
     def worker_task_func(func):
 
         register_decorated_fn(name=task_definition_name, poll_interval=poll_interval_millis, domain=domain,
-                              worker_id=worker_id, func=func)
+                              worker_id=worker_id, batch_size=batch_size, poll_timeout=poll_timeout,
+                              thread_count=thread_count, max_poll_interval=max_poll_interval,
+                              poll_jitter=poll_jitter, process_count=process_count,
+                              process_group=process_group, lease_extend_enabled=lease_extend_enabled,
+                              func=func)
 
         @functools.wraps(func)
         def wrapper_func(*args, **kwargs):
@@ -29,10 +35,17 @@ def WorkerTask(task_definition_name: str, poll_interval: int = 100, domain: str
     return worker_task_func
 
 
-def worker_task(task_definition_name: str, poll_interval_millis: int = 100, domain: str = None, worker_id: str = None):
+def worker_task(task_definition_name: str, poll_interval_millis: int = 100, domain: str = None, worker_id: str = None,
+                batch_size: int = None, poll_timeout: int = None, thread_count: int = None,
+                max_poll_interval_millis: int = None, poll_jitter: float = None, process_count: int = None,
+                process_group: str = None, lease_extend_enabled: bool = False):
     def worker_task_func(func):
         register_decorated_fn(name=task_definition_name, poll_interval=poll_interval_millis, domain=domain,
-                              worker_id=worker_id, func=func)
+                              worker_id=worker_id, batch_size=batch_size, poll_timeout=poll_timeout,
+                              thread_count=thread_count, max_poll_interval=max_poll_interval_millis,
+                              poll_jitter=poll_jitter, process_count=process_count,
+                              process_group=process_group, lease_extend_enabled=lease_extend_enabled,
+                              func=func)
 
         @functools.wraps(func)
         def wrapper_func(*args, **kwargs):
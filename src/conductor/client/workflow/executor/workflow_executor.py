@@ -1,9 +1,10 @@
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from typing_extensions import Self
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.helpers.concurrency import DEFAULT_CONCURRENCY, ProgressCallback
 from conductor.client.http.api.metadata_resource_api import MetadataResourceApi
 from conductor.client.http.api.task_resource_api import TaskResourceApi
 from conductor.client.http.api_client import ApiClient
@@ -13,11 +14,12 @@ from conductor.client.orkes.orkes_workflow_client import OrkesWorkflowClient
 
 
 class WorkflowExecutor:
-    def __init__(self, configuration: Configuration) -> Self:
-        api_client = ApiClient(configuration)
+    def __init__(self, configuration: Configuration, api_client: ApiClient = None) -> Self:
+        if api_client is None:
+            api_client = ApiClient(configuration)
         self.metadata_client = MetadataResourceApi(api_client)
         self.task_client = TaskResourceApi(api_client)
-        self.workflow_client = OrkesWorkflowClient(configuration)
+        self.workflow_client = OrkesWorkflowClient(configuration, api_client)
 
     def register_workflow(self, workflow: WorkflowDef, overwrite: bool = None) -> object:
         """Create a new workflow definition"""
@@ -34,16 +36,20 @@ class WorkflowExecutor:
             start_workflow_request=start_workflow_request,
         )
 
-    def start_workflows(self, *start_workflow_request: StartWorkflowRequest) -> List[str]:
-        """Start multiple instances of workflows.  Note, there is no parallelism implemented in starting so giving a
-        very large number can impact the latencies and performance
+    def start_workflows(self, *start_workflow_request: StartWorkflowRequest, concurrency: int = DEFAULT_CONCURRENCY,
+                        rate_limit_per_second: Optional[float] = None, on_progress: Optional[ProgressCallback] = None,
+                        return_exceptions: bool = False) -> List[Union[str, Exception]]:
+        """Start multiple instances of workflows concurrently, with up to `concurrency` requests in flight, see
+        OrkesWorkflowClient.start_workflows.  The ids of the workflows are returned in the order of the requests, and
+        are available in the `results` of the PartialFailureError raised when some of them failed to start
         """
-        workflow_id_list = [''] * len(start_workflow_request)
-        for i in range(len(start_workflow_request)):
-            workflow_id_list[i] = self.start_workflow(
-                start_workflow_request=start_workflow_request[i]
-            )
-        return workflow_id_list
+        return self.workflow_client.start_workflows(
+            list(start_workflow_request),
+            concurrency=concurrency,
+            rate_limit_per_second=rate_limit_per_second,
+            on_progress=on_progress,
+            return_exceptions=return_exceptions
+        )
 
     def execute_workflow(self, request: StartWorkflowRequest, wait_until_task_ref: str, wait_for_seconds: int = 10,
                          request_id: str = None) -> WorkflowRun:
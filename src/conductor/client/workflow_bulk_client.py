@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional, Union
+
+from conductor.client.http.models import BulkResponse, WorkflowSummary
+
+# workflow ids, or the summaries yielded by a search, e.g. WorkflowClient.iter_search
+WorkflowIds = Iterable[Union[str, WorkflowSummary]]
+
+
+class WorkflowBulkClient(ABC):
+    @abstractmethod
+    def pause_workflows(self, workflow_ids: WorkflowIds) -> BulkResponse:
+        pass
+
+    @abstractmethod
+    def resume_workflows(self, workflow_ids: WorkflowIds) -> BulkResponse:
+        pass
+
+    @abstractmethod
+    def restart_workflows(self, workflow_ids: WorkflowIds, use_latest_definitions: bool = False) -> BulkResponse:
+        pass
+
+    @abstractmethod
+    def retry_workflows(self, workflow_ids: WorkflowIds) -> BulkResponse:
+        pass
+
+    @abstractmethod
+    def terminate_workflows(self, workflow_ids: WorkflowIds, reason: Optional[str] = None,
+                            trigger_failure_workflow: bool = False) -> BulkResponse:
+        pass
@@ -0,0 +1,84 @@
+"""
+Measures the cost of aggregating the metrics of the worker processes, as the number of processes grows.
+
+Every worker process writes its metrics to its own files in the metrics directory, and `MetricsCollector.provide_metrics`
+merges all of them each time the metrics are written to the metrics file, or scraped from the HTTP endpoint. For each
+number of workers, prints the time of one aggregation, the share of a core it takes when the metrics file is written
+every 0.1 second, and the interval actually used to keep it under 10%.
+
+    PYTHONPATH=src python tests/benchmark/metrics_collector_benchmark.py
+"""
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+import timeit
+
+# prometheus_client chooses the multiprocess mode when it is imported
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', tempfile.mkdtemp())
+
+from prometheus_client import CollectorRegistry, generate_latest
+from prometheus_client.multiprocess import MultiProcessCollector
+
+from conductor.client.configuration.settings.metrics_settings import MetricsSettings
+from conductor.client.telemetry.metrics_collector import MetricsCollector, get_metrics_write_interval
+
+WORKER_COUNTS = [1, 8, 32, 64]
+TASK_TYPES_PER_WORKER = 2
+UPDATE_INTERVAL = 0.1
+
+
+def record_worker_metrics(directory: str, worker_index: int) -> None:
+    metrics_collector = MetricsCollector(MetricsSettings(directory=directory))
+    for task_type_index in range(TASK_TYPES_PER_WORKER):
+        task_type = f'task_{worker_index}_{task_type_index}'
+        for _ in range(10):
+            metrics_collector.increment_task_poll(task_type)
+            metrics_collector.record_task_poll_time(task_type, 0.01)
+            metrics_collector.record_task_execute_time(task_type, 0.2)
+            metrics_collector.record_task_update_time(task_type, 0.02)
+            metrics_collector.record_task_total_time(task_type, 0.5)
+
+
+def write_metrics_of_workers(directory: str, worker_count: int) -> None:
+    context = multiprocessing.get_context('fork')
+    processes = [
+        context.Process(target=record_worker_metrics, args=(directory, i)) for i in range(worker_count)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+def measure(function) -> float:
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def run() -> None:
+    print(f'{"workers":>8} {"files":>6} {"aggregate":>12} {"load@0.1s":>10} {"interval":>10}')
+    for worker_count in WORKER_COUNTS:
+        directory = tempfile.mkdtemp()
+        try:
+            write_metrics_of_workers(directory, worker_count)
+            registry = CollectorRegistry()
+            MultiProcessCollector(registry, path=directory)
+            aggregate_time = measure(lambda: generate_latest(registry))
+            interval = get_metrics_write_interval(UPDATE_INTERVAL, aggregate_time)
+            print(
+                f'{worker_count:>8} {len(os.listdir(directory)):>6} '
+                f'{aggregate_time * 1000:>9.2f} ms '
+                f'{aggregate_time / (aggregate_time + UPDATE_INTERVAL) * 100:>9.1f}% '
+                f'{interval:>9.2f}s'
+            )
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    start_time = time.time()
+    run()
+    print(f'done in {time.time() - start_time:.1f}s')
@@ -0,0 +1,70 @@
+"""
+Measures the cost of serializing a TaskResult the way the task runner does before updating a task:
+`ApiClient.sanitize_for_serialization` followed by the JSON encoding of the request body.
+
+Compares the standard library JSON encoder to orjson (when installed), for output payloads from 1 KB to 5 MB.
+
+    PYTHONPATH=src python tests/benchmark/serialization_benchmark.py
+"""
+import json
+import time
+import timeit
+from unittest.mock import patch
+
+from conductor.client.http import json_codec
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models.task_result import TaskResult
+
+PAYLOAD_SIZES = [1024, 10 * 1024, 100 * 1024, 1024 * 1024, 5 * 1024 * 1024]
+
+
+def build_task_result(size: int) -> TaskResult:
+    item = {
+        'id': 'a6d3c0e4-7b1f-4c59-9a53-6e0b0d2b1f3a',
+        'name': 'conductor',
+        'count': 42,
+        'ratio': 0.25,
+        'enabled': True,
+        'tags': ['python', 'worker', 'benchmark'],
+        'nested': {'created': 1700000000000, 'owner': None},
+    }
+    item_size = len(json.dumps(item))
+    return TaskResult(
+        task_id='task_id',
+        workflow_instance_id='workflow_instance_id',
+        worker_id='worker_id',
+        status='COMPLETED',
+        output_data={'items': [dict(item) for _ in range(max(1, size // item_size))]}
+    )
+
+
+def measure(function, min_time: float = 0.5) -> float:
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    runs = max(3, int(min_time / (timer.timeit(number) / number)))
+    return min(timer.repeat(repeat=3, number=max(1, runs // 3))) / max(1, runs // 3)
+
+
+def run() -> None:
+    api_client = ApiClient()
+    print(f'orjson installed: {json_codec.is_orjson_enabled()}')
+    print(f'{"payload":>10} {"sanitize":>12} {"json":>12} {"orjson":>12}')
+    for size in PAYLOAD_SIZES:
+        task_result = build_task_result(size)
+        sanitized = api_client.sanitize_for_serialization(task_result)
+        sanitize_time = measure(lambda: api_client.sanitize_for_serialization(task_result))
+        with patch.object(json_codec, 'orjson', None):
+            json_time = measure(lambda: json_codec.dumps(sanitized))
+        orjson_time = measure(lambda: json_codec.dumps(sanitized)) if json_codec.is_orjson_enabled() else None
+        print(
+            f'{size // 1024:>7} KB '
+            f'{sanitize_time * 1000:>9.3f} ms '
+            f'{json_time * 1000:>9.3f} ms '
+            + (f'{orjson_time * 1000:>9.3f} ms' if orjson_time is not None else f'{"-":>12}')
+        )
+
+
+if __name__ == '__main__':
+    start_time = time.time()
+    run()
+    print(f'done in {time.time() - start_time:.1f}s')
@@ -1,6 +1,10 @@
+import datetime
 import unittest
 import uuid
 from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models.task import Task
+from conductor.client.http.models.task_result import TaskResult
+from conductor.client.http.models.workflow import Workflow
 
 
 class TestApiClient(unittest.TestCase):
@@ -10,3 +14,60 @@ class TestApiClient(unittest.TestCase):
         obj = uuid.uuid4()
         sanitized = api_client.sanitize_for_serialization(obj)
         self.assertEquals(str(obj), sanitized)
+
+    def test_deserialize_class_with_nested_models(self):
+        api_client = ApiClient()
+        data = {
+            'workflowId': 'workflow_id',
+            'status': 'RUNNING',
+            'tasks': [
+                {'taskId': 'task_1', 'taskType': 'SIMPLE', 'inputData': {'key': 'value'}},
+                {'taskId': 'task_2', 'taskType': 'SIMPLE', 'workflowTask': {'name': 'simple', 'taskReferenceName': 'ref'}}
+            ],
+            'variables': {'count': 1}
+        }
+        for i in range(2):
+            # the second time, the compiled deserializers are reused
+            workflow = api_client.deserialize_class(data, 'Workflow')
+            self.assertEqual(Workflow, type(workflow))
+            self.assertEqual('workflow_id', workflow.workflow_id)
+            self.assertEqual(['task_1', 'task_2'], [task.task_id for task in workflow.tasks])
+            self.assertEqual(Task, type(workflow.tasks[0]))
+            self.assertEqual({'key': 'value'}, workflow.tasks[0].input_data)
+            self.assertEqual('ref', workflow.tasks[1].workflow_task.task_reference_name)
+            self.assertEqual({'count': 1}, workflow.variables)
+
+    def test_deserialize_class_with_container_types(self):
+        api_client = ApiClient()
+        self.assertEqual([1, 2], api_client.deserialize_class(['1', 2], 'list[int]'))
+        self.assertEqual({'a': 1.5}, api_client.deserialize_class({'a': '1.5'}, 'dict(str, float)'))
+        self.assertIsNone(api_client.deserialize_class(None, 'list[Task]'))
+        tasks = api_client.deserialize_class({'a': [{'taskId': 'task_1'}]}, 'dict(str, list[Task])')
+        self.assertEqual('task_1', tasks['a'][0].task_id)
+
+    def test_sanitize_for_serialization_returns_plain_payloads_as_they_are(self):
+        api_client = ApiClient()
+        payload = {'key': 'value', 'numbers': [1, 2.5, True, None], 'nested': {'list': [{'a': 'b'}]}}
+        self.assertIs(payload, api_client.sanitize_for_serialization(payload))
+
+    def test_sanitize_for_serialization_copies_payloads_with_models(self):
+        api_client = ApiClient()
+        task_result = TaskResult(task_id='task_id', workflow_instance_id='workflow_id', status='COMPLETED')
+        date = datetime.date(2024, 1, 2)
+        payload = {'plain': {'a': 1}, 'result': [task_result, 'b'], 'date': date}
+        sanitized = api_client.sanitize_for_serialization(payload)
+        self.assertIsNot(payload, sanitized)
+        self.assertEqual(
+            {
+                'plain': {'a': 1},
+                'result': [
+                    {'taskId': 'task_id', 'workflowInstanceId': 'workflow_id', 'status': 'COMPLETED', 'extendLease': False},
+                    'b'
+                ],
+                'date': '2024-01-02'
+            },
+            sanitized
+        )
+        self.assertIs(payload['plain'], sanitized['plain'])
+        self.assertEqual(task_result, payload['result'][0])
+        self.assertEqual(date, payload['date'])
@@ -0,0 +1,38 @@
+import unittest
+from unittest.mock import patch
+
+from conductor.client.http import json_codec
+
+
+class TestJsonCodec(unittest.TestCase):
+    DOCUMENT = {'name': 'conductor', 'count': 3, 'ratio': 0.5, 'ok': True, 'missing': None, 'items': ['a', 'é']}
+
+    def test_round_trip(self):
+        self.assertEqual(self.DOCUMENT, json_codec.loads(json_codec.dumps(self.DOCUMENT)))
+
+    def test_round_trip_with_standard_library(self):
+        with patch.object(json_codec, 'orjson', None):
+            self.assertFalse(json_codec.is_orjson_enabled())
+            encoded = json_codec.dumps(self.DOCUMENT)
+            self.assertEqual(bytes, type(encoded))
+            self.assertEqual(self.DOCUMENT, json_codec.loads(encoded))
+
+    def test_values_not_supported_by_orjson(self):
+        big_number = 2 ** 70
+        self.assertEqual({'big': big_number}, json_codec.loads(json_codec.dumps({'big': big_number})))
+        self.assertEqual({'1': 'a'}, json_codec.loads(json_codec.dumps({1: 'a'})))
+        self.assertNotEqual(json_codec.loads(b'{"value": NaN}')['value'], 0)
+
+    def test_non_finite_floats_are_encoded_as_null(self):
+        document = {'nan': float('nan'), 'values': [float('inf'), -float('inf'), 1.5], 'big': 2 ** 70}
+        expected = {'nan': None, 'values': [None, None, 1.5], 'big': 2 ** 70}
+        self.assertEqual(expected, json_codec.loads(json_codec.dumps(document)))
+        with patch.object(json_codec, 'orjson', None):
+            self.assertEqual(expected, json_codec.loads(json_codec.dumps(document)))
+            self.assertEqual(b'{"nan": null}', json_codec.dumps({'nan': float('nan')}))
+
+    def test_loads_invalid_document(self):
+        with self.assertRaises(ValueError):
+            json_codec.loads(b'not json')
+        with self.assertRaises(ValueError):
+            json_codec.loads(b'')
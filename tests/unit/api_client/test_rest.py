@@ -0,0 +1,85 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.rest import PoolMetricsHTTPAdapter, RESTClientObject
+
+
+class TestRESTClientObject(unittest.TestCase):
+
+    def test_connection_pool_with_default_configuration(self):
+        rest_client = RESTClientObject()
+        adapter = rest_client.connection.get_adapter('http://localhost:8080/api')
+        self.assertEqual(10, adapter._pool_maxsize)
+        self.assertFalse(adapter._pool_block)
+        self.assertEqual(3, adapter.max_retries.total)
+        self.assertEqual((120, 120), rest_client.timeout)
+
+    def test_connection_pool_with_configuration(self):
+        configuration = Configuration()
+        configuration.http_pool_maxsize = 50
+        configuration.http_pool_block = True
+        configuration.http_retry_count = 5
+        configuration.http_timeout = 30
+        rest_client = RESTClientObject(configuration=configuration)
+        for url in ['http://localhost:8080/api', 'https://localhost/api']:
+            adapter = rest_client.connection.get_adapter(url)
+            self.assertEqual(50, adapter._pool_maxsize)
+            self.assertTrue(adapter._pool_block)
+            self.assertEqual(5, adapter.max_retries.total)
+        self.assertEqual(30, rest_client.timeout)
+
+    def test_request_timeout_per_operation(self):
+        configuration = Configuration()
+        configuration.http_timeout = (5, 60)
+        configuration.poll_request_timeout = (5, 10)
+        configuration.update_request_timeout = (5, 20)
+        configuration.metadata_request_timeout = (5, 30)
+        api_client = ApiClient(configuration)
+        requests = [
+            ('/tasks/poll/batch/{tasktype}', 'GET', (5, 10)),
+            ('/tasks', 'POST', (5, 20)),
+            ('/tasks/{workflowId}/{taskRefName}/{status}', 'POST', (5, 20)),
+            ('/metadata/taskdefs', 'GET', (5, 30)),
+            ('/workflow/{workflowId}', 'GET', (5, 60)),
+        ]
+        for resource_path, method, expected_timeout in requests:
+            with patch.object(api_client.rest_client, 'request') as mock_request:
+                api_client.call_api(
+                    resource_path, method,
+                    path_params={'tasktype': 'task', 'workflowId': 'id', 'taskRefName': 'ref', 'status': 'COMPLETED'},
+                    _preload_content=False
+                )
+                self.assertEqual(expected_timeout, mock_request.call_args[1]['_request_timeout'], resource_path)
+
+    def test_pool_metrics(self):
+        metrics_collector = Mock()
+        adapter = PoolMetricsHTTPAdapter(metrics_collector=metrics_collector, pool_maxsize=1)
+        request = requests.Request('GET', 'http://localhost:8080/api/tasks').prepare()
+        other_host_request = requests.Request('GET', 'http://otherhost:8080/api/tasks').prepare()
+        pool = adapter.get_connection_with_tls_context(request, True)
+        metrics_collector.increment_http_pool_exhausted.assert_not_called()
+        # a request in progress holds the only connection of the host
+        connection = pool.pool.get()
+        self.assertEqual(1, adapter.connections_in_use)
+        adapter.get_connection_with_tls_context(other_host_request, True)
+        metrics_collector.increment_http_pool_exhausted.assert_not_called()
+        adapter.get_connection_with_tls_context(request, True)
+        metrics_collector.increment_http_pool_exhausted.assert_called_once()
+        pool.pool.put(connection)
+        self.assertEqual(0, adapter.connections_in_use)
+        self.assertEqual(
+            [0, 1, 1],
+            [c[0][0] for c in metrics_collector.record_http_connections_in_use.call_args_list]
+        )
+
+    def test_pool_metrics_recorded_after_request(self):
+        metrics_collector = Mock()
+        adapter = PoolMetricsHTTPAdapter(metrics_collector=metrics_collector)
+        with patch.object(HTTPAdapter, 'send', return_value='response'):
+            self.assertEqual('response', adapter.send(Mock()))
+        metrics_collector.record_http_connections_in_use.assert_called_once_with(0)
@@ -0,0 +1,115 @@
+import logging
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.configuration.settings.authentication_settings import AuthenticationSettings
+from conductor.client.http.token_manager import TokenManager, get_token_manager
+
+
+class TestTokenManager(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_token_manager_is_shared_per_configuration(self):
+        configuration = self.__get_configuration()
+        self.assertIs(get_token_manager(configuration), get_token_manager(configuration))
+        self.assertIsNot(get_token_manager(configuration), get_token_manager(self.__get_configuration()))
+
+    def test_valid_token_is_not_refreshed(self):
+        configuration = self.__get_configuration()
+        configuration.update_token('token')
+        fetch_token = Mock(return_value='new token')
+        self.assertEqual('token', TokenManager(configuration).get_token(fetch_token))
+        fetch_token.assert_not_called()
+
+    def test_expired_token_is_refreshed_once_by_concurrent_requests(self):
+        configuration = self.__get_configuration()
+        configuration.update_token('token')
+        configuration.token_update_time -= configuration.auth_token_ttl_msec + 1
+        fetch_count = []
+
+        def fetch_token():
+            fetch_count.append(1)
+            time.sleep(0.1)
+            return 'new token'
+
+        token_manager = TokenManager(configuration)
+        tokens = []
+        threads = [
+            threading.Thread(target=lambda: tokens.append(token_manager.get_token(fetch_token)))
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(1, len(fetch_count))
+        self.assertEqual(['new token'] * 10, tokens)
+
+    def test_token_is_refreshed_in_background_before_expiry(self):
+        configuration = self.__get_configuration()
+        configuration.update_token('token')
+        configuration.token_update_time -= configuration.auth_token_ttl_msec - 1000
+        refreshed = threading.Event()
+
+        def fetch_token():
+            refreshed.set()
+            return 'new token'
+
+        token_manager = TokenManager(configuration)
+        self.assertEqual('token', token_manager.get_token(fetch_token))
+        self.assertTrue(refreshed.wait(5))
+        for _ in range(50):
+            if configuration.AUTH_TOKEN == 'new token':
+                break
+            time.sleep(0.01)
+        self.assertEqual('new token', token_manager.get_token(fetch_token))
+
+    def test_failed_refresh_keeps_current_token(self):
+        configuration = self.__get_configuration()
+        configuration.update_token('token')
+        configuration.token_update_time -= configuration.auth_token_ttl_msec + 1
+        self.assertEqual('token', TokenManager(configuration).refresh(Mock(return_value=None)))
+
+    def test_refresh_is_skipped_when_token_was_refreshed_meanwhile(self):
+        configuration = self.__get_configuration()
+        configuration.update_token('token')
+        seen_update_time = configuration.token_update_time - 1
+        fetch_token = Mock(return_value='new token')
+        self.assertEqual('token', TokenManager(configuration).refresh(fetch_token, seen_update_time))
+        fetch_token.assert_not_called()
+
+    def test_token_is_shared_through_cache_file(self):
+        fd, cache_file = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            first = self.__get_configuration(cache_file)
+            second = self.__get_configuration(cache_file)
+            TokenManager(first).refresh(Mock(return_value='token'))
+            fetch_token = Mock(return_value='other token')
+            self.assertEqual('token', TokenManager(second).refresh(fetch_token))
+            self.assertEqual(first.token_update_time, second.token_update_time)
+            fetch_token.assert_not_called()
+            # another key doesn't use the cached token
+            third = self.__get_configuration(cache_file)
+            third.authentication_settings = AuthenticationSettings(key_id='other key', key_secret='secret')
+            self.assertEqual('other token', TokenManager(third).refresh(fetch_token))
+        finally:
+            os.remove(cache_file)
+
+    def __get_configuration(self, cache_file: str = None) -> Configuration:
+        configuration = Configuration(
+            server_api_url='http://localhost:8080/api',
+            authentication_settings=AuthenticationSettings(key_id='key', key_secret='secret')
+        )
+        configuration.auth_token_cache_file = cache_file
+        return configuration
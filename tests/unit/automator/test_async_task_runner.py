@@ -0,0 +1,232 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import unittest
+from unittest.mock import Mock, patch, ANY
+
+from conductor.client.automator.async_task_handler import AsyncTaskHandler
+from conductor.client.automator.async_task_runner import AsyncTaskRunner
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api.task_resource_api import TaskResourceApi
+from conductor.client.http.models.task import Task
+from conductor.client.http.models.task_result_status import TaskResultStatus
+from conductor.client.worker.worker import Worker
+from conductor.client.worker.worker_interface import DEFAULT_POLL_TIMEOUT
+from tests.unit.automator.test_task_handler import PickableMock
+from tests.unit.resources.workers import ClassWorker
+
+
+async def async_greet(name: str) -> str:
+    await asyncio.sleep(0.01)
+    return f'Hello {name}'
+
+
+class TestAsyncTaskRunner(unittest.TestCase):
+    TASK_ID = 'VALID_TASK_ID'
+    WORKFLOW_INSTANCE_ID = 'VALID_WORKFLOW_INSTANCE_ID'
+    UPDATE_TASK_RESPONSE = 'VALID_UPDATE_TASK_RESPONSE'
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_initialization_with_invalid_worker(self):
+        with self.assertRaises(Exception):
+            AsyncTaskRunner(
+                configuration=Configuration("http://localhost:8080/api"),
+                worker=None
+            )
+
+    @unittest.mock.patch.dict(os.environ, {}, clear=True)
+    def test_run_once_with_async_worker(self):
+        with patch.object(
+                TaskResourceApi,
+                'batch_poll',
+                return_value=[self.__get_valid_task(), self.__get_valid_task()]
+        ) as mock_batch_poll:
+            with patch.object(
+                    TaskResourceApi,
+                    'update_task',
+                    return_value=self.UPDATE_TASK_RESPONSE
+            ) as mock_update_task:
+                task_runner = AsyncTaskRunner(
+                    worker=self.__get_valid_async_worker(),
+                    configuration=Configuration(),
+                    concurrency=5
+                )
+                asyncio.run(self.__run_once_and_wait(task_runner))
+                mock_batch_poll.assert_called_once_with(
+                    tasktype='async_task', workerid=ANY, count=5, timeout=DEFAULT_POLL_TIMEOUT
+                )
+                self.assertEqual(mock_update_task.call_count, 2)
+                task_result = mock_update_task.call_args[1]['body']
+                self.assertEqual(task_result.status, TaskResultStatus.COMPLETED)
+                self.assertEqual(task_result.output_data, {'result': 'Hello conductor'})
+
+    @unittest.mock.patch.dict(os.environ, {}, clear=True)
+    def test_run_once_with_sync_worker(self):
+        with patch.object(
+                TaskResourceApi,
+                'batch_poll',
+                return_value=[self.__get_valid_task()]
+        ):
+            with patch.object(
+                    TaskResourceApi,
+                    'update_task',
+                    return_value=self.UPDATE_TASK_RESPONSE
+            ) as mock_update_task:
+                task_runner = AsyncTaskRunner(
+                    worker=ClassWorker('task'),
+                    configuration=Configuration()
+                )
+                asyncio.run(self.__run_once_and_wait(task_runner))
+                task_result = mock_update_task.call_args[1]['body']
+                self.assertEqual(task_result.status, TaskResultStatus.COMPLETED)
+                self.assertEqual(task_result.output_data['worker_style'], 'class')
+
+    @unittest.mock.patch.dict(os.environ, {}, clear=True)
+    def test_run_once_polls_only_for_free_slots(self):
+        with patch.object(
+                TaskResourceApi,
+                'batch_poll',
+                return_value=[self.__get_valid_task(), self.__get_valid_task()]
+        ) as mock_batch_poll:
+            with patch.object(TaskResourceApi, 'update_task', return_value=self.UPDATE_TASK_RESPONSE):
+                task_runner = AsyncTaskRunner(
+                    worker=self.__get_valid_async_worker(),
+                    configuration=Configuration(),
+                    concurrency=2
+                )
+
+                async def run_twice():
+                    await task_runner.run_once()
+                    await task_runner.run_once()
+                    await asyncio.gather(*task_runner._in_flight_tasks)
+
+                with patch.object(Worker, 'execute_async', side_effect=self.__slow_execute_async):
+                    asyncio.run(run_twice())
+                mock_batch_poll.assert_called_once()
+
+    @unittest.mock.patch.dict(os.environ, {}, clear=True)
+    def test_run_once_polls_every_task_type(self):
+        metrics_collector = Mock()
+        worker = Worker(
+            task_definition_name=['task_1', 'task_2'],
+            execute_function=lambda task: {'thread': threading.current_thread().name},
+            poll_interval=10
+        )
+        with patch.object(
+                TaskResourceApi,
+                'batch_poll',
+                side_effect=lambda tasktype, **kwargs: [self.__get_valid_task()]
+        ) as mock_batch_poll:
+            with patch.object(
+                    TaskResourceApi, 'update_task', return_value=self.UPDATE_TASK_RESPONSE
+            ) as mock_update_task:
+                task_runner = AsyncTaskRunner(worker=worker, configuration=Configuration())
+                task_runner.metrics_collector = metrics_collector
+                asyncio.run(self.__run_once_and_wait(task_runner))
+                self.assertEqual(['task_1', 'task_2'], [c[1]['tasktype'] for c in mock_batch_poll.call_args_list])
+                self.assertEqual(
+                    ['task_1', 'task_2'],
+                    sorted(c[0][0] for c in metrics_collector.record_task_total_time.call_args_list)
+                )
+                # the synchronous function is executed on the thread pool of the runner
+                for c in mock_update_task.call_args_list:
+                    self.assertTrue(c[1]['body'].output_data['thread'].startswith('task_1-io'))
+
+    def test_execute_async_function_from_sync_worker(self):
+        worker = self.__get_valid_async_worker()
+        task_result = worker.execute(self.__get_valid_task())
+        self.assertEqual(task_result.status, TaskResultStatus.COMPLETED)
+        self.assertEqual(task_result.output_data, {'result': 'Hello conductor'})
+
+    def test_async_task_handler_runs_all_workers_in_one_process(self):
+        with AsyncTaskHandler(
+                workers=[self.__get_valid_async_worker(), ClassWorker('task')],
+                configuration=Configuration(),
+                scan_for_annotated_workers=False
+        ) as task_handler:
+            self.assertEqual(len(task_handler.task_runners), 2)
+            self.assertIsNotNone(task_handler.task_runner_process)
+
+    @unittest.mock.patch.dict(os.environ, {}, clear=True)
+    def test_run_finishes_in_flight_tasks_when_drained(self):
+        with patch.object(TaskResourceApi, 'batch_poll', return_value=[self.__get_valid_task()]) as mock_batch_poll:
+            with patch.object(
+                    TaskResourceApi, 'update_task', return_value=self.UPDATE_TASK_RESPONSE
+            ) as mock_update_task:
+                task_runner = AsyncTaskRunner(worker=self.__get_valid_async_worker(), configuration=Configuration())
+
+                async def run_and_drain():
+                    run = asyncio.ensure_future(task_runner.run())
+                    while mock_batch_poll.call_count == 0:
+                        await asyncio.sleep(0.01)
+                    # the worker polls every 10 seconds
+                    task_runner.drain()
+                    await asyncio.wait_for(run, 5)
+
+                with patch.object(Worker, 'execute_async', side_effect=self.__slow_execute_async):
+                    asyncio.run(run_and_drain())
+                mock_batch_poll.assert_called_once()
+                self.assertEqual(1, mock_update_task.call_count)
+                self.assertIsNone(task_runner._executor)
+
+    @unittest.mock.patch.dict(os.environ, {}, clear=True)
+    def test_update_is_retried_with_configured_backoff(self):
+        configuration = Configuration()
+        configuration.task_update_backoff_seconds = 0.01
+        with patch.object(TaskResourceApi, 'batch_poll', return_value=[self.__get_valid_task()]):
+            with patch.object(
+                    TaskResourceApi, 'update_task', side_effect=[Exception('unavailable'), self.UPDATE_TASK_RESPONSE]
+            ) as mock_update_task:
+                task_runner = AsyncTaskRunner(
+                    worker=self.__get_valid_async_worker(), configuration=configuration, concurrency=3
+                )
+                asyncio.run(self.__run_once_and_wait(task_runner))
+                self.assertEqual(2, mock_update_task.call_count)
+                self.assertEqual(4, task_runner._executor._max_workers)
+
+    def test_async_task_handler_stop_lets_workers_finish(self):
+        polled = multiprocessing.Event()
+
+        def batch_poll(**kwargs):
+            polled.set()
+            return []
+
+        with patch.object(TaskResourceApi, 'batch_poll', PickableMock(side_effect=batch_poll)):
+            with AsyncTaskHandler(
+                    workers=[self.__get_valid_async_worker()],
+                    configuration=Configuration(),
+                    scan_for_annotated_workers=False
+            ) as task_handler:
+                task_handler.start_processes()
+                self.assertTrue(polled.wait(10))
+            self.assertEqual(0, task_handler.task_runner_process.exitcode)
+
+    async def __run_once_and_wait(self, task_runner: AsyncTaskRunner):
+        await task_runner.run_once()
+        await asyncio.gather(*task_runner._in_flight_tasks)
+
+    async def __slow_execute_async(self, task, executor=None):
+        await asyncio.sleep(0.5)
+        return ClassWorker('async_task').execute(task)
+
+    def __get_valid_async_worker(self):
+        worker = Worker(
+            task_definition_name='async_task',
+            execute_function=async_greet,
+            poll_interval=10
+        )
+        return worker
+
+    def __get_valid_task(self):
+        return Task(
+            task_id=self.TASK_ID,
+            workflow_instance_id=self.WORKFLOW_INSTANCE_ID,
+            input_data={'name': 'conductor'}
+        )
@@ -0,0 +1,95 @@
+import logging
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from conductor.client.automator.external_payload_storage import LocalFileSystemPayloadStorage, PayloadType, \
+    ServerExternalPayloadStorage
+from conductor.client.automator.task_runner import TaskRunner
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api.task_resource_api import TaskResourceApi
+from conductor.client.http.models.external_storage_location import ExternalStorageLocation
+from conductor.client.http.models.task import Task
+from conductor.client.worker.worker import Worker
+
+
+def repeat(text: str, count: int) -> str:
+    return text * count
+
+
+class TestExternalPayloadStorage(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.directory = tempfile.TemporaryDirectory()
+        self.storage = LocalFileSystemPayloadStorage(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+        logging.disable(logging.NOTSET)
+
+    def test_local_file_system_storage(self):
+        path = self.storage.upload(b'{"key": "value"}', PayloadType.TASK_OUTPUT)
+        self.assertEqual({'key': 'value'}, self.storage.download(path, PayloadType.TASK_OUTPUT))
+        self.assertEqual([path], os.listdir(self.directory.name))
+
+    def test_server_storage_uses_storage_locations(self):
+        task_client = Mock()
+        task_client.get_external_storage_location1.return_value = ExternalStorageLocation(
+            uri='https://storage/payload', path='payload.json'
+        )
+        task_client.api_client.rest_client.GET.return_value.resp.content = b'{"key": "value"}'
+        storage = ServerExternalPayloadStorage(task_client)
+        self.assertEqual({'key': 'value'}, storage.download('payload.json', PayloadType.TASK_INPUT))
+        task_client.get_external_storage_location1.assert_called_with('payload.json', 'READ', 'TASK_INPUT')
+        self.assertEqual('payload.json', storage.upload(b'{"key": "value"}', PayloadType.TASK_OUTPUT))
+        task_client.get_external_storage_location1.assert_called_with('', 'WRITE', 'TASK_OUTPUT')
+        task_client.api_client.rest_client.PUT.assert_called_with('https://storage/payload', body=b'{"key": "value"}')
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_task_runner_downloads_external_input_and_uploads_large_output(self):
+        input_path = self.storage.upload(b'{"text": "a", "count": 2048}', PayloadType.TASK_INPUT)
+        task_result = self.__run_task(Task(task_id='task_id', input_data={}, external_input_payload_storage_path=input_path))
+        self.assertEqual({}, task_result.output_data)
+        self.assertEqual(
+            {'result': 'a' * 2048},
+            self.storage.download(task_result.external_output_payload_storage_path, PayloadType.TASK_OUTPUT)
+        )
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_task_runner_sends_small_output_inline(self):
+        task_result = self.__run_task(Task(task_id='task_id', input_data={'text': 'a', 'count': 10}))
+        self.assertEqual({'result': 'a' * 10}, task_result.output_data)
+        self.assertIsNone(task_result.external_output_payload_storage_path)
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch('conductor.client.automator.task_runner.get_retry_delay', return_value=0)
+    def test_task_runner_fails_task_when_output_upload_fails(self, mock_get_retry_delay):
+        storage = Mock()
+        storage.upload.side_effect = OSError('storage unavailable')
+        listener = Mock()
+        task_result = self.__run_task(
+            Task(task_id='task_id', input_data={'text': 'a', 'count': 2048}), storage, [listener]
+        )
+        self.assertEqual('FAILED', task_result.status)
+        self.assertIn('storage unavailable', task_result.reason_for_incompletion)
+        self.assertEqual({}, task_result.output_data)
+        self.assertEqual(4, storage.upload.call_count)
+        self.assertEqual(3, mock_get_retry_delay.call_count)
+        self.assertEqual(1, listener.on_task_execution_finished.call_count)
+        self.assertIs(task_result, listener.on_task_execution_finished.call_args[0][2])
+
+    def __run_task(self, task: Task, storage=None, listeners=None):
+        configuration = Configuration()
+        configuration.task_update_in_background = False
+        configuration.task_output_payload_threshold_kb = 1
+        task_runner = TaskRunner(
+            worker=Worker(task_definition_name='task', execute_function=repeat),
+            configuration=configuration,
+            external_payload_storage=storage or self.storage,
+            listeners=listeners
+        )
+        with patch.object(TaskResourceApi, 'poll', return_value=task):
+            with patch.object(TaskResourceApi, 'update_task', return_value='OK') as mock_update_task:
+                task_runner.run_once()
+        return mock_update_task.call_args[1]['body']
@@ -0,0 +1,81 @@
+import logging
+import os
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from conductor.client.automator.lease_extender import LeaseExtender
+from conductor.client.automator.task_runner import TaskRunner
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api.task_resource_api import TaskResourceApi
+from conductor.client.http.models.task import Task
+from conductor.client.http.models.task_result_status import TaskResultStatus
+from conductor.client.worker.worker import Worker
+
+
+class TestLeaseExtender(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_lease_is_extended_until_stopped(self):
+        update_task = Mock()
+        lease_extender = LeaseExtender(update_task, 'worker_id')
+        task = Task(task_id='task_id', workflow_instance_id='workflow_id', response_timeout_seconds=0.1)
+        self.assertTrue(lease_extender.start(task))
+        time.sleep(0.3)
+        lease_extender.stop(task)
+        extension_count = update_task.call_count
+        self.assertGreaterEqual(extension_count, 2)
+        task_result = update_task.call_args[0][0]
+        self.assertEqual('task_id', task_result.task_id)
+        self.assertEqual(TaskResultStatus.IN_PROGRESS, task_result.status)
+        self.assertTrue(task_result.extend_lease)
+        time.sleep(0.2)
+        self.assertEqual(extension_count, update_task.call_count)
+
+    def test_stop_does_not_wait_for_extensions_in_flight(self):
+        extension_started = threading.Event()
+        extension_released = threading.Event()
+
+        def update_task(task_result):
+            extension_started.set()
+            extension_released.wait(5)
+
+        lease_extender = LeaseExtender(update_task, 'worker_id')
+        slow_task = Task(task_id='slow_task_id', response_timeout_seconds=0.05)
+        other_task = Task(task_id='other_task_id', response_timeout_seconds=60)
+        lease_extender.start(slow_task)
+        lease_extender.start(other_task)
+        self.assertTrue(extension_started.wait(5))
+        start_time = time.monotonic()
+        lease_extender.stop(other_task)
+        lease_extender.stop(slow_task)
+        self.assertLess(time.monotonic() - start_time, 1)
+        extension_released.set()
+
+    def test_tasks_without_response_timeout_are_not_extended(self):
+        update_task = Mock()
+        lease_extender = LeaseExtender(update_task, 'worker_id')
+        self.assertFalse(lease_extender.start(Task(task_id='task_id')))
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_task_runner_extends_lease_while_executing(self):
+        def execute(name: str) -> str:
+            time.sleep(0.3)
+            return name
+
+        worker = Worker(task_definition_name='task', execute_function=execute, lease_extend_enabled=True)
+        task = Task(task_id='task_id', input_data={'name': 'conductor'}, response_timeout_seconds=0.1)
+        task_runner = TaskRunner(worker=worker, configuration=Configuration())
+        with patch.object(TaskResourceApi, 'poll', return_value=task):
+            with patch.object(TaskResourceApi, 'update_task', return_value='OK') as mock_update_task:
+                task_runner.run_once()
+        task_results = [c[1]['body'] for c in mock_update_task.call_args_list]
+        self.assertGreaterEqual(len(task_results), 2)
+        self.assertTrue(all(task_result.extend_lease for task_result in task_results[:-1]))
+        self.assertFalse(task_results[-1].extend_lease)
+        self.assertEqual(TaskResultStatus.COMPLETED, task_results[-1].status)
@@ -0,0 +1,52 @@
+import unittest
+
+from conductor.client.automator.poll_scheduler import PollScheduler
+
+
+class TestPollScheduler(unittest.TestCase):
+    POLLING_INTERVAL = 0.1
+    MAX_POLLING_INTERVAL = 1
+
+    def test_fixed_polling_interval(self):
+        poll_scheduler = PollScheduler()
+        for task_count in [0, 1, 0, 0]:
+            poll_scheduler.record_poll(task_count)
+            self.assertEqual(poll_scheduler.get_wait_time(self.POLLING_INTERVAL), self.POLLING_INTERVAL)
+
+    def test_adaptive_polling_repolls_immediately_after_receiving_tasks(self):
+        poll_scheduler = PollScheduler()
+        poll_scheduler.record_poll(3)
+        self.assertEqual(self.__get_adaptive_wait_time(poll_scheduler), 0)
+
+    def test_adaptive_polling_backs_off_after_empty_polls(self):
+        poll_scheduler = PollScheduler()
+        wait_times = []
+        for i in range(6):
+            poll_scheduler.record_poll(0)
+            wait_times.append(self.__get_adaptive_wait_time(poll_scheduler))
+        self.assertEqual(wait_times, [0.1, 0.2, 0.4, 0.8, 1, 1])
+        poll_scheduler.record_poll(1)
+        poll_scheduler.record_poll(0)
+        self.assertEqual(self.__get_adaptive_wait_time(poll_scheduler), self.POLLING_INTERVAL)
+
+    def test_adaptive_polling_waits_polling_interval_without_capacity(self):
+        poll_scheduler = PollScheduler()
+        poll_scheduler.record_poll(1)
+        poll_scheduler.record_skipped_poll()
+        self.assertEqual(self.__get_adaptive_wait_time(poll_scheduler), self.POLLING_INTERVAL)
+
+    def test_adaptive_polling_does_not_overflow(self):
+        poll_scheduler = PollScheduler()
+        for i in range(5000):
+            poll_scheduler.record_poll(0)
+        self.assertEqual(self.__get_adaptive_wait_time(poll_scheduler), self.MAX_POLLING_INTERVAL)
+
+    def test_jitter(self):
+        poll_scheduler = PollScheduler()
+        for i in range(100):
+            wait_time = poll_scheduler.get_wait_time(self.POLLING_INTERVAL, jitter=0.5)
+            self.assertGreaterEqual(wait_time, 0.05)
+            self.assertLessEqual(wait_time, 0.15)
+
+    def __get_adaptive_wait_time(self, poll_scheduler: PollScheduler) -> float:
+        return round(poll_scheduler.get_wait_time(self.POLLING_INTERVAL, self.MAX_POLLING_INTERVAL), 6)
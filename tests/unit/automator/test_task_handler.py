@@ -1,4 +1,8 @@
 import multiprocessing
+import os
+import signal
+import threading
+import time
 import unittest
 from unittest.mock import Mock
 from unittest.mock import patch
@@ -6,6 +10,10 @@ from unittest.mock import patch
 from conductor.client.automator.task_handler import TaskHandler
 from conductor.client.automator.task_runner import TaskRunner
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.configuration.settings.authentication_settings import AuthenticationSettings
+from conductor.client.http.api.task_resource_api import TaskResourceApi
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models.task import Task
 from tests.unit.resources.workers import ClassWorker
 
 
@@ -40,10 +48,116 @@ class TestTaskHandler(unittest.TestCase):
                         isinstance(process, multiprocessing.Process)
                     )
 
+    def test_crashed_processes_are_restarted(self):
+        configuration = Configuration()
+        configuration.process_restart_backoff_seconds = 0.01
+        with patch.object(TaskRunner, 'run', PickableMock(side_effect=lambda: os._exit(1))):
+            with _get_valid_task_handler(configuration) as task_handler:
+                task_handler.start_processes()
+                supervisor = threading.Thread(target=task_handler.join_processes, daemon=True)
+                supervisor.start()
+                self.assertTrue(_wait_until(lambda: task_handler.task_runner_restart_counts[0] >= 2))
+            supervisor.join(5)
+            self.assertFalse(supervisor.is_alive())
+
+    def test_recycled_processes_are_replaced(self):
+        # TaskRunner.run only returns when the process must be replaced
+        with patch.object(TaskRunner, 'run', PickableMock(return_value=None)):
+            with _get_valid_task_handler() as task_handler:
+                task_handler.start_processes()
+                supervisor = threading.Thread(target=task_handler.join_processes, daemon=True)
+                supervisor.start()
+                self.assertTrue(_wait_until(lambda: task_handler.task_runner_restart_counts[0] >= 2))
+            supervisor.join(5)
+
+    def test_processes_exiting_normally_are_not_restarted(self):
+        with patch.object(TaskRunner, 'run', PickableMock(side_effect=SystemExit(0))):
+            with _get_valid_task_handler() as task_handler:
+                task_handler.start_processes()
+                task_handler.join_processes()
+                self.assertEqual([0], task_handler.task_runner_restart_counts)
+
+    def test_stop_processes_lets_workers_finish(self):
+        polled = multiprocessing.Event()
+        with patch.object(TaskResourceApi, 'poll', PickableMock(side_effect=lambda **kwargs: polled.set())):
+            with _get_valid_task_handler() as task_handler:
+                task_handler.start_processes()
+                self.assertTrue(polled.wait(10))
+            self.assertEqual(0, task_handler.task_runner_processes[0].exitcode)
+
+    def test_stop_processes_kills_workers_after_shutdown_timeout(self):
+        configuration = Configuration()
+        configuration.shutdown_timeout_seconds = 0.1
+        polled = multiprocessing.Event()
+
+        def poll(**kwargs):
+            polled.set()
+            return Task(task_id='task_id')
+
+        with patch.object(TaskResourceApi, 'poll', PickableMock(side_effect=poll)):
+            with patch.object(ClassWorker, 'execute', PickableMock(side_effect=lambda task: time.sleep(60))):
+                with _get_valid_task_handler(configuration) as task_handler:
+                    task_handler.start_processes()
+                    self.assertTrue(polled.wait(10))
+                self.assertEqual(-signal.SIGKILL, task_handler.task_runner_processes[0].exitcode)
+
+    def test_workers_are_grouped_into_processes(self):
+        workers = [ClassWorker('task_1'), ClassWorker('task_2'), ClassWorker('task_3'), ClassWorker('task_4')]
+        workers[0].process_group = 'low_volume'
+        workers[1].process_group = 'low_volume'
+        workers[2].process_count = 3
+        with TaskHandler(workers=workers, configuration=Configuration(), scan_for_annotated_workers=False) as task_handler:
+            self.assertEqual(
+                [['task_1', 'task_2'], ['task_3'], ['task_3'], ['task_3'], ['task_4']],
+                [
+                    [task_runner.worker.get_task_definition_name() for task_runner in task_runners]
+                    for task_runners in task_handler.task_runners
+                ]
+            )
+            self.assertEqual(5, len(task_handler.task_runner_processes))
+
+    def test_stop_processes_lets_grouped_workers_finish(self):
+        polled = multiprocessing.Event()
+        workers = [ClassWorker('task_1'), ClassWorker('task_2')]
+        for worker in workers:
+            worker.process_group = 'group'
+        with patch.object(TaskResourceApi, 'poll', PickableMock(side_effect=lambda **kwargs: polled.set())):
+            with TaskHandler(workers=workers, configuration=Configuration(), scan_for_annotated_workers=False) as task_handler:
+                task_handler.start_processes()
+                self.assertTrue(polled.wait(10))
+            self.assertEqual(0, task_handler.task_runner_processes[0].exitcode)
+
+
+    @patch.object(ApiClient, '_ApiClient__get_new_token', return_value='token')
+    def test_token_is_not_shared_by_default(self, mock_get_new_token):
+        configuration = Configuration(authentication_settings=AuthenticationSettings(key_id='id', key_secret='secret'))
+        with _get_valid_task_handler(configuration):
+            self.assertIsNone(configuration.auth_token_cache_file)
+
+    @patch.object(ApiClient, '_ApiClient__get_new_token', return_value='token')
+    def test_shared_token_file_is_private_and_removed_on_stop(self, mock_get_new_token):
+        configuration = Configuration(authentication_settings=AuthenticationSettings(key_id='id', key_secret='secret'))
+        configuration.auth_token_shared_by_worker_processes = True
+        task_handler = _get_valid_task_handler(configuration)
+        token_cache_file = configuration.auth_token_cache_file
+        self.assertEqual(0o600, os.stat(token_cache_file).st_mode & 0o777)
+        self.assertEqual(0o700, os.stat(os.path.dirname(token_cache_file)).st_mode & 0o777)
+        task_handler.stop_processes()
+        self.assertFalse(os.path.exists(os.path.dirname(token_cache_file)))
+        self.assertIsNone(configuration.auth_token_cache_file)
+
+def _wait_until(condition, timeout: float = 10) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
 
-def _get_valid_task_handler():
+def _get_valid_task_handler(configuration: Configuration = None):
     return TaskHandler(
-        configuration=Configuration(),
+        configuration=configuration if configuration is not None else Configuration(),
         workers=[
             ClassWorker('task')
         ]
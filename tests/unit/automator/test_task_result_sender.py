@@ -0,0 +1,120 @@
+import logging
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+from conductor.client.automator.task_result_sender import TaskResultSender, get_retry_delay
+from conductor.client.http.models.task_result import TaskResult
+
+
+class TestTaskResultSender(unittest.TestCase):
+    TASK_NAME = 'task'
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_retry_delay_grows_exponentially_up_to_max(self):
+        for attempt, expected_delay in [(1, 2), (2, 4), (3, 8), (4, 10), (10, 10)]:
+            delay = get_retry_delay(attempt, backoff_seconds=2, max_backoff_seconds=10)
+            self.assertGreaterEqual(delay, expected_delay / 2)
+            self.assertLessEqual(delay, expected_delay)
+
+    def test_submit_sends_task_results(self):
+        update_task = Mock(return_value='OK')
+        sender = self.__get_sender(update_task)
+        task_results = [self.__get_task_result(str(i)) for i in range(5)]
+        for task_result in task_results:
+            sender.submit(self.TASK_NAME, task_result)
+        self.assertTrue(sender.stop(5))
+        self.assertEqual([c[0][0] for c in update_task.call_args_list], task_results)
+
+    def test_failed_update_is_retried_without_blocking_next_results(self):
+        first_attempt_done = threading.Event()
+        attempts = []
+
+        def update_task(task_result):
+            attempts.append(task_result.task_id)
+            if task_result.task_id == 'failing':
+                first_attempt_done.set()
+                raise Exception('server unavailable')
+
+        metrics_collector = Mock()
+        sender = self.__get_sender(update_task, retry_count=2, backoff_seconds=60, metrics_collector=metrics_collector)
+        sender.submit(self.TASK_NAME, self.__get_task_result('failing'))
+        sender.submit(self.TASK_NAME, self.__get_task_result('ok'))
+        first_attempt_done.wait(5)
+        time.sleep(0.1)
+        self.assertEqual(attempts, ['failing', 'ok'])
+        # retries are no longer delayed by the backoff when flushing
+        self.assertTrue(sender.flush(5))
+        self.assertEqual(attempts, ['failing', 'ok', 'failing', 'failing'])
+        self.assertEqual(metrics_collector.increment_task_update_retry.call_count, 2)
+        self.assertEqual(metrics_collector.increment_task_update_error.call_count, 3)
+        metrics_collector.record_task_update_time.assert_called_once()
+        metrics_collector.record_task_update_queue_depth.assert_called()
+
+    def test_flush_times_out_when_update_is_stuck(self):
+        release_update = threading.Event()
+        sender = self.__get_sender(lambda task_result: release_update.wait(5))
+        sender.submit(self.TASK_NAME, self.__get_task_result('stuck'))
+        self.assertFalse(sender.flush(0.1))
+        release_update.set()
+        self.assertTrue(sender.stop(5))
+
+    def test_results_are_sent_concurrently(self):
+        # released once the three updates are in flight at the same time
+        barrier = threading.Barrier(3, timeout=5)
+        update_task = Mock(side_effect=lambda task_result: barrier.wait())
+        sender = self.__get_sender(update_task, thread_count=3)
+        for i in range(3):
+            sender.submit(self.TASK_NAME, self.__get_task_result(str(i)))
+        self.assertTrue(sender.stop(5))
+        self.assertEqual(3, update_task.call_count)
+        self.assertFalse(barrier.broken)
+
+    def test_flush_wakes_up_every_sender_thread(self):
+        # released once the three retries are in flight at the same time
+        barrier = threading.Barrier(3, timeout=5)
+        attempts = []
+
+        def update_task(task_result):
+            attempts.append(task_result.task_id)
+            if attempts.count(task_result.task_id) == 1:
+                raise Exception('server unavailable')
+            barrier.wait()
+
+        sender = self.__get_sender(update_task, retry_count=1, backoff_seconds=60, thread_count=3)
+        for i in range(3):
+            sender.submit(self.TASK_NAME, self.__get_task_result(str(i)))
+        while len(attempts) < 3:
+            time.sleep(0.01)
+        self.assertTrue(sender.flush(5))
+        self.assertEqual(6, len(attempts))
+        self.assertFalse(barrier.broken)
+        self.assertTrue(sender.stop(5))
+
+    def test_stop_without_submitted_results(self):
+        sender = self.__get_sender(Mock())
+        self.assertTrue(sender.stop(1))
+
+    def __get_sender(self, update_task, retry_count=3, backoff_seconds=0.01, metrics_collector=None, thread_count=1):
+        return TaskResultSender(
+            update_task=update_task,
+            queue_size=10,
+            retry_count=retry_count,
+            backoff_seconds=backoff_seconds,
+            max_backoff_seconds=backoff_seconds * 10,
+            metrics_collector=metrics_collector,
+            thread_count=thread_count
+        )
+
+    def __get_task_result(self, task_id: str):
+        return TaskResult(
+            task_id=task_id,
+            workflow_instance_id='workflow_instance_id',
+            worker_id='worker_id'
+        )
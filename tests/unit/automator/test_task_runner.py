@@ -1,5 +1,7 @@
 import logging
 import os
+import signal
+import threading
 import time
 import unittest
 from unittest.mock import patch, ANY, Mock
@@ -12,7 +14,7 @@ from conductor.client.http.api.task_resource_api import TaskResourceApi
 from conductor.client.http.models.task import Task
 from conductor.client.http.models.task_result import TaskResult
 from conductor.client.http.models.task_result_status import TaskResultStatus
-from conductor.client.worker.worker_interface import DEFAULT_POLLING_INTERVAL
+from conductor.client.worker.worker_interface import DEFAULT_POLLING_INTERVAL, DEFAULT_POLL_TIMEOUT
 from tests.unit.resources.workers import ClassWorker
 from tests.unit.resources.workers import FaultyExecutionWorker
 
@@ -104,6 +106,54 @@ class TestTaskRunner(unittest.TestCase):
         task_runner = self.__get_valid_task_runner_with_worker_config_and_poll_interval(3000)
         self.assertEqual(task_runner.worker.get_polling_interval_in_seconds(), 0.25)
 
+    @unittest.mock.patch.dict(os.environ, {"conductor_worker_task_thread_count": "4"}, clear=True)
+    def test_initialization_with_thread_count_in_env_var(self):
+        task_runner = self.__get_valid_task_runner()
+        self.assertEqual(task_runner.worker.get_thread_count(), 4)
+        self.assertEqual(task_runner.worker.get_batch_size(), 4)
+
+    @unittest.mock.patch.dict(os.environ, {"conductor_worker_task_batch_size": "10",
+                                           "CONDUCTOR_WORKER_POLL_TIMEOUT": "500"}, clear=True)
+    def test_initialization_with_batch_size_and_poll_timeout_in_env_var(self):
+        task_runner = self.__get_valid_task_runner()
+        self.assertEqual(task_runner.worker.get_batch_size(), 10)
+        self.assertEqual(task_runner.worker.get_poll_timeout_in_millis(), 500)
+
+    @unittest.mock.patch.dict(os.environ, {"conductor_worker_max_polling_interval": "5000",
+                                           "CONDUCTOR_WORKER_task_POLL_JITTER": "0.1"}, clear=True)
+    def test_initialization_with_adaptive_polling_in_env_var(self):
+        task_runner = self.__get_valid_task_runner()
+        self.assertEqual(task_runner.worker.get_max_polling_interval_in_seconds(), 5.0)
+        self.assertEqual(task_runner.worker.get_poll_jitter(), 0.1)
+
+    @unittest.mock.patch.dict(os.environ, {}, clear=True)
+    def test_run_once_with_adaptive_polling(self):
+        worker = self.__get_valid_worker()
+        worker.poll_interval = 1000
+        worker.max_poll_interval = 4000
+        task_runner = TaskRunner(
+            configuration=Configuration(),
+            worker=worker
+        )
+        with patch.object(TaskResourceApi, 'update_task', return_value=self.UPDATE_TASK_RESPONSE):
+            with patch.object(TaskResourceApi, 'poll', return_value=self.__get_valid_task()):
+                start_time = time.time()
+                task_runner.run_once()
+                # tasks keep arriving, the server is polled again right away
+                self.assertLess(time.time() - start_time, 0.5)
+            clock = [time.time()]
+
+            def sleep(seconds):
+                clock[0] += seconds
+
+            with patch.object(TaskResourceApi, 'poll', return_value=None):
+                with patch('time.time', side_effect=lambda: clock[0]):
+                    with patch('time.sleep', side_effect=sleep) as mock_sleep:
+                        task_runner.run_once()
+                        task_runner.run_once()
+                        task_runner.run_once()
+                        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list], [1, 2, 4])
+
     def test_run_once(self):
         expected_time = self.__get_valid_worker().get_polling_interval_in_seconds()
         with patch.object(
@@ -123,6 +173,69 @@ class TestTaskRunner(unittest.TestCase):
                 spent_time = finish_time - start_time
                 self.assertGreater(spent_time, expected_time)
 
+    def test_run_once_with_batch_poll(self):
+        with patch.object(
+                TaskResourceApi,
+                'batch_poll',
+                return_value=[self.__get_valid_task(), self.__get_valid_task(), self.__get_valid_task()]
+        ) as mock_batch_poll:
+            with patch.object(
+                    TaskResourceApi,
+                    'update_task',
+                    return_value=self.UPDATE_TASK_RESPONSE
+            ) as mock_update_task:
+                task_runner = self.__get_valid_task_runner_with_worker_config_and_batch_size(5)
+                task_runner.run_once()
+                mock_batch_poll.assert_called_once_with(
+                    tasktype='task', workerid=ANY, count=5, timeout=DEFAULT_POLL_TIMEOUT
+                )
+                self.assertEqual(mock_update_task.call_count, 3)
+
+    def test_run_once_with_thread_count(self):
+        with patch.object(
+                TaskResourceApi,
+                'batch_poll',
+                return_value=[self.__get_valid_task(), self.__get_valid_task(), self.__get_valid_task()]
+        ) as mock_batch_poll:
+            with patch.object(
+                    TaskResourceApi,
+                    'update_task',
+                    return_value=self.UPDATE_TASK_RESPONSE
+            ) as mock_update_task:
+                task_runner = self.__get_valid_task_runner_with_worker_config_and_thread_count(3)
+                task_runner.run_once()
+                task_runner._executor.shutdown(wait=True)
+                mock_batch_poll.assert_called_once_with(
+                    tasktype='task', workerid=ANY, count=3, timeout=DEFAULT_POLL_TIMEOUT
+                )
+                self.assertEqual(mock_update_task.call_count, 3)
+
+    @unittest.mock.patch.dict(os.environ, {}, clear=True)
+    def test_run_once_polls_only_for_free_execution_slots(self):
+        release_execution = threading.Event()
+        worker = self.__get_valid_worker()
+        task_result = worker.execute(self.__get_valid_task())
+
+        def blocking_execute(task):
+            release_execution.wait(5)
+            return task_result
+
+        with patch.object(ClassWorker, 'execute', side_effect=blocking_execute):
+            with patch.object(
+                    TaskResourceApi,
+                    'batch_poll',
+                    return_value=[self.__get_valid_task(), self.__get_valid_task()]
+            ) as mock_batch_poll:
+                with patch.object(TaskResourceApi, 'poll') as mock_poll:
+                    with patch.object(TaskResourceApi, 'update_task', return_value=self.UPDATE_TASK_RESPONSE):
+                        task_runner = self.__get_valid_task_runner_with_worker_config_and_thread_count(2)
+                        task_runner.run_once()
+                        task_runner.run_once()
+                        release_execution.set()
+                        task_runner._executor.shutdown(wait=True)
+                        mock_batch_poll.assert_called_once()
+                        mock_poll.assert_not_called()
+
     def test_run_once_roundrobin(self):
         with patch.object(
                 TaskResourceApi,
@@ -140,6 +253,34 @@ class TestTaskRunner(unittest.TestCase):
                     task_runner.run_once()
                     self.assertEqual(current_task_name, self.__shared_task_list[i])
 
+    @unittest.mock.patch.dict(os.environ, {"conductor_worker_task2_polling_interval": "5000"}, clear=True)
+    def test_run_once_polls_all_task_types(self):
+        with patch.object(TaskResourceApi, 'poll', return_value=None) as mock_poll:
+            task_runner = self.__get_valid_roundrobin_task_runner()
+            task_runner.run_once()
+            self.assertEqual([c[1]['tasktype'] for c in mock_poll.call_args_list], self.__shared_task_list)
+            mock_poll.reset_mock()
+            task_runner.run_once()
+            # task2 has a longer polling interval, and the next cycle starts polling from the next type
+            self.assertEqual(
+                [c[1]['tasktype'] for c in mock_poll.call_args_list],
+                ['task3', 'task4', 'task5', 'task6', 'task1']
+            )
+
+    @unittest.mock.patch.dict(os.environ, {}, clear=True)
+    def test_run_once_updates_tasks_of_each_type(self):
+        metrics_collector = Mock()
+        with patch.object(TaskResourceApi, 'poll', return_value=self.__get_valid_task()):
+            with patch.object(TaskResourceApi, 'update_task', return_value=self.UPDATE_TASK_RESPONSE) as mock_update:
+                task_runner = self.__get_valid_roundrobin_task_runner()
+                task_runner.metrics_collector = metrics_collector
+                task_runner.run_once()
+                self.assertEqual(mock_update.call_count, len(self.__shared_task_list))
+        self.assertEqual(
+            [c[0][0] for c in metrics_collector.record_task_execute_time.call_args_list],
+            self.__shared_task_list
+        )
+
     def test_poll_task(self):
         expected_task = self.__get_valid_task()
         with patch.object(
@@ -162,6 +303,27 @@ class TestTaskRunner(unittest.TestCase):
             task = task_runner._TaskRunner__poll_task()
             self.assertEqual(task, expected_task)
 
+    def test_batch_poll_task(self):
+        expected_tasks = [self.__get_valid_task(), self.__get_valid_task()]
+        with patch.object(
+                TaskResourceApi,
+                'batch_poll',
+                return_value=expected_tasks
+        ):
+            task_runner = self.__get_valid_task_runner_with_worker_config_and_batch_size(2)
+            tasks = task_runner._TaskRunner__batch_poll_tasks(2)
+            self.assertEqual(tasks, expected_tasks)
+
+    def test_batch_poll_task_with_faulty_task_api(self):
+        with patch.object(
+                TaskResourceApi,
+                'batch_poll',
+                side_effect=Exception()
+        ):
+            task_runner = self.__get_valid_task_runner_with_worker_config_and_batch_size(2)
+            tasks = task_runner._TaskRunner__batch_poll_tasks(2)
+            self.assertEqual(tasks, [])
+
     def test_execute_task_with_invalid_task(self):
         task_runner = self.__get_valid_task_runner()
         task_result = task_runner._TaskRunner__execute_task(None)
@@ -224,6 +386,151 @@ class TestTaskRunner(unittest.TestCase):
             response = task_runner._TaskRunner__update_task(task_result)
             self.assertEqual(response, expected_response)
 
+    def test_run_once_sends_task_results_in_background(self):
+        with patch.object(
+                TaskResourceApi,
+                'poll',
+                return_value=self.__get_valid_task()
+        ):
+            with patch.object(
+                    TaskResourceApi,
+                    'update_task',
+                    return_value=self.UPDATE_TASK_RESPONSE
+            ) as mock_update_task:
+                configuration = Configuration()
+                configuration.task_update_in_background = True
+                task_runner = TaskRunner(configuration=configuration, worker=self.__get_valid_worker())
+                task_runner.run_once()
+                self.assertTrue(task_runner._task_result_sender.flush(5))
+                mock_update_task.assert_called_once()
+                self.assertEqual(mock_update_task.call_args[1]['body'].task_id, self.TASK_ID)
+
+    def test_run_once_updates_task_in_polling_thread_when_background_update_is_disabled(self):
+        configuration = Configuration()
+        configuration.task_update_in_background = False
+        with patch.object(
+                TaskResourceApi,
+                'poll',
+                return_value=self.__get_valid_task()
+        ):
+            with patch.object(
+                    TaskResourceApi,
+                    'update_task',
+                    return_value=self.UPDATE_TASK_RESPONSE
+            ) as mock_update_task:
+                task_runner = TaskRunner(
+                    configuration=configuration,
+                    worker=self.__get_valid_worker()
+                )
+                task_runner.run_once()
+                self.assertIsNone(task_runner._task_result_sender)
+                mock_update_task.assert_called_once()
+
+    @unittest.mock.patch.dict(os.environ, {}, clear=True)
+    def test_run_returns_after_max_tasks(self):
+        configuration = Configuration()
+        configuration.process_max_tasks = 3
+        with patch.object(TaskResourceApi, 'poll', return_value=self.__get_valid_task()):
+            with patch.object(TaskResourceApi, 'update_task', return_value=self.UPDATE_TASK_RESPONSE) as mock_update:
+                task_runner = TaskRunner(
+                    configuration=configuration,
+                    worker=ClassWorker('task')
+                )
+                with patch.object(time, 'sleep'):
+                    task_runner.run()
+                self.assertEqual(3, mock_update.call_count)
+
+    @unittest.mock.patch.dict(os.environ, {}, clear=True)
+    def test_run_polls_no_more_than_max_tasks_with_thread_count(self):
+        configuration = Configuration()
+        configuration.process_max_tasks = 5
+        worker = self.__get_valid_worker()
+        worker.thread_count = 4
+
+        def batch_poll(tasktype, workerid, count, timeout):
+            return [self.__get_valid_task() for _ in range(count)]
+
+        with patch.object(TaskResourceApi, 'batch_poll', side_effect=batch_poll):
+            with patch.object(TaskResourceApi, 'poll', return_value=self.__get_valid_task()):
+                with patch.object(TaskResourceApi, 'update_task', return_value=self.UPDATE_TASK_RESPONSE) as mock_update:
+                    task_runner = TaskRunner(
+                        configuration=configuration,
+                        worker=worker
+                    )
+                    with patch.object(time, 'sleep'):
+                        task_runner.run()
+                    self.assertEqual(5, task_runner._executed_task_count)
+                    self.assertEqual(5, mock_update.call_count)
+
+    @unittest.mock.patch.dict(os.environ, {}, clear=True)
+    def test_run_returns_when_memory_exceeds_max(self):
+        configuration = Configuration()
+        configuration.process_max_memory_mb = 1
+        with patch.object(TaskResourceApi, 'poll', return_value=None) as mock_poll:
+            task_runner = TaskRunner(
+                configuration=configuration,
+                worker=ClassWorker('task')
+            )
+            task_runner.run()
+            mock_poll.assert_not_called()
+
+    @unittest.mock.patch.dict(os.environ, {}, clear=True)
+    def test_run_finishes_in_flight_task_on_sigterm(self):
+        worker = ClassWorker('task')
+        execute = worker.execute
+
+        def execute_and_receive_sigterm(task):
+            os.kill(os.getpid(), signal.SIGTERM)
+            return execute(task)
+
+        worker.execute = execute_and_receive_sigterm
+        previous_handler = signal.getsignal(signal.SIGTERM)
+        try:
+            with patch.object(TaskResourceApi, 'poll', return_value=self.__get_valid_task()) as mock_poll:
+                with patch.object(TaskResourceApi, 'update_task', return_value=self.UPDATE_TASK_RESPONSE) as mock_update:
+                    task_runner = TaskRunner(configuration=Configuration(), worker=worker)
+                    task_runner.run()
+                    self.assertTrue(task_runner.draining)
+                    mock_poll.assert_called_once()
+                    mock_update.assert_called_once()
+        finally:
+            signal.signal(signal.SIGTERM, previous_handler)
+
+    @unittest.mock.patch.dict(os.environ, {}, clear=True)
+    def test_run_stops_waiting_for_next_poll_on_sigterm(self):
+        worker = ClassWorker('task')
+        worker.poll_interval = 60000
+        previous_handler = signal.getsignal(signal.SIGTERM)
+        timer = threading.Timer(0.1, os.kill, (os.getpid(), signal.SIGTERM))
+        try:
+            with patch.object(TaskResourceApi, 'poll', return_value=None):
+                task_runner = TaskRunner(configuration=Configuration(), worker=worker)
+                start_time = time.time()
+                timer.start()
+                task_runner.run()
+                self.assertLess(time.time() - start_time, 10)
+        finally:
+            timer.cancel()
+            signal.signal(signal.SIGTERM, previous_handler)
+
+    @unittest.mock.patch.dict(os.environ, {}, clear=True)
+    def test_run_once_records_task_latencies(self):
+        task = self.__get_valid_task()
+        task.queue_wait_time = 2000
+        metrics_collector = Mock()
+        with patch.object(TaskResourceApi, 'poll', return_value=task):
+            with patch.object(TaskResourceApi, 'update_task', return_value=self.UPDATE_TASK_RESPONSE):
+                task_runner = self.__get_valid_task_runner()
+                task_runner.metrics_collector = metrics_collector
+                task_runner.run_once()
+        metrics_collector.record_task_queue_wait_time.assert_called_once_with('task', 2, None)
+        metrics_collector.record_task_poll_time.assert_called_once()
+        metrics_collector.record_task_execute_time.assert_called_once()
+        metrics_collector.record_task_update_time.assert_called_once()
+        task_type, total_time, domain = metrics_collector.record_task_total_time.call_args[0]
+        self.assertEqual('task', task_type)
+        self.assertGreaterEqual(total_time, 2)
+
     def test_wait_for_polling_interval_with_faulty_worker(self):
         expected_exception = Exception(
             "Failed to get polling interval"
@@ -265,6 +572,22 @@ class TestTaskRunner(unittest.TestCase):
             worker=self.__get_valid_worker(poll_interval=poll_interval)
         )
 
+    def __get_valid_task_runner_with_worker_config_and_batch_size(self, batch_size):
+        worker = self.__get_valid_worker()
+        worker.batch_size = batch_size
+        return TaskRunner(
+            configuration=Configuration(),
+            worker=worker
+        )
+
+    def __get_valid_task_runner_with_worker_config_and_thread_count(self, thread_count):
+        worker = self.__get_valid_worker()
+        worker.thread_count = thread_count
+        return TaskRunner(
+            configuration=Configuration(),
+            worker=worker
+        )
+
     def __get_valid_task_runner(self):
         return TaskRunner(
             configuration=Configuration(),
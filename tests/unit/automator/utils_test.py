@@ -6,7 +6,7 @@ from typing import List
 from requests.structures import CaseInsensitiveDict
 from resources.workers import UserInfo
 
-from conductor.client.automator.utils import convert_from_dict
+from conductor.client.automator.utils import compile_argument_binder, convert_from_dict
 
 
 @dataclass
@@ -69,3 +69,28 @@ class TestTaskRunner(unittest.TestCase):
                       'address': [{'street': '21 jump street', 'zip': '10101', 'country': 'USA'}]}
         value = convert_from_dict(UserDetails, dictionary)
         self.assertEqual(UserDetails, type(value), f'expected UserInfo, found {type(value)}')
+
+    def test_convert_non_dataclass_more_than_once(self):
+        dictionary = {'a': 1, 'b': [{'ba': 2}], 'd': [], 'g': {}}
+        first = convert_from_dict(Test, dictionary)
+        second = convert_from_dict(Test, dictionary)
+        self.assertEqual(first.b[0].ba, second.b[0].ba)
+        self.assertEqual(SubTest, type(second.b[0]))
+
+    def test_compile_argument_binder(self):
+        def execute(name: str, details: UserDetails, addresses: List[Address], count: int = 3, other=None):
+            pass
+
+        bind_arguments = compile_argument_binder(execute)
+        kwargs = bind_arguments({
+            'name': 'user_a',
+            'details': {'name': 'user_a', 'id': 1, 'address': []},
+            'addresses': [{'street': '21 jump street', 'zip': '10101', 'country': 'USA'}],
+            'unknown': True
+        })
+        self.assertEqual(['name', 'details', 'addresses', 'count', 'other'], list(kwargs.keys()))
+        self.assertEqual('user_a', kwargs['name'])
+        self.assertEqual(UserDetails, type(kwargs['details']))
+        self.assertEqual(Address, type(kwargs['addresses'][0]))
+        self.assertEqual(3, kwargs['count'])
+        self.assertIsNone(kwargs['other'])
@@ -4,6 +4,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.helpers.cache import TtlCache
 from conductor.client.http.api.metadata_resource_api import MetadataResourceApi
 from conductor.client.http.models.tag_string import TagString
 from conductor.client.http.models.task_def import TaskDef
@@ -98,6 +99,86 @@ class TestOrkesMetadataClient(unittest.TestCase):
         wfs = self.metadata_client.get_all_workflow_defs()
         self.assertEqual(len(wfs), 2)
 
+    @patch.object(MetadataResourceApi, 'update1')
+    @patch.object(MetadataResourceApi, 'get')
+    def test_getWorkflowDef_cached_by_version(self, mock, mock_update):
+        mock.side_effect = lambda name, version=2: WorkflowDef(name=name, version=version)
+        metrics_collector = MagicMock()
+        metadata_client = OrkesMetadataClient(
+            self.metadata_client.api_client.configuration, self.metadata_client.api_client,
+            cache_ttl_seconds=60, metrics_collector=metrics_collector
+        )
+        self.assertEqual(2, metadata_client.get_workflow_def(WORKFLOW_NAME).version)
+        self.assertEqual(2, metadata_client.get_workflow_def(WORKFLOW_NAME).version)
+        self.assertEqual(1, metadata_client.get_workflow_def(WORKFLOW_NAME, 1).version)
+        self.assertEqual(2, mock.call_count)
+        metrics_collector.increment_metadata_cache_hit.assert_called_once_with('workflow_def')
+        self.assertEqual(2, metrics_collector.increment_metadata_cache_miss.call_count)
+        metadata_client.update_workflow_def(self.workflowDef)
+        metadata_client.get_workflow_def(WORKFLOW_NAME)
+        metadata_client.get_workflow_def(WORKFLOW_NAME, 1)
+        self.assertEqual(4, mock.call_count)
+
+    @patch.object(MetadataResourceApi, 'unregister_task_def')
+    @patch.object(MetadataResourceApi, 'get_task_defs')
+    @patch.object(MetadataResourceApi, 'get_task_def')
+    def test_getTaskDef_cached(self, mock, mock_get_all, mock_unregister):
+        mock.return_value = self.taskDef
+        mock_get_all.return_value = [self.taskDef]
+        metadata_client = OrkesMetadataClient(
+            self.metadata_client.api_client.configuration, self.metadata_client.api_client, cache_ttl_seconds=60
+        )
+        for _ in range(3):
+            self.assertEqual(self.taskDef, metadata_client.get_task_def(TASK_NAME))
+            self.assertEqual([self.taskDef], metadata_client.get_all_task_defs())
+        self.assertEqual(1, mock.call_count)
+        self.assertEqual(1, mock_get_all.call_count)
+        metadata_client.unregister_task_def(TASK_NAME)
+        metadata_client.get_task_def(TASK_NAME)
+        metadata_client.get_all_task_defs()
+        self.assertEqual(2, mock.call_count)
+        self.assertEqual(2, mock_get_all.call_count)
+
+    @patch.object(MetadataResourceApi, 'get')
+    def test_cached_workflow_defs_are_copies(self, mock):
+        mock.return_value = WorkflowDef(name=WORKFLOW_NAME, version=1, description='cached')
+        metadata_client = OrkesMetadataClient(
+            self.metadata_client.api_client.configuration, self.metadata_client.api_client, cache_ttl_seconds=60
+        )
+        workflow_def = metadata_client.get_workflow_def(WORKFLOW_NAME)
+        workflow_def.description = 'modified'
+        self.assertEqual('cached', metadata_client.get_workflow_def(WORKFLOW_NAME).description)
+        self.assertEqual(1, mock.call_count)
+
+    @patch('conductor.client.helpers.cache.time.monotonic')
+    def test_cache_expires_and_evicts_least_recently_used(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        cache = TtlCache(ttl_seconds=10, max_size=2)
+        load = MagicMock(side_effect=lambda: load.call_count)
+        self.assertEqual(1, cache.get_or_load('a', load))
+        self.assertEqual(2, cache.get_or_load('b', load))
+        self.assertEqual(1, cache.get_or_load('a', load))
+        # evicts b, the least recently used
+        self.assertEqual(3, cache.get_or_load('c', load))
+        self.assertEqual(4, cache.get_or_load('b', load))
+        mock_monotonic.return_value = 10
+        self.assertEqual(5, cache.get_or_load('b', load))
+        self.assertEqual((1, 5), (cache.hits, cache.misses))
+
+    @patch('conductor.client.helpers.cache.time.monotonic')
+    def test_cache_refreshes_ahead(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        cache = TtlCache(ttl_seconds=10, refresh_ahead=True)
+        load = MagicMock(side_effect=lambda: load.call_count)
+        self.assertEqual(1, cache.get_or_load('a', load))
+        mock_monotonic.return_value = 9
+        # the cached value is returned while it is reloaded in the background
+        self.assertEqual(1, cache.get_or_load('a', load))
+        cache._refresh_executor.shutdown(wait=True)
+        mock_monotonic.return_value = 12
+        self.assertEqual(2, cache.get_or_load('a', load))
+        self.assertEqual(2, load.call_count)
+
     @patch.object(MetadataResourceApi, 'register_task_def')
     def test_registerTaskDef(self, mock):
         self.metadata_client.register_task_def(self.taskDef)
@@ -0,0 +1,80 @@
+import logging
+import threading
+import unittest
+from unittest.mock import patch
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api.metadata_resource_api import MetadataResourceApi
+from conductor.client.http.api.task_resource_api import TaskResourceApi
+from conductor.client.http.api.workflow_resource_api import WorkflowResourceApi
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models.task_def import TaskDef
+from conductor.client.orkes.orkes_workflow_client import OrkesWorkflowClient
+from conductor.client.orkes_clients import OrkesClients
+
+
+class TestOrkesClients(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_clients_share_one_api_client(self):
+        orkes_clients = OrkesClients(Configuration("http://localhost:8080/api"))
+        clients = [
+            orkes_clients.get_workflow_client(),
+            orkes_clients.get_workflow_bulk_client(),
+            orkes_clients.get_authorization_client(),
+            orkes_clients.get_metadata_client(),
+            orkes_clients.get_scheduler_client(),
+            orkes_clients.get_secret_client(),
+            orkes_clients.get_task_client(),
+            orkes_clients.get_integration_client(),
+            orkes_clients.get_prompt_client(),
+            orkes_clients.get_schema_client(),
+        ]
+        for client in clients:
+            self.assertIs(client.api_client, orkes_clients.api_client)
+        workflow_executor = orkes_clients.get_workflow_executor()
+        self.assertIs(workflow_executor.workflow_client.api_client, orkes_clients.api_client)
+        self.assertIs(workflow_executor.task_client.api_client, orkes_clients.api_client)
+
+    def test_api_client_is_created_once_by_concurrent_callers(self):
+        orkes_clients = OrkesClients(Configuration("http://localhost:8080/api"))
+        api_clients = []
+        with patch.object(ApiClient, '__init__', return_value=None) as mock_init:
+            threads = [
+                threading.Thread(target=lambda: api_clients.append(orkes_clients.api_client))
+                for _ in range(10)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        mock_init.assert_called_once()
+        self.assertEqual(len(set(id(api_client) for api_client in api_clients)), 1)
+
+    @patch.object(MetadataResourceApi, 'unregister_task_def')
+    @patch.object(MetadataResourceApi, 'get_task_def')
+    def test_metadata_clients_share_one_cache(self, mock_get_task_def, mock_unregister):
+        mock_get_task_def.return_value = TaskDef('task')
+        orkes_clients = OrkesClients(Configuration("http://localhost:8080/api"))
+        orkes_clients.get_metadata_client(cache_ttl_seconds=60).get_task_def('task')
+        orkes_clients.get_metadata_client(cache_ttl_seconds=60).get_task_def('task')
+        self.assertEqual(1, mock_get_task_def.call_count)
+        orkes_clients.get_metadata_client(cache_ttl_seconds=60).unregister_task_def('task')
+        orkes_clients.get_metadata_client(cache_ttl_seconds=60).get_task_def('task')
+        self.assertEqual(2, mock_get_task_def.call_count)
+        self.assertIsNone(orkes_clients.get_metadata_client().cache)
+
+    def test_resource_apis_are_created_lazily(self):
+        workflow_client = OrkesWorkflowClient(Configuration("http://localhost:8080/api"))
+        self.assertNotIn('workflowResourceApi', workflow_client.__dict__)
+        workflow_resource_api = workflow_client.workflowResourceApi
+        self.assertIsInstance(workflow_resource_api, WorkflowResourceApi)
+        self.assertIs(workflow_resource_api.api_client, workflow_client.api_client)
+        self.assertIs(workflow_client.workflowResourceApi, workflow_resource_api)
+        self.assertNotIn('taskResourceApi', workflow_client.__dict__)
+        self.assertIsInstance(workflow_client.taskResourceApi, TaskResourceApi)
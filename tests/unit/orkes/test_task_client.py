@@ -5,10 +5,12 @@ from unittest.mock import patch, MagicMock
 
 from conductor.client.configuration.configuration import Configuration
 from conductor.client.http.api.task_resource_api import TaskResourceApi
+from conductor.client.http.models.search_result_task_summary import SearchResultTaskSummary
 from conductor.client.http.models.task import Task
 from conductor.client.http.models.task_exec_log import TaskExecLog
 from conductor.client.http.models.task_result import TaskResult
 from conductor.client.http.models.task_result_status import TaskResultStatus
+from conductor.client.http.models.task_summary import TaskSummary
 from conductor.client.http.models.workflow import Workflow
 from conductor.client.http.rest import ApiException
 from conductor.client.orkes.orkes_task_client import OrkesTaskClient
@@ -174,3 +176,18 @@ class TestOrkesTaskClient(unittest.TestCase):
         logs = self.task_client.get_task_logs(TASK_ID)
         mock.assert_called_with(TASK_ID)
         self.assertEqual(len(logs), 2)
+
+    @patch.object(TaskResourceApi, 'search1')
+    def test_iterSearch(self, mock):
+        summaries = [TaskSummary(task_id=f'task_id_{i}') for i in range(5)]
+        mock.side_effect = lambda start, size, **kwargs: SearchResultTaskSummary(
+            total_hits=len(summaries), results=summaries[start:start + size]
+        )
+        for prefetch in [True, False]:
+            mock.reset_mock()
+            task_ids = [summary.task_id for summary in self.task_client.iter_search(
+                size=2, query='status=FAILED', prefetch=prefetch
+            )]
+            self.assertEqual([f'task_id_{i}' for i in range(5)], task_ids)
+            self.assertEqual(3, mock.call_count)
+            mock.assert_called_with(start=4, size=2, free_text='*', query='status=FAILED')
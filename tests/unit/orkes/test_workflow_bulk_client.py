@@ -0,0 +1,70 @@
+import logging
+import unittest
+from unittest.mock import patch
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api.workflow_bulk_resource_api import WorkflowBulkResourceApi
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models import BulkResponse, WorkflowSummary
+from conductor.client.http.rest import ApiException
+from conductor.client.orkes.orkes_workflow_bulk_client import OrkesWorkflowBulkClient
+
+
+def call_api(resource_path, method, path_params, query_params, header_params, body=None, **kwargs):
+    return terminate(body)
+
+
+def terminate(body, **kwargs):
+    if 'failing' in body:
+        raise ApiException(status=500, reason='server error')
+    return BulkResponse(
+        bulk_successful_results=[workflow_id for workflow_id in body if workflow_id != 'completed'],
+        bulk_error_results={'completed': 'already completed'} if 'completed' in body else {}
+    )
+
+
+class TestOrkesWorkflowBulkClient(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.progress = []
+        self.bulk_client = OrkesWorkflowBulkClient(
+            Configuration("http://localhost:8080/api"),
+            chunk_size=3,
+            concurrency=2,
+            on_progress=lambda completed, total: self.progress.append((completed, total))
+        )
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    @patch.object(ApiClient, 'call_api', side_effect=call_api)
+    def test_terminate_workflows_in_chunks(self, mock):
+        workflow_ids = [f'workflow_{i}' for i in range(7)]
+        response = self.bulk_client.terminate_workflows(workflow_ids, reason='incident')
+        self.assertEqual(workflow_ids, sorted(response.bulk_successful_results))
+        self.assertEqual({}, response.bulk_error_results)
+        self.assertEqual(3, mock.call_count)
+        self.assertEqual(
+            sorted([workflow_ids[0:3], workflow_ids[3:6], workflow_ids[6:]]),
+            sorted(c[1]['body'] for c in mock.call_args_list)
+        )
+        for c in mock.call_args_list:
+            self.assertEqual(('/workflow/bulk/terminate', 'POST'), c[0][:2])
+            self.assertEqual([('reason', 'incident'), ('triggerFailureWorkflow', False)], c[0][3])
+        self.assertEqual([(1, 3), (2, 3), (3, 3)], self.progress)
+
+    @patch.object(WorkflowBulkResourceApi, 'terminate', side_effect=terminate)
+    def test_failures_are_merged(self, mock):
+        workflow_ids = ['workflow_0', 'completed', 'workflow_1', 'failing', 'workflow_2']
+        response = self.bulk_client.terminate_workflows(workflow_ids)
+        self.assertEqual(['workflow_0', 'workflow_1'], sorted(response.bulk_successful_results))
+        self.assertEqual(['completed', 'failing', 'workflow_2'], sorted(response.bulk_error_results))
+        self.assertEqual('already completed', response.bulk_error_results['completed'])
+
+    @patch.object(WorkflowBulkResourceApi, 'pause_workflow', return_value=BulkResponse())
+    def test_pause_workflows_from_search_results(self, mock):
+        summaries = (WorkflowSummary(workflow_id=f'workflow_{i}') for i in range(2))
+        self.bulk_client.pause_workflows(summaries)
+        mock.assert_called_once_with(['workflow_0', 'workflow_1'])
+
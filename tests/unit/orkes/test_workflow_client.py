@@ -1,16 +1,23 @@
+import asyncio
 import json
 import logging
+import time
 import unittest
 from unittest.mock import patch, MagicMock
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.helpers.concurrency import PartialFailureError, RateLimiter
 from conductor.client.http.api.workflow_resource_api import WorkflowResourceApi
 from conductor.client.http.models import SkipTaskRequest
 from conductor.client.http.models.rerun_workflow_request import RerunWorkflowRequest
+from conductor.client.http.models.scrollable_search_result_workflow_summary import \
+    ScrollableSearchResultWorkflowSummary
 from conductor.client.http.models.start_workflow_request import StartWorkflowRequest
 from conductor.client.http.models.workflow import Workflow
 from conductor.client.http.models.workflow_def import WorkflowDef
 from conductor.client.http.models.workflow_run import WorkflowRun
+from conductor.client.http.models.workflow_status import WorkflowStatus
+from conductor.client.http.models.workflow_summary import WorkflowSummary
 from conductor.client.http.models.workflow_test_request import WorkflowTestRequest
 from conductor.client.http.rest import ApiException
 from conductor.client.orkes.orkes_workflow_client import OrkesWorkflowClient
@@ -185,3 +192,168 @@ class TestOrkesWorkflowClient(unittest.TestCase):
         workflow = self.workflow_client.test_workflow(testRequest)
         mock.assert_called_with(testRequest)
         self.assertEqual(workflow.workflow_id, WORKFLOW_UUID)
+
+    @patch.object(WorkflowResourceApi, 'start_workflow')
+    def test_startWorkflows(self, mock):
+        mock.side_effect = self.__start_workflow
+        requests = [StartWorkflowRequest(name=WORKFLOW_NAME, correlation_id=str(i)) for i in range(20)]
+        progress = []
+        workflow_ids = self.workflow_client.start_workflows(
+            requests, concurrency=5, on_progress=lambda completed, total: progress.append((completed, total))
+        )
+        self.assertEqual([f'{WORKFLOW_UUID}_{i}' for i in range(20)], workflow_ids)
+        self.assertEqual([(i, 20) for i in range(1, 21)], progress)
+
+    @patch.object(WorkflowResourceApi, 'start_workflow')
+    def test_startWorkflows_with_failures(self, mock):
+        mock.side_effect = self.__start_workflow
+        requests = [StartWorkflowRequest(name=WORKFLOW_NAME, correlation_id=str(i)) for i in range(3)]
+        requests[1].correlation_id = 'failing'
+        results = self.workflow_client.start_workflows(requests, return_exceptions=True)
+        self.assertEqual(f'{WORKFLOW_UUID}_0', results[0])
+        self.assertIsInstance(results[1], ApiException)
+        self.assertEqual(f'{WORKFLOW_UUID}_2', results[2])
+        with self.assertRaises(PartialFailureError) as context:
+            self.workflow_client.start_workflows(requests)
+        self.assertEqual(f'{WORKFLOW_UUID}_0', context.exception.results[0])
+        self.assertIsInstance(context.exception.results[1], ApiException)
+        self.assertEqual(f'{WORKFLOW_UUID}_2', context.exception.results[2])
+
+    @patch.object(WorkflowResourceApi, 'start_workflow')
+    def test_startWorkflowsAsync(self, mock):
+        mock.side_effect = self.__start_workflow
+        requests = [StartWorkflowRequest(name=WORKFLOW_NAME, correlation_id=str(i)) for i in range(10)]
+        workflow_ids = asyncio.run(self.workflow_client.start_workflows_async(requests, concurrency=3))
+        self.assertEqual([f'{WORKFLOW_UUID}_{i}' for i in range(10)], workflow_ids)
+
+    @patch.object(WorkflowResourceApi, 'start_workflow')
+    def test_startWorkflowsAsync_cancelled(self, mock):
+        mock.side_effect = self.__start_workflow
+        requests = [StartWorkflowRequest(name=WORKFLOW_NAME, correlation_id=str(i)) for i in range(100)]
+
+        async def start_and_cancel():
+            task = asyncio.ensure_future(self.workflow_client.start_workflows_async(requests, concurrency=2))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(start_and_cancel())
+        started_count = mock.call_count
+        time.sleep(0.1)
+        self.assertLess(started_count, 100)
+        self.assertLessEqual(mock.call_count, started_count + 2)
+
+    def test_rateLimiter(self):
+        rate_limiter = RateLimiter(50)
+        start_time = time.monotonic()
+        for _ in range(6):
+            rate_limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start_time, 0.1)
+
+    @patch.object(WorkflowResourceApi, 'search')
+    def test_iterSearch(self, mock):
+        summaries = [WorkflowSummary(workflow_id=f'{WORKFLOW_UUID}_{i}') for i in range(4)]
+        mock.side_effect = lambda start, size, **kwargs: ScrollableSearchResultWorkflowSummary(
+            results=summaries[start:start + size], query_id='query_id'
+        )
+        iterator = self.workflow_client.iter_search(size=2, query='status=COMPLETED')
+        self.assertEqual(f'{WORKFLOW_UUID}_0', next(iterator).workflow_id)
+        workflow_ids = [summary.workflow_id for summary in iterator]
+        self.assertEqual([f'{WORKFLOW_UUID}_{i}' for i in range(1, 4)], workflow_ids)
+        self.assertEqual(3, mock.call_count)
+        mock.assert_called_with(start=4, size=2, free_text='*', query='status=COMPLETED', query_id='query_id')
+
+    @patch('conductor.client.orkes.orkes_workflow_client.time.sleep')
+    @patch.object(WorkflowResourceApi, 'search')
+    def test_asCompleted(self, mock, mock_sleep):
+        workflow_ids = [f'{WORKFLOW_UUID}_{i}' for i in range(5)]
+        # the first two workflows complete on the first poll, the last three on the fourth one
+        completed_by_poll = [workflow_ids[:2], [], [], workflow_ids]
+        mock.side_effect = lambda **kwargs: self.__search_completed(kwargs['query'], completed_by_poll.pop(0))
+        summaries = list(self.workflow_client.as_completed(workflow_ids, poll_interval_seconds=1, batch_size=10))
+        self.assertEqual(workflow_ids, [summary.workflow_id for summary in summaries])
+        self.assertEqual(4, mock.call_count)
+        self.assertEqual(f'workflowId IN ({",".join(workflow_ids[2:])})', mock.call_args[1]['query'])
+        self.assertEqual([1, 2, 4], [call[0][0] for call in mock_sleep.call_args_list])
+
+    @patch.object(WorkflowResourceApi, 'search')
+    def test_asCompleted_backs_off_from_poll_interval(self, mock):
+        mock.side_effect = lambda **kwargs: self.__search_completed(kwargs['query'], [])
+        clock = [0]
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        with patch('conductor.client.orkes.orkes_workflow_client.time.monotonic', side_effect=lambda: clock[0]):
+            with patch('conductor.client.orkes.orkes_workflow_client.time.sleep', side_effect=sleep) as mock_sleep:
+                with self.assertRaises(TimeoutError):
+                    list(self.workflow_client.as_completed(
+                        [WORKFLOW_UUID], timeout_seconds=10, poll_interval_seconds=1, max_poll_interval_seconds=30
+                    ))
+        # the last wait is cut short by the timeout
+        self.assertEqual([1, 2, 4, 3], [call[0][0] for call in mock_sleep.call_args_list])
+
+    @patch('conductor.client.orkes.orkes_workflow_client.time.sleep')
+    @patch.object(WorkflowResourceApi, 'search')
+    def test_waitForAll_polls_in_batches(self, mock, mock_sleep):
+        workflow_ids = [f'{WORKFLOW_UUID}_{i}' for i in range(250)]
+        mock.side_effect = lambda **kwargs: self.__search_completed(kwargs['query'], workflow_ids)
+        summaries = self.workflow_client.wait_for_all(reversed(workflow_ids), batch_size=100)
+        self.assertEqual(list(reversed(workflow_ids)), list(summaries))
+        self.assertEqual(3, mock.call_count)
+        mock_sleep.assert_not_called()
+
+    @patch('conductor.client.orkes.orkes_workflow_client.time.sleep')
+    @patch.object(WorkflowResourceApi, 'search')
+    def test_asCompleted_retries_failed_searches(self, mock, mock_sleep):
+        responses = [ApiException(status=503), self.__search_completed(f'({WORKFLOW_UUID})', [WORKFLOW_UUID])]
+        mock.side_effect = lambda **kwargs: self.__respond(responses.pop(0))
+        summaries = list(self.workflow_client.as_completed([WORKFLOW_UUID]))
+        self.assertEqual([WORKFLOW_UUID], [summary.workflow_id for summary in summaries])
+        self.assertEqual(2, mock.call_count)
+
+    @patch('conductor.client.orkes.orkes_workflow_client.time.sleep')
+    @patch.object(WorkflowResourceApi, 'get_workflow_status_summary')
+    @patch.object(WorkflowResourceApi, 'search')
+    def test_asCompleted_looks_up_workflows_not_found(self, mock, mock_get_status, mock_sleep):
+        mock.return_value = ScrollableSearchResultWorkflowSummary(results=[])
+        mock_get_status.side_effect = lambda workflow_id: self.__respond(
+            WorkflowStatus(workflow_id=workflow_id, status='COMPLETED') if workflow_id == WORKFLOW_UUID
+            else ApiException(status=404)
+        )
+        summaries = list(self.workflow_client.as_completed([WORKFLOW_UUID]))
+        self.assertEqual([WORKFLOW_UUID], [summary.workflow_id for summary in summaries])
+        self.assertEqual('COMPLETED', summaries[0].status)
+        # looked up once not found by two searches
+        self.assertEqual(2, mock.call_count)
+        mock_get_status.assert_called_once_with(WORKFLOW_UUID)
+        with self.assertRaisesRegex(ValueError, 'unknown_workflow_id'):
+            self.workflow_client.wait_for_all(['unknown_workflow_id'])
+
+    @patch('conductor.client.orkes.orkes_workflow_client.time.sleep')
+    @patch.object(WorkflowResourceApi, 'search')
+    def test_waitForAll_timeout(self, mock, mock_sleep):
+        mock.return_value = ScrollableSearchResultWorkflowSummary(results=[])
+        with self.assertRaises(TimeoutError):
+            self.workflow_client.wait_for_all([WORKFLOW_UUID], timeout_seconds=0)
+
+    def __respond(self, response):
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def __search_completed(self, query, completed_workflow_ids):
+        searched_workflow_ids = query[query.index('(') + 1:query.index(')')].split(',')
+        return ScrollableSearchResultWorkflowSummary(results=[
+            WorkflowSummary(
+                workflow_id=workflow_id, status='COMPLETED' if workflow_id in completed_workflow_ids else 'RUNNING'
+            )
+            for workflow_id in searched_workflow_ids
+        ])
+
+    def __start_workflow(self, request):
+        if request.correlation_id == 'failing':
+            raise ApiException(status=500)
+        time.sleep(0.01)
+        return f'{WORKFLOW_UUID}_{request.correlation_id}'
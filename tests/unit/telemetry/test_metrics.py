@@ -1,7 +1,14 @@
 import logging
+import os
+import tempfile
+import threading
 import unittest
+from unittest.mock import patch
 
 from conductor.client.configuration.settings.metrics_settings import MetricsSettings
+from conductor.client.http.models.task import Task
+from conductor.client.telemetry.metrics_collector import MetricsCollector, get_metrics_write_interval, \
+    get_task_queue_wait_time
 
 
 class TestMetricsCollection(unittest.TestCase):
@@ -33,3 +40,57 @@ class TestMetricsCollection(unittest.TestCase):
             metrics_settings.update_interval,
             expected_update_interval
         )
+
+    def test_metrics_without_labels(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with patch.dict(os.environ, {}):
+                metrics_collector = MetricsCollector(MetricsSettings(directory=directory))
+                metrics_collector.record_task_update_queue_depth(3)
+                metrics_collector.record_http_connections_in_use(2)
+                metrics_collector.increment_http_pool_exhausted()
+                self.assertEqual(3, metrics_collector.registry.get_sample_value('task_update_queue_depth'))
+                self.assertEqual(2, metrics_collector.registry.get_sample_value('http_connections_in_use'))
+                self.assertEqual(1, metrics_collector.registry.get_sample_value('http_pool_exhausted_total'))
+
+    def test_latency_histograms(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with patch.dict(os.environ, {}):
+                metrics_collector = MetricsCollector(MetricsSettings(directory=directory))
+                metrics_collector.record_task_execute_time('histogram_task', 0.02, 'domain')
+                metrics_collector.record_task_execute_time('histogram_task', 3, 'domain')
+                metrics_collector.record_task_total_time('histogram_task', 4)
+                labels = {'taskType': 'histogram_task', 'domain': 'domain'}
+                registry = metrics_collector.registry
+                self.assertEqual(2, registry.get_sample_value('task_execute_time_seconds_count', labels))
+                self.assertEqual(3.02, registry.get_sample_value('task_execute_time_seconds_sum', labels))
+                self.assertEqual(
+                    1, registry.get_sample_value('task_execute_time_seconds_bucket', dict(labels, le='0.025'))
+                )
+                self.assertEqual(3, registry.get_sample_value('task_execute_time', {'taskType': 'histogram_task'}))
+                self.assertEqual(
+                    1,
+                    registry.get_sample_value(
+                        'task_total_time_seconds_count', {'taskType': 'histogram_task', 'domain': ''}
+                    )
+                )
+
+    def test_task_queue_wait_time(self):
+        self.assertEqual(1.5, get_task_queue_wait_time(Task(queue_wait_time=1500)))
+        self.assertEqual(0.25, get_task_queue_wait_time(Task(scheduled_time=1000, start_time=1250)))
+        self.assertIsNone(get_task_queue_wait_time(Task()))
+
+    def test_metrics_write_interval_grows_with_write_time(self):
+        self.assertEqual(0.1, get_metrics_write_interval(0.1, 0.001))
+        self.assertAlmostEqual(1.8, get_metrics_write_interval(0.1, 0.2))
+
+    def test_provide_metrics_over_http(self):
+        with tempfile.TemporaryDirectory() as directory:
+            metrics_settings = MetricsSettings(directory=directory, http_port=9191, http_address='127.0.0.1')
+            with patch('conductor.client.telemetry.metrics_collector.start_http_server') as mock_start_http_server:
+                with patch('conductor.client.telemetry.metrics_collector.write_to_textfile') as mock_write:
+                    with patch.object(threading.Event, 'wait', return_value=True):
+                        MetricsCollector.provide_metrics(metrics_settings)
+            mock_start_http_server.assert_called_once()
+            self.assertEqual(9191, mock_start_http_server.call_args[0][0])
+            self.assertEqual('127.0.0.1', mock_start_http_server.call_args[1]['addr'])
+            mock_write.assert_not_called()
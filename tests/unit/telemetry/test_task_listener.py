@@ -0,0 +1,107 @@
+import logging
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from conductor.client.automator.task_runner import TaskRunner
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models.task import Task
+from conductor.client.http.models.task_result import TaskResult
+from conductor.client.telemetry.model.task_phase import TaskPhase
+from conductor.client.telemetry.task_listener import TaskListener
+from conductor.client.telemetry.task_profiler import TaskProfiler
+from conductor.client.worker.worker import Worker
+
+
+def greet(name: str) -> str:
+    return f'Hello {name}'
+
+
+class RecordingTaskListener(TaskListener):
+    def __init__(self):
+        self.phases = []
+        self.executions = []
+        self.lock = threading.Lock()
+
+    def on_task_phase(self, task_type, task_id, phase, duration):
+        with self.lock:
+            self.phases.append((task_type, task_id, phase))
+
+    def on_task_execution_finished(self, task_type, task, task_result, duration):
+        self.executions.append((task_type, task.task_id, task_result.status))
+
+
+class FailingTaskListener(TaskListener):
+    def on_task_phase(self, task_type, task_id, phase, duration):
+        raise Exception('failing listener')
+
+
+class TestTaskListener(unittest.TestCase):
+    TASK_ID = 'VALID_TASK_ID'
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_task_runner_reports_phases(self):
+        for task_update_in_background in [False, True]:
+            listener = RecordingTaskListener()
+            task_runner = self.__get_task_runner([listener, FailingTaskListener()], task_update_in_background)
+            with patch.object(ApiClient, 'request', side_effect=self.__request):
+                task_runner.run_once()
+                if task_runner._task_result_sender is not None:
+                    task_runner._task_result_sender.flush()
+            self.assertEqual(
+                [
+                    ('task', None, TaskPhase.DESERIALIZE),
+                    ('task', None, TaskPhase.POLL),
+                    ('task', self.TASK_ID, TaskPhase.BIND_ARGUMENTS),
+                    ('task', self.TASK_ID, TaskPhase.EXECUTE),
+                    ('task', self.TASK_ID, TaskPhase.SERIALIZE),
+                    ('task', self.TASK_ID, TaskPhase.DESERIALIZE),
+                    ('task', self.TASK_ID, TaskPhase.UPDATE),
+                ],
+                listener.phases
+            )
+            self.assertEqual([('task', self.TASK_ID, 'COMPLETED')], listener.executions)
+
+    def test_profiler_writes_profiles_of_slow_tasks(self):
+        with tempfile.TemporaryDirectory() as directory:
+            profiler = TaskProfiler(directory, sample_every=2, min_duration=0)
+            for task_id in ['1', '2', '3']:
+                task = Task(task_id=task_id)
+                profiler.on_task_execution_started('task', task)
+                greet('conductor')
+                profiler.on_task_execution_finished('task', task, TaskResult(task_id=task_id), 0.5)
+            self.assertEqual(['task-1.prof', 'task-3.prof'], sorted(os.listdir(directory)))
+
+    def test_profiler_skips_fast_tasks(self):
+        with tempfile.TemporaryDirectory() as directory:
+            profiler = TaskProfiler(directory, sample_every=1, min_duration=1)
+            task = Task(task_id='1')
+            profiler.on_task_execution_started('task', task)
+            profiler.on_task_execution_finished('task', task, TaskResult(task_id='1'), 0.5)
+            self.assertEqual([], os.listdir(directory))
+
+    def __get_task_runner(self, listeners, task_update_in_background: bool) -> TaskRunner:
+        configuration = Configuration()
+        configuration.task_update_in_background = task_update_in_background
+        return TaskRunner(
+            worker=Worker(task_definition_name='task', execute_function=greet, poll_interval=0.01),
+            configuration=configuration,
+            listeners=listeners
+        )
+
+    def __request(self, method, url, **kwargs):
+        response = Mock()
+        if method == 'GET':
+            response.resp.content = f'{{"taskId": "{self.TASK_ID}", "inputData": {{"name": "conductor"}}}}'.encode()
+        else:
+            response.resp.content = b'"OK"'
+        return response